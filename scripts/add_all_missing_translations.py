@@ -2,86 +2,44 @@
 """
 모든 언어의 누락된 번역을 추가하는 스크립트
 한국어, 중국어, 베트남어, 스페인어, 포르투갈어 번역을 추가합니다.
+기존 번역으로 만든 토큰 용어집으로 확실하게 조합되는 이름은 먼저 채우고, 나머지만 번역을 요청합니다.
+기본적으로 여러 성인의 누락된 언어를 한 번에 요청하며, --no-batch를 주면 필드마다 따로 요청합니다.
 """
 
-import json
-import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import requests
-import time
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
 
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                break
-    
-    return api_key
+from saints import (
+    BATCH_SIZE,
+    LANGUAGE_INFO,
+    BatchItem,
+    ChatError,
+    NameIndex,
+    SaintsStore,
+    TranslationBackend,
+    UpdateJournal,
+    create_backend,
+    group_by_name,
+    translate_batches,
+)
+from saints.glossary import TokenGlossary
+from saints.memory import TranslationMemory
+
+# 원본 백업 파일 접미사
+BACKUP_SUFFIX = '.json.backup_all_translations'
 
-def translate_saint_name(
-    api_key: str,
+# 번역 메모리의 프롬프트 버전 (프롬프트를 바꾸면 올림)
+PROMPT_VERSION = 'all-translations-v1'
+
+def build_messages(
     japanese_name: str,
     english_name: Optional[str],
-    target_language: str,
-    cache: Dict[str, str] = None
-) -> Optional[str]:
-    """ChatGPT를 사용하여 성인 이름을 번역합니다."""
-    if cache is None:
-        cache = {}
-    
-    # 캐시 확인
-    cache_key = f"{japanese_name}_{english_name}_{target_language}"
-    if cache_key in cache:
-        return cache[cache_key]
-    
-    url = 'https://api.openai.com/v1/chat/completions'
-    
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
-    language_info = {
-        'ko': {
-            'name': '한국어',
-            'prefix': '성',
-            'example': '성 요한, 성 마리아'
-        },
-        'zh': {
-            'name': '중국어(简体中文)',
-            'prefix': '聖',
-            'example': '聖若望, 聖瑪利亞'
-        },
-        'vi': {
-            'name': 'Tiếng Việt',
-            'prefix': 'Thánh',
-            'example': 'Thánh Gioan, Thánh Maria'
-        },
-        'es': {
-            'name': 'Español',
-            'prefix': 'San/Santa',
-            'example': 'San Juan, Santa María'
-        },
-        'pt': {
-            'name': 'Português',
-            'prefix': 'São/Santa',
-            'example': 'São João, Santa Maria'
-        },
-    }
-    
-    lang_info = language_info.get(target_language, {})
+    target_language: str
+) -> List[Dict[str, str]]:
+    """성인 이름 번역 요청 메시지를 만듭니다."""
+    lang_info = LANGUAGE_INFO.get(target_language, {})
     lang_name = lang_info.get('name', target_language)
     prefix = lang_info.get('prefix', '')
     example = lang_info.get('example', '')
@@ -97,50 +55,125 @@ def translate_saint_name(
 - {prefix} 접두사를 포함하여 반환 (예: {example})
 - 설명이나 추가 텍스트 없이 이름만 반환'''
     
-    data = {
-        'model': 'gpt-4o-mini',
-        'messages': [
-            {
-                'role': 'system',
-                'content': f'당신은 가톨릭 성인 이름 번역 전문가입니다. {lang_name} 가톨릭 전례에서 사용하는 표준 이름을 사용하여 정확하게 번역합니다.'
-            },
-            {'role': 'user', 'content': prompt}
-        ],
-        'temperature': 0.3,
-        'max_tokens': 100
-    }
-    
+    return [
+        {
+            'role': 'system',
+            'content': f'당신은 가톨릭 성인 이름 번역 전문가입니다. {lang_name} 가톨릭 전례에서 사용하는 표준 이름을 사용하여 정확하게 번역합니다.'
+        },
+        {'role': 'user', 'content': prompt}
+    ]
+
+async def translate_saint_name(
+    backend: TranslationBackend,
+    japanese_name: str,
+    english_name: Optional[str],
+    target_language: str
+) -> Optional[str]:
+    """ChatGPT를 사용하여 성인 이름을 번역합니다."""
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        content = result['choices'][0]['message']['content'].strip()
-        
-        # 불필요한 텍스트 제거
-        content = content.replace('"', '').replace("'", '').strip()
-        
-        if content:
-            cache[cache_key] = content
-            return content
-    except Exception as e:
-        print(f"  ⚠️  번역 실패 ({target_language}): {e}")
+        content = await backend.complete(
+            build_messages(japanese_name, english_name, target_language),
+            items=((japanese_name, english_name, (target_language,)),)
+        )
+    except ChatError as e:
+        print(f"  ⚠️  번역 실패 ({target_language}): {e}", flush=True)
+        return None
     
+    # 불필요한 텍스트 제거
+    content = content.replace('"', '').replace("'", '').strip()
+    return content or None
+
+def _known_translation(store: SaintsStore, index: NameIndex, saint: Dict[str, Any], field_name: str) -> Optional[str]:
+    """일본어·영어 이름이 모두 같은 다른 항목에 있는 번역"""
+    for saint_id in index.aliases(saint):
+        value = (store.get(saint_id) or {}).get(field_name)
+        if value and str(value).strip():
+            return value
     return None
 
-def process_saints_file(file_path: Path, api_key: str):
+async def _translate_pending(
+    backend: TranslationBackend,
+    store: SaintsStore,
+    journal: UpdateJournal,
+    pending: Dict[Tuple[str, str, str], List[Tuple[Dict[str, Any], str]]],
+    memory: TranslationMemory,
+    batch_size: int = BATCH_SIZE
+):
+    """
+    번역 메모리에 없는 이름만 요청을 동시에 보내고, 번역이 도착할 때마다 해당 성인들에 반영합니다.
+    batch_size가 1보다 크면 여러 성인의 모든 누락 언어를 한 번에 요청하고, 응답에서 빠진 항목만 하나씩 다시 요청합니다.
+    """
+    total = len(pending)
+    done = 0
+    
+    def apply(japanese_name: str, english_name: str, lang_code: str, translated: Optional[str]):
+        nonlocal done
+        for saint, field_name in pending[(japanese_name, english_name, lang_code)]:
+            if translated:
+                # 얻은 번역을 바로 저널에 기록 (중단되어도 다음 실행에서 이어서 진행)
+                store.update(saint['id'], {field_name: translated})
+                journal.record(saint['id'], {field_name: translated})
+                print(f"  ✅ {saint.get('name', 'N/A')} -> {field_name}: {translated}", flush=True)
+            else:
+                print(f"  ⚠️  {saint.get('name', 'N/A')} -> {field_name}: 번역 실패", flush=True)
+        
+        done += 1
+        if done % 50 == 0:
+            print(f"  진행: {done}/{total} ({done*100//total}%)", flush=True)
+    
+    def learn(japanese_name: str, english_name: str, lang_code: str, translated: Optional[str]):
+        if translated:
+            memory.put(japanese_name, english_name, lang_code, PROMPT_VERSION, translated)
+        apply(japanese_name, english_name, lang_code, translated)
+    
+    # 이전에 번역한 이름은 요청하지 않음
+    to_translate = []
+    for key in pending:
+        remembered = memory.get(*key, PROMPT_VERSION)
+        if remembered:
+            apply(*key, remembered)
+        else:
+            to_translate.append(key)
+    print(f"  🧠 {memory.summary()}", flush=True)
+    if not to_translate:
+        return
+    
+    async with backend:
+        async def run(japanese_name: str, english_name: str, lang_code: str):
+            learn(japanese_name, english_name, lang_code,
+                  await translate_saint_name(backend, japanese_name, english_name, lang_code))
+        
+        if batch_size > 1:
+            def fallback(item: BatchItem, lang_code: str):
+                return translate_saint_name(backend, item.name, item.name_en, lang_code)
+            
+            def on_result(item: BatchItem, lang_code: str, translated: Optional[str]):
+                learn(item.name, item.name_en, lang_code, translated)
+            
+            batch_stats = await translate_batches(backend, group_by_name(to_translate), fallback, on_result, batch_size)
+            print(f"  📦 묶음 요청 {batch_stats['batches']}회로 {batch_stats['batched']}건, 개별 재요청 {batch_stats['fallback']}건", flush=True)
+        else:
+            await asyncio.gather(*(run(*key) for key in to_translate))
+        print(f"  📊 {backend.summary()}", flush=True)
+
+def process_saints_file(file_path: Path, backend: TranslationBackend, batch_size: int = BATCH_SIZE):
     """성인 파일을 처리하여 누락된 번역을 추가합니다."""
-    import sys
     print(f"📖 파일 읽기: {file_path}", flush=True)
-    sys.stdout.flush()
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = SaintsStore.load(file_path)
+    
+    # 이전 실행에서 저널에 기록된 번역 복구 (복구된 필드는 아래에서 채워진 것으로 보고 건너뜀)
+    journal, replayed = UpdateJournal.resume(store, 'translations', backup_suffix=BACKUP_SUFFIX)
+    if replayed:
+        print(f"↩️  저널에서 {replayed}개 성인 업데이트 복구: {journal.path}", flush=True)
+    
+    # 일본어·영어 이름이 같은 항목끼리 번역을 공유하기 위한 이름 색인
+    index = NameIndex.for_store(store)
     
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
+    # 기존 번역에서 만든 토큰 용어집 (확실하게 조합되는 이름은 API 호출 없이 채움)
+    glossary = TokenGlossary.from_store(store)
     
-    # 번역 캐시
-    translation_cache = {}
+    all_saints = list(store)
     
     # 언어별 필드 매핑
     language_fields = {
@@ -151,16 +184,13 @@ def process_saints_file(file_path: Path, api_key: str):
         'pt': 'namePt',
     }
     
-    # 누락된 번역이 있는 성인 찾기
-    saints_to_update = []
+    # 번역할 (일본어 이름, 영어 이름, 언어) → 그 번역을 받을 (성인, 필드) 목록
+    # 같은 이름은 날짜가 달라도 한 번만 요청
+    pending: Dict[Tuple[str, str, str], List[Tuple[Dict[str, Any], str]]] = {}
     
-    total_saints = len(all_saints)
     processed = 0
     
     for saint in all_saints:
-        needs_update = False
-        updates = {}
-        
         japanese_name = saint.get('name', '')
         english_name = saint.get('nameEn', '')
         
@@ -171,87 +201,55 @@ def process_saints_file(file_path: Path, api_key: str):
         for lang_code, field_name in language_fields.items():
             current_value = saint.get(field_name)
             if not current_value or str(current_value).strip() == '':
-                # 번역 필요
-                translated = translate_saint_name(
-                    api_key,
-                    japanese_name,
-                    english_name,
-                    lang_code,
-                    translation_cache
-                )
+                # 같은 성인의 다른 항목에 이미 번역이 있으면 API 호출 없이 사용
+                translated = _known_translation(store, index, saint, field_name)
+                if translated:
+                    print(f"  ♻️  {saint.get('name', 'N/A')} -> {field_name}: {translated}", flush=True)
+                    store.update(saint['id'], {field_name: translated})
+                    journal.record(saint['id'], {field_name: translated})
+                    continue
                 
+                # 일본어·영어 이름이 같은 번역이나 토큰 번역 조합
+                translated = glossary.resolve(japanese_name, english_name, lang_code)
                 if translated:
-                    updates[field_name] = translated
-                    needs_update = True
-                    print(f"  ✅ {saint.get('name', 'N/A')} -> {field_name}: {translated}", flush=True)
-                else:
-                    print(f"  ⚠️  {saint.get('name', 'N/A')} -> {field_name}: 번역 실패", flush=True)
-                sys.stdout.flush()
+                    print(f"  🧩 {saint.get('name', 'N/A')} -> {field_name}: {translated}", flush=True)
+                    store.update(saint['id'], {field_name: translated})
+                    journal.record(saint['id'], {field_name: translated})
+                    continue
                 
-                time.sleep(1)  # API rate limit 방지
-        
-        if needs_update:
-            updated_saint = saint.copy()
-            updated_saint.update(updates)
-            saints_to_update.append((saint, updated_saint))
+                # 번역 필요
+                pending.setdefault((japanese_name, english_name, lang_code), []).append((saint, field_name))
         
         processed += 1
-        if processed % 50 == 0:
-            print(f"  진행: {processed}/{total_saints} ({processed*100//total_saints}%)", flush=True)
-            sys.stdout.flush()
-            # 중간 저장 (매 50개마다)
-            if saints_to_update:
-                _update_file(data, saints_to_update, file_path, is_final=False)
-                # 파일 다시 읽기 (업데이트된 내용 반영)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
-                saints_to_update = []  # 업데이트된 항목 초기화
     
-    if not saints_to_update and processed == total_saints:
+    print(f"📚 {glossary.summary()}", flush=True)
+    
+    if pending:
+        print(f"🌐 번역 요청 {len(pending)}건 ({sum(len(targets) for targets in pending.values())}개 필드)", flush=True)
+        with TranslationMemory() as memory:
+            asyncio.run(_translate_pending(backend, store, journal, pending, memory, batch_size))
+    
+    if not journal.path.exists():
         print("✅ 누락된 번역이 없습니다.")
         return
     
-    # 최종 저장
-    if saints_to_update:
-        _update_file(data, saints_to_update, file_path, is_final=True)
+    # 최종 저장 (저널 내용을 원본 파일에 한 번만 반영, 백업은 원본으로 한 번만)
+    print(f"💾 백업 생성: {file_path.with_suffix(BACKUP_SUFFIX)}")
+    print(f"💾 파일 저장: {file_path}")
+    journal.compact(store, file_path, backup_suffix=BACKUP_SUFFIX)
     
     print(f"\n✅ 완료! 총 {processed}개의 성인을 처리했습니다.")
 
-def _update_file(data: dict, saints_to_update: List, file_path: Path, is_final: bool = False):
-    """파일을 업데이트합니다."""
-    # 원본 리스트에서 업데이트
-    for original, updated in saints_to_update:
-        if original in data.get('saints', []):
-            index = data['saints'].index(original)
-            # 기존 값과 병합
-            data['saints'][index].update(updated)
-        elif original in data.get('japaneseSaints', []):
-            index = data['japaneseSaints'].index(original)
-            # 기존 값과 병합
-            data['japaneseSaints'][index].update(updated)
-    
-    if is_final:
-        # 백업 생성
-        backup_path = file_path.with_suffix('.json.backup_all_translations')
-        print(f"💾 백업 생성: {backup_path}")
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # 업데이트된 파일 저장
-    print(f"💾 파일 저장: {file_path}")
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
 def main():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     json_path = project_root / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
     
-    # API 키 확인
-    api_key = load_env_file()
-    if not api_key:
-        print("❌ OPENAI_API_KEY를 찾을 수 없습니다.")
+    # 번역 백엔드 (.env의 TRANSLATION_BACKEND, 기본 openai)
+    try:
+        backend = create_backend()
+    except ValueError as e:
+        print(f"❌ {e}")
         print("   .env 파일에 OPENAI_API_KEY=your_key 형식으로 설정해주세요.")
         sys.exit(1)
     
@@ -263,11 +261,14 @@ def main():
     print("🚀 모든 언어 번역 추가 시작")
     print("=" * 60)
     print("⚠️  이 작업은 시간이 오래 걸릴 수 있습니다.")
-    print("⚠️  API rate limit을 고려하여 각 번역마다 1초씩 대기합니다.")
+    print("⚠️  번역 요청은 API rate limit 안에서 동시에 보냅니다.")
     print("=" * 60)
     print()
     
-    process_saints_file(json_path, api_key)
+    # 필드마다 따로 요청 (묶음 응답 형식을 지원하지 않는 모델 등)
+    batch_size = 1 if '--no-batch' in sys.argv[1:] else BATCH_SIZE
+    
+    process_saints_file(json_path, backend, batch_size)
     
     print("\n" + "=" * 60)
     print("✅ 모든 작업 완료!")
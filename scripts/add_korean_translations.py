@@ -4,55 +4,26 @@
 다른 언어(nameEn, nameZh 등)를 참고하여 한국어 번역을 생성합니다.
 """
 
-import json
-import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import requests
-import time
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
 
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                break
-    
-    return api_key
+from saints import ChatError, SaintsStore, TranslationBackend, UpdateJournal, create_backend
+from saints.memory import TranslationMemory
+
+# 원본 백업 파일 접미사
+BACKUP_SUFFIX = '.json.backup_korean'
+
+# 번역 메모리의 프롬프트 버전 (프롬프트를 바꾸면 올림)
+PROMPT_VERSION = 'korean-v1'
 
-def translate_to_korean(
-    api_key: str,
+def build_messages(
     japanese_name: str,
     english_name: Optional[str],
-    other_names: Dict[str, str],
-    cache: Dict[str, str] = None
-) -> Optional[str]:
-    """ChatGPT를 사용하여 성인 이름을 한국어로 번역합니다."""
-    if cache is None:
-        cache = {}
-    
-    # 캐시 확인
-    cache_key = f"{japanese_name}_{english_name}_ko"
-    if cache_key in cache:
-        return cache[cache_key]
-    
-    url = 'https://api.openai.com/v1/chat/completions'
-    
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
+    other_names: Dict[str, str]
+) -> List[Dict[str, str]]:
+    """한국어 번역 요청 메시지를 만듭니다."""
     # 다른 언어 이름 정보 수집
     other_lang_info = []
     if other_names.get('nameZh'):
@@ -78,130 +49,148 @@ ${other_lang_text if other_lang_text else ''}
 - "성" 접두사를 포함하여 반환 (예: "성 요한", "성 마리아")
 - 설명이나 추가 텍스트 없이 이름만 반환'''
     
-    data = {
-        'model': 'gpt-4o-mini',
-        'messages': [
-            {
-                'role': 'system',
-                'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 한국어 가톨릭 전례에서 사용하는 표준 이름을 사용하여 정확하게 번역합니다.'
-            },
-            {'role': 'user', 'content': prompt}
-        ],
-        'temperature': 0.3,
-        'max_tokens': 100
-    }
-    
+    return [
+        {
+            'role': 'system',
+            'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 한국어 가톨릭 전례에서 사용하는 표준 이름을 사용하여 정확하게 번역합니다.'
+        },
+        {'role': 'user', 'content': prompt}
+    ]
+
+async def translate_to_korean(
+    backend: TranslationBackend,
+    japanese_name: str,
+    english_name: Optional[str],
+    other_names: Dict[str, str]
+) -> Optional[str]:
+    """ChatGPT를 사용하여 성인 이름을 한국어로 번역합니다."""
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        content = result['choices'][0]['message']['content'].strip()
+        content = await backend.complete(
+            build_messages(japanese_name, english_name, other_names),
+            items=((japanese_name, english_name, ('ko',)),)
+        )
+    except ChatError as e:
+        print(f"  ⚠️  한국어 번역 실패: {e}")
+        return None
+    
+    # 불필요한 텍스트 제거
+    content = content.replace('"', '').replace("'", '').strip()
+    return content or None
+
+async def _translate_pending(
+    backend: TranslationBackend,
+    store: SaintsStore,
+    journal: UpdateJournal,
+    pending: Dict[Tuple[str, str], List[Dict[str, Any]]],
+    memory: TranslationMemory
+) -> int:
+    """
+    번역 메모리에 없는 이름만 요청을 동시에 보내고, 번역이 도착할 때마다 저널에 기록합니다.
+    추가된 성인 수를 반환합니다.
+    """
+    total = len(pending)
+    done = 0
+    added = 0
+    
+    def apply(targets: List[Dict[str, Any]], translated_ko: Optional[str]):
+        nonlocal done, added
+        for target in targets:
+            if translated_ko:
+                # 얻은 번역을 바로 저널에 기록 (중단되어도 다음 실행에서 이어서 진행)
+                store.update(target['id'], {'nameKo': translated_ko})
+                journal.record(target['id'], {'nameKo': translated_ko})
+                added += 1
+                print(f"  ✅ {target.get('name')} -> nameKo: {translated_ko}")
+            else:
+                print(f"  ⚠️  {target.get('name')} -> nameKo: 번역 실패")
         
-        # 불필요한 텍스트 제거
-        content = content.replace('"', '').replace("'", '').strip()
+        done += 1
+        if done % 10 == 0:
+            print(f"  진행: {done}/{total} ({done*100//total}%)")
+    
+    # 이전에 번역한 이름은 요청하지 않음
+    to_translate = {}
+    for (japanese_name, english_name), targets in pending.items():
+        remembered = memory.get(japanese_name, english_name, 'ko', PROMPT_VERSION)
+        if remembered:
+            apply(targets, remembered)
+        else:
+            to_translate[(japanese_name, english_name)] = targets
+    print(f"  🧠 {memory.summary()}")
+    if not to_translate:
+        return added
+    
+    async with backend:
+        async def run(japanese_name: str, english_name: str, targets: List[Dict[str, Any]]):
+            # 같은 이름의 첫 성인의 다른 언어 이름을 참고
+            saint = targets[0]
+            other_names = {
+                'nameZh': saint.get('nameZh'),
+                'nameVi': saint.get('nameVi'),
+                'nameEs': saint.get('nameEs'),
+                'namePt': saint.get('namePt'),
+            }
+            translated_ko = await translate_to_korean(backend, japanese_name, english_name, other_names)
+            if translated_ko:
+                memory.put(japanese_name, english_name, 'ko', PROMPT_VERSION, translated_ko)
+            apply(targets, translated_ko)
         
-        if content:
-            cache[cache_key] = content
-            return content
-    except Exception as e:
-        print(f"  ⚠️  한국어 번역 실패: {e}")
+        await asyncio.gather(*(run(*key, targets) for key, targets in to_translate.items()))
+        print(f"  📊 {backend.summary()}")
     
-    return None
+    return added
 
-def process_saints_file(file_path: Path, api_key: str):
+def process_saints_file(file_path: Path, backend: TranslationBackend):
     """성인 파일을 처리하여 누락된 한국어 번역을 추가합니다."""
     print(f"📖 파일 읽기: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
-    
-    # 번역 캐시
-    translation_cache = {}
+    store = SaintsStore.load(file_path)
     
-    # 누락된 한국어 번역이 있는 성인 찾기
-    saints_to_update = []
+    # 이전 실행에서 저널에 기록된 번역 복구 (복구된 성인은 아래에서 건너뜀)
+    journal, replayed = UpdateJournal.resume(store, 'korean', backup_suffix=BACKUP_SUFFIX)
+    if replayed:
+        print(f"↩️  저널에서 {replayed}개 성인 업데이트 복구: {journal.path}")
     
-    total_saints = len(all_saints)
-    processed = 0
+    # 번역할 (일본어 이름, 영어 이름) → 그 번역을 받을 성인 목록 (같은 이름은 한 번만 요청)
+    pending: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
     
-    for saint in all_saints:
+    for saint in store:
         name_ko = saint.get('nameKo')
         if name_ko and str(name_ko).strip():
             continue  # 한국어 이름이 이미 있으면 스킵
         
-        # 다른 언어 이름 수집
-        other_names = {
-            'nameZh': saint.get('nameZh'),
-            'nameVi': saint.get('nameVi'),
-            'nameEs': saint.get('nameEs'),
-            'namePt': saint.get('namePt'),
-        }
-        
-        # 한국어 번역 생성
-        translated_ko = translate_to_korean(
-            api_key,
-            saint.get('name', ''),
-            saint.get('nameEn'),
-            other_names,
-            translation_cache
-        )
-        
-        if translated_ko:
-            updated_saint = saint.copy()
-            updated_saint['nameKo'] = translated_ko
-            saints_to_update.append((saint, updated_saint))
-            print(f"  ✅ {saint.get('name')} -> nameKo: {translated_ko}")
-        else:
-            print(f"  ⚠️  {saint.get('name')} -> nameKo: 번역 실패")
-        
-        processed += 1
-        if processed % 10 == 0:
-            print(f"  진행: {processed}/{total_saints} ({processed*100//total_saints}%)")
-        
-        time.sleep(1)  # API rate limit 방지
+        pending.setdefault((saint.get('name', ''), saint.get('nameEn')), []).append(saint)
+    
+    added = 0
+    if pending:
+        print(f"🌐 번역 요청 {len(pending)}건 ({sum(len(targets) for targets in pending.values())}명)")
+        with TranslationMemory() as memory:
+            added = asyncio.run(_translate_pending(backend, store, journal, pending, memory))
     
-    if not saints_to_update:
+    if not journal.path.exists():
         print("✅ 누락된 한국어 번역이 없습니다.")
         return
     
-    # 파일 업데이트
-    print(f"\n💾 {len(saints_to_update)}개의 성인에 한국어 번역 추가 중...")
-    
-    # 원본 리스트에서 업데이트
-    for original, updated in saints_to_update:
-        # 원본 리스트에서 찾아서 업데이트
-        if original in data.get('saints', []):
-            index = data['saints'].index(original)
-            data['saints'][index] = updated
-        elif original in data.get('japaneseSaints', []):
-            index = data['japaneseSaints'].index(original)
-            data['japaneseSaints'][index] = updated
-    
-    # 백업 생성
-    backup_path = file_path.with_suffix('.json.backup_korean')
-    print(f"💾 백업 생성: {backup_path}")
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # 업데이트된 파일 저장
+    # 파일 업데이트 (저널 내용을 원본 파일에 한 번만 반영)
+    print(f"\n💾 {added + replayed}개의 성인에 한국어 번역 추가 중...")
+    
+    # 백업(원본, 한 번만) 후 업데이트된 파일 저장
+    print(f"💾 백업 생성: {file_path.with_suffix(BACKUP_SUFFIX)}")
     print(f"💾 업데이트된 파일 저장: {file_path}")
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    journal.compact(store, backup_suffix=BACKUP_SUFFIX)
     
-    print(f"\n✅ 완료! {len(saints_to_update)}개의 성인에 한국어 번역이 추가되었습니다.")
+    print(f"\n✅ 완료! {added + replayed}개의 성인에 한국어 번역이 추가되었습니다.")
 
 def main():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
     json_path = project_root / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
     
-    # API 키 확인
-    api_key = load_env_file()
-    if not api_key:
-        print("❌ OPENAI_API_KEY를 찾을 수 없습니다.")
+    # 번역 백엔드 (.env의 TRANSLATION_BACKEND, 기본 openai)
+    try:
+        backend = create_backend()
+    except ValueError as e:
+        print(f"❌ {e}")
         print("   .env 파일에 OPENAI_API_KEY=your_key 형식으로 설정해주세요.")
         sys.exit(1)
     
@@ -209,7 +198,7 @@ def main():
         print(f"❌ JSON 파일을 찾을 수 없습니다: {json_path}")
         sys.exit(1)
     
-    process_saints_file(json_path, api_key)
+    process_saints_file(json_path, backend)
 
 if __name__ == '__main__':
     main()
@@ -4,56 +4,24 @@
 다른 언어(nameEn, nameKo, name 등)를 참고하여 중국어 번역을 생성합니다.
 """
 
-import json
-import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import requests
-import time
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
 
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                break
-    
-    return api_key
+from saints import ChatError, SaintsStore, TranslationBackend, create_backend
+from saints.memory import TranslationMemory
 
-def translate_to_chinese(
-    api_key: str,
+# 번역 메모리의 프롬프트 버전 (프롬프트를 바꾸면 올림)
+PROMPT_VERSION = 'chinese-v1'
+
+def build_messages(
     japanese_name: str,
     english_name: Optional[str],
     korean_name: Optional[str],
-    other_names: Dict[str, str],
-    cache: Dict[str, str] = None
-) -> Optional[str]:
-    """ChatGPT를 사용하여 성인 이름을 중국어로 번역합니다."""
-    if cache is None:
-        cache = {}
-    
-    # 캐시 확인
-    cache_key = f"{japanese_name}_{english_name}_zh"
-    if cache_key in cache:
-        return cache[cache_key]
-    
-    url = 'https://api.openai.com/v1/chat/completions'
-    
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
+    other_names: Dict[str, str]
+) -> List[Dict[str, str]]:
+    """중국어 번역 요청 메시지를 만듭니다."""
     # 다른 언어 이름 정보 수집
     other_lang_info = []
     if korean_name:
@@ -80,90 +48,118 @@ ${other_lang_text if other_lang_text else ''}
 - "聖" 접두사를 포함하여 반환 (예: "聖若望", "聖瑪利亞")
 - 설명이나 추가 텍스트 없이 이름만 반환'''
     
-    data = {
-        'model': 'gpt-4o-mini',
-        'messages': [
-            {
-                'role': 'system',
-                'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 중국어 가톨릭 전례에서 사용하는 표준 이름을 사용하여 정확하게 번역합니다.'
-            },
-            {'role': 'user', 'content': prompt}
-        ],
-        'temperature': 0.3,
-        'max_tokens': 100
-    }
-    
+    return [
+        {
+            'role': 'system',
+            'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 중국어 가톨릭 전례에서 사용하는 표준 이름을 사용하여 정확하게 번역합니다.'
+        },
+        {'role': 'user', 'content': prompt}
+    ]
+
+async def translate_to_chinese(
+    backend: TranslationBackend,
+    japanese_name: str,
+    english_name: Optional[str],
+    korean_name: Optional[str],
+    other_names: Dict[str, str]
+) -> Optional[str]:
+    """ChatGPT를 사용하여 성인 이름을 중국어로 번역합니다."""
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        content = result['choices'][0]['message']['content'].strip()
+        content = await backend.complete(
+            build_messages(japanese_name, english_name, korean_name, other_names),
+            items=((japanese_name, english_name, ('zh',)),)
+        )
+    except ChatError as e:
+        print(f"  ⚠️  중국어 번역 실패: {e}")
+        return None
+    
+    # 불필요한 텍스트 제거
+    content = content.replace('"', '').replace("'", '').strip()
+    return content or None
+
+async def _translate_pending(
+    backend: TranslationBackend,
+    pending: Dict[Tuple[str, str], List[Dict[str, Any]]],
+    memory: TranslationMemory
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """번역 메모리에 없는 이름만 요청을 동시에 보내고 (원본 성인, 업데이트된 성인) 목록을 반환합니다."""
+    saints_to_update = []
+    total = len(pending)
+    done = 0
+    
+    def apply(targets: List[Dict[str, Any]], translated_zh: Optional[str]):
+        nonlocal done
+        for target in targets:
+            if translated_zh:
+                updated_saint = target.copy()
+                updated_saint['nameZh'] = translated_zh
+                saints_to_update.append((target, updated_saint))
+                print(f"  ✅ {target.get('name')} -> nameZh: {translated_zh}")
+            else:
+                print(f"  ⚠️  {target.get('name')} -> nameZh: 번역 실패")
         
-        # 불필요한 텍스트 제거
-        content = content.replace('"', '').replace("'", '').strip()
+        done += 1
+        if done % 10 == 0:
+            print(f"  진행: {done}/{total} ({done*100//total}%)")
+    
+    # 이전에 번역한 이름은 요청하지 않음
+    to_translate = {}
+    for (japanese_name, english_name), targets in pending.items():
+        remembered = memory.get(japanese_name, english_name, 'zh', PROMPT_VERSION)
+        if remembered:
+            apply(targets, remembered)
+        else:
+            to_translate[(japanese_name, english_name)] = targets
+    print(f"  🧠 {memory.summary()}")
+    if not to_translate:
+        return saints_to_update
+    
+    async with backend:
+        async def run(japanese_name: str, english_name: str, targets: List[Dict[str, Any]]):
+            # 같은 이름의 첫 성인의 다른 언어 이름을 참고
+            saint = targets[0]
+            other_names = {
+                'nameVi': saint.get('nameVi'),
+                'nameEs': saint.get('nameEs'),
+                'namePt': saint.get('namePt'),
+            }
+            translated_zh = await translate_to_chinese(
+                backend,
+                japanese_name,
+                english_name,
+                saint.get('nameKo'),
+                other_names
+            )
+            if translated_zh:
+                memory.put(japanese_name, english_name, 'zh', PROMPT_VERSION, translated_zh)
+            apply(targets, translated_zh)
         
-        if content:
-            cache[cache_key] = content
-            return content
-    except Exception as e:
-        print(f"  ⚠️  중국어 번역 실패: {e}")
+        await asyncio.gather(*(run(*key, targets) for key, targets in to_translate.items()))
+        print(f"  📊 {backend.summary()}")
     
-    return None
+    return saints_to_update
 
-def process_saints_file(file_path: Path, api_key: str):
+def process_saints_file(file_path: Path, backend: TranslationBackend):
     """성인 파일을 처리하여 누락된 중국어 번역을 추가합니다."""
     print(f"📖 파일 읽기: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
-    
-    # 번역 캐시
-    translation_cache = {}
-    
-    # 누락된 중국어 번역이 있는 성인 찾기
-    saints_to_update = []
-    
-    total_saints = len(all_saints)
-    processed = 0
+    store = SaintsStore.load(file_path)
+    # 번역할 (일본어 이름, 영어 이름) → 그 번역을 받을 성인 목록 (같은 이름은 한 번만 요청)
+    pending: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
     
-    for saint in all_saints:
+    for saint in store:
         name_zh = saint.get('nameZh')
         if name_zh and str(name_zh).strip():
             continue  # 중국어 이름이 이미 있으면 스킵
         
-        # 다른 언어 이름 수집
-        other_names = {
-            'nameVi': saint.get('nameVi'),
-            'nameEs': saint.get('nameEs'),
-            'namePt': saint.get('namePt'),
-        }
-        
-        # 중국어 번역 생성
-        translated_zh = translate_to_chinese(
-            api_key,
-            saint.get('name', ''),
-            saint.get('nameEn'),
-            saint.get('nameKo'),
-            other_names,
-            translation_cache
-        )
-        
-        if translated_zh:
-            updated_saint = saint.copy()
-            updated_saint['nameZh'] = translated_zh
-            saints_to_update.append((saint, updated_saint))
-            print(f"  ✅ {saint.get('name')} -> nameZh: {translated_zh}")
-        else:
-            print(f"  ⚠️  {saint.get('name')} -> nameZh: 번역 실패")
-        
-        processed += 1
-        if processed % 10 == 0:
-            print(f"  진행: {processed}/{total_saints} ({processed*100//total_saints}%)")
-        
-        time.sleep(1)  # API rate limit 방지
+        pending.setdefault((saint.get('name', ''), saint.get('nameEn')), []).append(saint)
+    
+    # 누락된 중국어 번역이 있는 성인 번역
+    saints_to_update = []
+    if pending:
+        print(f"🌐 번역 요청 {len(pending)}건 ({sum(len(targets) for targets in pending.values())}명)")
+        with TranslationMemory() as memory:
+            saints_to_update = asyncio.run(_translate_pending(backend, pending, memory))
     
     if not saints_to_update:
         print("✅ 누락된 중국어 번역이 없습니다.")
@@ -172,26 +168,15 @@ def process_saints_file(file_path: Path, api_key: str):
     # 파일 업데이트
     print(f"\n💾 {len(saints_to_update)}개의 성인에 중국어 번역 추가 중...")
     
-    # 원본 리스트에서 업데이트
+    # 원본 항목을 같은 자리에서 교체
     for original, updated in saints_to_update:
-        # 원본 리스트에서 찾아서 업데이트
-        if original in data.get('saints', []):
-            index = data['saints'].index(original)
-            data['saints'][index] = updated
-        elif original in data.get('japaneseSaints', []):
-            index = data['japaneseSaints'].index(original)
-            data['japaneseSaints'][index] = updated
-    
-    # 백업 생성
-    backup_path = file_path.with_suffix('.json.backup_chinese')
-    print(f"💾 백업 생성: {backup_path}")
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # 업데이트된 파일 저장
+        store.replace(original, updated)
+    
+    # 백업(원본, 한 번만) 후 업데이트된 파일 저장
+    backup_suffix = '.json.backup_chinese'
+    print(f"💾 백업 생성: {file_path.with_suffix(backup_suffix)}")
     print(f"💾 업데이트된 파일 저장: {file_path}")
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save(backup_suffix=backup_suffix)
     
     print(f"\n✅ 완료! {len(saints_to_update)}개의 성인에 중국어 번역이 추가되었습니다.")
 
@@ -200,10 +185,11 @@ def main():
     project_root = script_dir.parent
     json_path = project_root / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
     
-    # API 키 확인
-    api_key = load_env_file()
-    if not api_key:
-        print("❌ OPENAI_API_KEY를 찾을 수 없습니다.")
+    # 번역 백엔드 (.env의 TRANSLATION_BACKEND, 기본 openai)
+    try:
+        backend = create_backend()
+    except ValueError as e:
+        print(f"❌ {e}")
         print("   .env 파일에 OPENAI_API_KEY=your_key 형식으로 설정해주세요.")
         sys.exit(1)
     
@@ -211,7 +197,7 @@ def main():
         print(f"❌ JSON 파일을 찾을 수 없습니다: {json_path}")
         sys.exit(1)
     
-    process_saints_file(json_path, api_key)
+    process_saints_file(json_path, backend)
 
 if __name__ == '__main__':
     main()
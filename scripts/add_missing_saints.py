@@ -3,11 +3,12 @@
 빠진 성인 축일 데이터를 JSON 파일에 자동 추가
 """
 
-import json
 import re
+from pathlib import Path
 from urllib.request import urlopen
 from html.parser import HTMLParser
-from collections import defaultdict
+
+from saints import ID_KEY, NameIndex, NameMatcher, SaintsStore
 
 BASE_URL = "https://www.pauline.or.jp/calendariosanti/saint365.php?id="
 MONTHS = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
@@ -99,63 +100,16 @@ def crawl_month(month_code):
         print(f"Error crawling {month_code}: {e}")
         return []
 
-def load_existing_json(filepath):
-    """기존 JSON 파일 로드"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def normalize_saint_name(name):
-    """성인 이름 정규화 (비교를 위해)"""
-    # 괄호와 특수문자 제거, 공백 정규화
-    normalized = name.replace("（", "(").replace("）", ")")
-    normalized = re.sub(r'\([^)]*\)', '', normalized)  # 괄호 내용 제거
-    normalized = normalized.replace("／", "/").replace("・", "・")
-    # 공백 제거
-    normalized = normalized.replace(" ", "").replace("　", "")
-    return normalized
-
-def find_missing_saints(crawled, existing, month):
+def find_missing_saints(crawled, store, matcher, month):
     """크롤링한 데이터와 기존 JSON 비교하여 빠진 항목 찾기"""
-    existing_by_day = defaultdict(list)
-    for saint in existing.get("saints", []):
-        if saint["month"] == month:
-            existing_by_day[saint["day"]].append(saint["name"])
-    
-    for saint in existing.get("japaneseSaints", []):
-        if saint["month"] == month:
-            existing_by_day[saint["day"]].append(saint["name"])
-    
     missing = []
     for saint in crawled:
         day = saint["day"]
         name = saint["name"]
-        normalized_crawled = normalize_saint_name(name)
-        
-        # 정확히 일치하는지 확인
-        exact_match = False
-        partial_match = False
         
-        for existing_name in existing_by_day[day]:
-            normalized_existing = normalize_saint_name(existing_name)
-            
-            # 정확히 일치
-            if name == existing_name or normalized_crawled == normalized_existing:
-                exact_match = True
-                break
-            
-            # 부분 일치 확인 (핵심 이름 부분이 같은지)
-            # "聖" 제거하고 비교
-            core_crawled = normalized_crawled.replace("聖", "")
-            core_existing = normalized_existing.replace("聖", "")
-            
-            # 한쪽이 다른 쪽을 포함하는지 확인
-            if core_crawled in core_existing or core_existing in core_crawled:
-                # 너무 짧은 경우는 제외 (예: "聖"만 있는 경우)
-                if len(core_crawled) > 2 and len(core_existing) > 2:
-                    partial_match = True
-                    break
-        
-        if not exact_match and not partial_match:
+        # 해당 날짜에 같은 성인이 있는지 확인 (웹사이트 이름은 JSON 이름으로 매핑한 뒤 비교)
+        existing_ids = [s.get(ID_KEY) for s in store.on(month, day)]
+        if matcher.best(normalize_name(name), existing_ids) is None:
             missing.append({
                 "month": month,
                 "day": day,
@@ -196,7 +150,8 @@ def main():
     json_file = "assets/data/saints/saints_feast_days.json"
     
     print("기존 JSON 파일 로드 중...")
-    existing_data = load_existing_json(json_file)
+    store = SaintsStore.load(Path(json_file))
+    matcher = NameMatcher(NameIndex.for_store(store))
     
     all_missing = []
     
@@ -205,7 +160,7 @@ def main():
         crawled = crawl_month(month_code)
         print(f"  크롤링된 항목: {len(crawled)}개")
         
-        missing = find_missing_saints(crawled, existing_data, i)
+        missing = find_missing_saints(crawled, store, matcher, i)
         if missing:
             print(f"  빠진 항목: {len(missing)}개")
             all_missing.extend(missing)
@@ -220,14 +175,10 @@ def main():
                 missing["day"],
                 missing["name"]
             )
-            existing_data["saints"].append(new_entry)
-        
-        # 월/일 순으로 정렬
-        existing_data["saints"].sort(key=lambda x: (x["month"], x["day"]))
+            store.add(new_entry)
         
-        # JSON 파일 저장
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, ensure_ascii=False, indent=2)
+        # JSON 파일 저장 (날짜 항목별로 저장되므로 별도 정렬 불필요)
+        store.save()
         
         print(f"✅ {len(all_missing)}개 항목이 추가되었습니다!")
     else:
@@ -5,56 +5,24 @@
 ChatGPT를 사용하여 번역을 추가합니다.
 """
 
-import json
-import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import requests
-import time
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
 
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                break
-    
-    return api_key
+from saints import ChatError, SaintsStore, TranslationBackend, create_backend
+from saints.memory import TranslationMemory
 
-def translate_saint_name(
-    api_key: str,
+# 번역 메모리의 프롬프트 버전 (프롬프트를 바꾸면 올림)
+PROMPT_VERSION = 'from-korean-v1'
+
+def build_messages(
     korean_name: str,
     japanese_name: str,
     english_name: Optional[str],
-    target_language: str,
-    cache: Dict[str, str] = None
-) -> Optional[str]:
-    """ChatGPT를 사용하여 성인 이름을 번역합니다."""
-    if cache is None:
-        cache = {}
-    
-    # 캐시 확인
-    cache_key = f"{korean_name}_{target_language}"
-    if cache_key in cache:
-        return cache[cache_key]
-    
-    url = 'https://api.openai.com/v1/chat/completions'
-    
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
+    target_language: str
+) -> List[Dict[str, str]]:
+    """한국어 이름 기준 번역 요청 메시지를 만듭니다."""
     language_names = {
         'en': 'English',
         'zh': '中文',
@@ -76,102 +44,125 @@ ${f'영어 이름: {english_name}' if english_name else ''}
 - 가톨릭 전례에서 사용하는 표준 이름 사용
 - 설명이나 추가 텍스트 없이 이름만 반환'''
     
-    data = {
-        'model': 'gpt-4o-mini',
-        'messages': [
-            {
-                'role': 'system',
-                'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 각 언어의 표준 가톨릭 용어를 사용하여 정확하게 번역합니다.'
-            },
-            {'role': 'user', 'content': prompt}
-        ],
-        'temperature': 0.3,
-        'max_tokens': 100
-    }
-    
+    return [
+        {
+            'role': 'system',
+            'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 각 언어의 표준 가톨릭 용어를 사용하여 정확하게 번역합니다.'
+        },
+        {'role': 'user', 'content': prompt}
+    ]
+
+async def translate_saint_name(
+    backend: TranslationBackend,
+    korean_name: str,
+    japanese_name: str,
+    english_name: Optional[str],
+    target_language: str
+) -> Optional[str]:
+    """ChatGPT를 사용하여 성인 이름을 번역합니다."""
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        content = result['choices'][0]['message']['content'].strip()
+        content = await backend.complete(
+            build_messages(korean_name, japanese_name, english_name, target_language),
+            items=((japanese_name, english_name or '', (target_language,)),)
+        )
+    except ChatError as e:
+        print(f"  ⚠️  번역 실패 ({target_language}): {e}")
+        return None
+    
+    # 불필요한 텍스트 제거
+    content = content.replace('"', '').replace("'", '').strip()
+    return content or None
+
+async def _translate_pending(
+    backend: TranslationBackend,
+    pending: Dict[Tuple[str, str], List[Tuple[Dict[str, Any], str]]],
+    memory: TranslationMemory
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """번역 메모리에 없는 이름만 요청을 동시에 보내고 (원본 성인, 업데이트된 성인) 목록을 반환합니다."""
+    updated: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}  # id(원본) → (원본, 업데이트)
+    total = len(pending)
+    done = 0
+    
+    def apply(targets: List[Tuple[Dict[str, Any], str]], translated: Optional[str]):
+        nonlocal done
+        for target, field_name in targets:
+            if translated:
+                _, updated_saint = updated.setdefault(id(target), (target, target.copy()))
+                updated_saint[field_name] = translated
+                print(f"  ✅ {target.get('name')} -> {field_name}: {translated}")
+            else:
+                print(f"  ⚠️  {target.get('name')} -> {field_name}: 번역 실패")
         
-        # 불필요한 텍스트 제거
-        content = content.replace('"', '').replace("'", '').strip()
+        done += 1
+        if done % 10 == 0:
+            print(f"  진행: {done}/{total} ({done*100//total}%)")
+    
+    # 이전에 번역한 이름은 요청하지 않음 (한국어 이름 기준)
+    to_translate = {}
+    for (name_ko, lang_code), targets in pending.items():
+        remembered = memory.get(name_ko, '', lang_code, PROMPT_VERSION)
+        if remembered:
+            apply(targets, remembered)
+        else:
+            to_translate[(name_ko, lang_code)] = targets
+    print(f"  🧠 {memory.summary()}")
+    if not to_translate:
+        return list(updated.values())
+    
+    async with backend:
+        async def run(name_ko: str, lang_code: str, targets: List[Tuple[Dict[str, Any], str]]):
+            # 같은 한국어 이름의 첫 성인의 일본어·영어 이름을 참고
+            saint = targets[0][0]
+            translated = await translate_saint_name(
+                backend,
+                name_ko,
+                saint.get('name', ''),
+                saint.get('nameEn'),
+                lang_code
+            )
+            if translated:
+                memory.put(name_ko, '', lang_code, PROMPT_VERSION, translated)
+            apply(targets, translated)
         
-        if content:
-            cache[cache_key] = content
-            return content
-    except Exception as e:
-        print(f"  ⚠️  번역 실패 ({target_language}): {e}")
+        await asyncio.gather(*(run(*key, targets) for key, targets in to_translate.items()))
+        print(f"  📊 {backend.summary()}")
     
-    return None
+    return list(updated.values())
 
-def process_saints_file(file_path: Path, api_key: str):
+def process_saints_file(file_path: Path, backend: TranslationBackend):
     """성인 파일을 처리하여 누락된 번역을 추가합니다."""
     print(f"📖 파일 읽기: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
+    store = SaintsStore.load(file_path)
     
-    # 번역 캐시
-    translation_cache = {}
-    
-    # 누락된 번역이 있는 성인 찾기
-    saints_to_update = []
+    # 각 언어별로 누락된 번역 확인
+    languages = {
+        'nameEn': 'en',
+        'nameZh': 'zh',
+        'nameVi': 'vi',
+        'nameEs': 'es',
+        'namePt': 'pt',
+    }
     
-    total_saints = len(all_saints)
-    processed = 0
+    # 번역할 (한국어 이름, 언어) → 그 번역을 받을 (성인, 필드) 목록 (같은 이름은 한 번만 요청)
+    pending: Dict[Tuple[str, str], List[Tuple[Dict[str, Any], str]]] = {}
     
-    for saint in all_saints:
+    for saint in store:
         name_ko = saint.get('nameKo')
         if not name_ko or name_ko.strip() == '':
             continue  # 한국어 이름이 없으면 스킵
         
-        needs_update = False
-        updates = {}
-        
-        # 각 언어별로 누락된 번역 확인
-        languages = {
-            'nameEn': 'en',
-            'nameZh': 'zh',
-            'nameVi': 'vi',
-            'nameEs': 'es',
-            'namePt': 'pt',
-        }
-        
         for field_name, lang_code in languages.items():
             current_value = saint.get(field_name)
             if not current_value or str(current_value).strip() == '':
-                # 번역 필요
-                translated = translate_saint_name(
-                    api_key,
-                    name_ko,
-                    saint.get('name', ''),
-                    saint.get('nameEn'),
-                    lang_code,
-                    translation_cache
-                )
-                
-                if translated:
-                    updates[field_name] = translated
-                    needs_update = True
-                    print(f"  ✅ {saint.get('name')} -> {field_name}: {translated}")
-                else:
-                    print(f"  ⚠️  {saint.get('name')} -> {field_name}: 번역 실패")
-                
-                time.sleep(1)  # API rate limit 방지
-        
-        processed += 1
-        if processed % 10 == 0:
-            print(f"  진행: {processed}/{total_saints} ({processed*100//total_saints}%)")
-        
-        if needs_update:
-            updated_saint = saint.copy()
-            updated_saint.update(updates)
-            saints_to_update.append((saint, updated_saint))
+                pending.setdefault((name_ko, lang_code), []).append((saint, field_name))
+    
+    # 누락된 번역이 있는 성인 번역
+    saints_to_update = []
+    if pending:
+        print(f"🌐 번역 요청 {len(pending)}건 ({sum(len(targets) for targets in pending.values())}개 필드)")
+        with TranslationMemory() as memory:
+            saints_to_update = asyncio.run(_translate_pending(backend, pending, memory))
     
     if not saints_to_update:
         print("✅ 누락된 번역이 없습니다.")
@@ -180,26 +171,15 @@ def process_saints_file(file_path: Path, api_key: str):
     # 파일 업데이트
     print(f"\n💾 {len(saints_to_update)}개의 성인 번역 추가 중...")
     
-    # 원본 리스트에서 업데이트
+    # 원본 항목을 같은 자리에서 교체
     for original, updated in saints_to_update:
-        # 원본 리스트에서 찾아서 업데이트
-        if original in data.get('saints', []):
-            index = data['saints'].index(original)
-            data['saints'][index] = updated
-        elif original in data.get('japaneseSaints', []):
-            index = data['japaneseSaints'].index(original)
-            data['japaneseSaints'][index] = updated
-    
-    # 백업 생성
-    backup_path = file_path.with_suffix('.json.backup_translations')
-    print(f"💾 백업 생성: {backup_path}")
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # 업데이트된 파일 저장
+        store.replace(original, updated)
+    
+    # 백업(원본, 한 번만) 후 업데이트된 파일 저장
+    backup_suffix = '.json.backup_translations'
+    print(f"💾 백업 생성: {file_path.with_suffix(backup_suffix)}")
     print(f"💾 업데이트된 파일 저장: {file_path}")
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save(backup_suffix=backup_suffix)
     
     print(f"\n✅ 완료! {len(saints_to_update)}개의 성인에 번역이 추가되었습니다.")
 
@@ -208,10 +188,11 @@ def main():
     project_root = script_dir.parent
     json_path = project_root / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
     
-    # API 키 확인
-    api_key = load_env_file()
-    if not api_key:
-        print("❌ OPENAI_API_KEY를 찾을 수 없습니다.")
+    # 번역 백엔드 (.env의 TRANSLATION_BACKEND, 기본 openai)
+    try:
+        backend = create_backend()
+    except ValueError as e:
+        print(f"❌ {e}")
         print("   .env 파일에 OPENAI_API_KEY=your_key 형식으로 설정해주세요.")
         sys.exit(1)
     
@@ -219,7 +200,7 @@ def main():
         print(f"❌ JSON 파일을 찾을 수 없습니다: {json_path}")
         sys.exit(1)
     
-    process_saints_file(json_path, api_key)
+    process_saints_file(json_path, backend)
 
 if __name__ == '__main__':
     main()
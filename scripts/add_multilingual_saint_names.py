@@ -4,51 +4,37 @@
 OpenAI API를 사용하여 번역을 생성합니다.
 """
 
-import json
-import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
-import time
-
-# OpenAI API 설정
-import requests
-
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip()
-                break
-    
-    return api_key
-
-# 언어별 번역 함수
-def translate_saint_name(
-    api_key: str,
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+
+from saints import (
+    BATCH_SIZE,
+    BatchItem,
+    ChatError,
+    SaintsStore,
+    TranslationBackend,
+    UpdateJournal,
+    create_backend,
+    group_by_name,
+    translate_batches,
+)
+from saints.memory import TranslationMemory
+
+# 원본 백업 파일 접미사
+BACKUP_SUFFIX = '.json.backup'
+
+# 번역 메모리의 프롬프트 버전 (프롬프트를 바꾸면 올림)
+PROMPT_VERSION = 'multilingual-v1'
+
+# 언어별 번역 요청 메시지
+def build_messages(
     japanese_name: str,
     english_name: str,
-    target_language: str,
-    cache: Dict[str, str] = None
-) -> Optional[str]:
-    """성인 이름을 대상 언어로 번역합니다."""
-    if cache is None:
-        cache = {}
-    
-    # 캐시 확인
-    cache_key = f"{japanese_name}|{english_name}|{target_language}"
-    if cache_key in cache:
-        return cache[cache_key]
-    
+    target_language: str
+) -> List[Dict[str, str]]:
+    """성인 이름 번역 요청 메시지를 만듭니다."""
     # 언어 이름 매핑
     language_names = {
         'ko': '한국어',
@@ -74,72 +60,140 @@ def translate_saint_name(
 
 {language_name} 이름:"""
     
+    return [
+        {
+            'role': 'system',
+            'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 각 언어의 표준 가톨릭 용어를 사용하여 정확하게 번역합니다.'
+        },
+        {
+            'role': 'user',
+            'content': prompt
+        }
+    ]
+
+async def translate_saint_name(
+    backend: TranslationBackend,
+    japanese_name: str,
+    english_name: str,
+    target_language: str
+) -> Optional[str]:
+    """성인 이름을 대상 언어로 번역합니다."""
     try:
-        response = requests.post(
-            'https://api.openai.com/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {api_key}',
-                'Content-Type': 'application/json',
-            },
-            json={
-                'model': 'gpt-4o-mini',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 각 언어의 표준 가톨릭 용어를 사용하여 정확하게 번역합니다.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'temperature': 0.3,
-                'max_tokens': 100,
-            },
-            timeout=30
+        return await backend.complete(
+            build_messages(japanese_name, english_name, target_language),
+            items=((japanese_name, english_name, (target_language,)),)
         )
+    except ChatError as e:
+        print(f"번역 실패 ({target_language}): {e}")
+        return None
+
+# (일본어 이름, 영어 이름, 언어) → 그 번역을 받을 (성인, 필드) 목록
+PendingTranslations = Dict[Tuple[str, str, str], List[Tuple[Dict[str, Any], str]]]
+
+def _collect_missing(
+    saint: Dict[str, Any],
+    languages: list,
+    pending: PendingTranslations,
+    verbose: bool = True
+):
+    """성인 한 명의 누락된 언어를 번역 대기 목록에 추가합니다 (같은 이름은 한 번만 요청)."""
+    japanese_name = saint.get('name', '')
+    english_name = saint.get('nameEn', '')
+    
+    for lang in languages:
+        # 이미 번역이 있으면 건너뛰기 (이전 실행에서 저널에 기록된 번역 포함)
+        lang_key = f'name{lang.capitalize()}'
+        if lang_key in saint and saint[lang_key]:
+            if verbose:
+                print(f"  {lang}: 이미 존재 (건너뜀)")
+            continue
         
-        if response.status_code == 200:
-            data = response.json()
-            translated = data['choices'][0]['message']['content'].strip()
-            
-            # 캐시에 저장
-            cache[cache_key] = translated
+        pending.setdefault((japanese_name, english_name, lang), []).append((saint, lang_key))
+
+async def _translate_pending(
+    backend: TranslationBackend,
+    store: SaintsStore,
+    journal: UpdateJournal,
+    pending: PendingTranslations,
+    memory: TranslationMemory,
+    batch_size: int = BATCH_SIZE
+):
+    """
+    번역 메모리에 없는 이름만 요청을 동시에 보내고, 번역될 때마다 저널에 기록합니다.
+    batch_size가 1보다 크면 여러 성인의 모든 누락 언어를 한 번에 요청하고, 응답에서 빠진 항목만 하나씩 다시 요청합니다.
+    """
+    def apply(japanese_name: str, english_name: str, lang: str, translated: Optional[str]):
+        for saint, lang_key in pending[(japanese_name, english_name, lang)]:
+            if translated:
+                store.update(saint['id'], {lang_key: translated})
+                journal.record(saint['id'], {lang_key: translated})
+                print(f"  {saint.get('name', 'N/A')} {lang}: ✓ {translated}")
+            else:
+                print(f"  {saint.get('name', 'N/A')} {lang}: ✗ 실패")
+    
+    def learn(japanese_name: str, english_name: str, lang: str, translated: Optional[str]):
+        if translated:
+            memory.put(japanese_name, english_name, lang, PROMPT_VERSION, translated)
+        apply(japanese_name, english_name, lang, translated)
+    
+    # 이전에 번역한 이름은 요청하지 않음
+    to_translate = []
+    for key in pending:
+        remembered = memory.get(*key, PROMPT_VERSION)
+        if remembered:
+            apply(*key, remembered)
+        else:
+            to_translate.append(key)
+    print(memory.summary())
+    if not to_translate:
+        return
+    
+    async with backend:
+        async def run(japanese_name: str, english_name: str, lang: str):
+            learn(japanese_name, english_name, lang,
+                  await translate_saint_name(backend, japanese_name, english_name, lang))
+        
+        if batch_size > 1:
+            def fallback(item: BatchItem, lang: str):
+                return translate_saint_name(backend, item.name, item.name_en, lang)
             
-            # API 호출 제한을 위한 딜레이
-            time.sleep(0.1)
+            def on_result(item: BatchItem, lang: str, translated: Optional[str]):
+                learn(item.name, item.name_en, lang, translated)
             
-            return translated
+            batch_stats = await translate_batches(backend, group_by_name(to_translate), fallback, on_result, batch_size)
+            print(f"묶음 요청 {batch_stats['batches']}회로 {batch_stats['batched']}건, 개별 재요청 {batch_stats['fallback']}건")
         else:
-            print(f"API 오류 ({response.status_code}): {response.text[:200]}")
-            return None
-    except Exception as e:
-        print(f"번역 실패 ({target_language}): {e}")
-        return None
+            await asyncio.gather(*(run(*key) for key in to_translate))
+        print(backend.summary())
 
 def process_saints_file(
     file_path: Path,
-    api_key: str,
+    backend: TranslationBackend,
     languages: list = None,
     start_index: int = 0,
-    max_items: int = None
+    max_items: int = None,
+    batch_size: int = BATCH_SIZE
 ):
     """성인 축일 JSON 파일을 처리합니다."""
     if languages is None:
         languages = ['ko', 'zh', 'vi', 'es', 'pt']
     
     print(f"JSON 파일 로드 중: {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = SaintsStore.load(file_path)
+    
+    # 이전 실행에서 저널에 기록된 번역 복구
+    journal, replayed = UpdateJournal.resume(store, 'multilingual', backup_suffix=BACKUP_SUFFIX)
+    if replayed:
+        print(f"이전 실행의 번역 {replayed}건 복구: {journal.path}")
     
-    saints = data.get('saints', [])
-    japanese_saints = data.get('japaneseSaints', [])
+    saints = list(store.iter_list('saints'))
+    japanese_saints = list(store.iter_list('japaneseSaints'))
     
     total_saints = len(saints) + len(japanese_saints)
     print(f"총 {total_saints}개의 성인 항목 발견")
     
-    # 번역 캐시
-    translation_cache = {}
+    # 번역 대기 목록
+    pending: PendingTranslations = {}
     
     # 처리할 항목 수 결정
     items_to_process = saints[start_index:]
@@ -153,35 +207,12 @@ def process_saints_file(
         current_idx = start_index + idx
         print(f"\n[{current_idx + 1}/{len(saints)}] 처리 중: {saint.get('name', 'N/A')}")
         
-        japanese_name = saint.get('name', '')
-        english_name = saint.get('nameEn', '')
-        
-        if not japanese_name:
+        if not saint.get('name', ''):
             print("  경고: 일본어 이름이 없습니다. 건너뜁니다.")
             continue
         
-        # 각 언어로 번역
-        for lang in languages:
-            # 이미 번역이 있으면 건너뛰기
-            lang_key = f'name{lang.capitalize()}'
-            if lang_key in saint and saint[lang_key]:
-                print(f"  {lang}: 이미 존재 (건너뜀)")
-                continue
-            
-            print(f"  {lang} 번역 중...", end=' ', flush=True)
-            translated = translate_saint_name(
-                api_key,
-                japanese_name,
-                english_name,
-                lang,
-                translation_cache
-            )
-            
-            if translated:
-                saint[lang_key] = translated
-                print(f"✓ {translated}")
-            else:
-                print("✗ 실패")
+        # 각 언어로 번역할 항목 수집
+        _collect_missing(saint, languages, pending)
     
     # 일본 성인 목록도 처리
     if japanese_saints:
@@ -189,51 +220,34 @@ def process_saints_file(
         for idx, saint in enumerate(japanese_saints):
             print(f"\n[일본 {idx + 1}/{len(japanese_saints)}] 처리 중: {saint.get('name', 'N/A')}")
             
-            japanese_name = saint.get('name', '')
-            english_name = saint.get('nameEn', '')
-            
-            if not japanese_name:
+            if not saint.get('name', ''):
                 continue
             
-            for lang in languages:
-                lang_key = f'name{lang.capitalize()}'
-                if lang_key in saint and saint[lang_key]:
-                    continue
-                
-                print(f"  {lang} 번역 중...", end=' ', flush=True)
-                translated = translate_saint_name(
-                    api_key,
-                    japanese_name,
-                    english_name,
-                    lang,
-                    translation_cache
-                )
-                
-                if translated:
-                    saint[lang_key] = translated
-                    print(f"✓ {translated}")
-                else:
-                    print("✗ 실패")
+            _collect_missing(saint, languages, pending, verbose=False)
     
-    # 백업 생성
-    backup_path = file_path.with_suffix('.json.backup')
-    print(f"\n백업 생성 중: {backup_path}")
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if pending:
+        print(f"\n번역 요청 {len(pending)}건 ({sum(len(targets) for targets in pending.values())}개 필드) 처리 중...")
+        with TranslationMemory() as memory:
+            asyncio.run(_translate_pending(backend, store, journal, pending, memory, batch_size))
     
-    # 수정된 파일 저장
+    if not journal.path.exists():
+        print("\n추가된 번역이 없습니다.")
+        return
+    
+    # 백업(원본, 한 번만) 후 수정된 파일 저장 (저널 내용을 한 번만 반영)
+    print(f"\n백업 생성 중: {file_path.with_suffix(BACKUP_SUFFIX)}")
     print(f"수정된 파일 저장 중: {file_path}")
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    journal.compact(store, backup_suffix=BACKUP_SUFFIX)
     
     print("\n완료!")
 
 def main():
     """메인 함수"""
-    # API 키 로드
-    api_key = load_env_file()
-    if not api_key:
-        print("OPENAI_API_KEY를 찾을 수 없습니다.")
+    # 번역 백엔드 로드 (.env의 TRANSLATION_BACKEND, 기본 openai)
+    try:
+        backend = create_backend()
+    except ValueError as e:
+        print(e)
         sys.exit(1)
     
     # JSON 파일 경로
@@ -244,20 +258,22 @@ def main():
         print(f"JSON 파일을 찾을 수 없습니다: {json_path}")
         sys.exit(1)
     
-    # 명령줄 인자 처리
+    # 명령줄 인자 처리 ([시작 인덱스] [최대 항목 수] [--no-batch])
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    batch_size = 1 if '--no-batch' in sys.argv[1:] else BATCH_SIZE
     start_index = 0
     max_items = None
     
-    if len(sys.argv) > 1:
+    if len(args) > 0:
         try:
-            start_index = int(sys.argv[1])
+            start_index = int(args[0])
         except ValueError:
             print("시작 인덱스는 숫자여야 합니다.")
             sys.exit(1)
     
-    if len(sys.argv) > 2:
+    if len(args) > 1:
         try:
-            max_items = int(sys.argv[2])
+            max_items = int(args[1])
         except ValueError:
             print("최대 항목 수는 숫자여야 합니다.")
             sys.exit(1)
@@ -266,14 +282,15 @@ def main():
     try:
         process_saints_file(
             json_path,
-            api_key,
+            backend,
             languages=['ko', 'zh', 'vi', 'es', 'pt'],
             start_index=start_index,
-            max_items=max_items
+            max_items=max_items,
+            batch_size=batch_size
         )
     except KeyboardInterrupt:
         print("\n\n사용자에 의해 중단되었습니다.")
-        print("현재까지의 진행 상황이 저장되었습니다.")
+        print("현재까지의 번역은 저널에 기록되어 다시 실행하면 이어서 진행합니다.")
     except Exception as e:
         print(f"\n오류 발생: {e}")
         import traceback
@@ -4,7 +4,6 @@ JSON 파일의 각 날짜별 성인을 ChatGPT와 비교하여 누락된 성인
 """
 
 import json
-import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -12,37 +11,11 @@ from typing import List, Dict, Any, Set
 import requests
 import time
 
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                break
-    
-    return api_key
+from saints import SaintsStore, load_env_file
 
 def get_saints_from_json(json_path: Path, month: int, day: int) -> List[Dict[str, Any]]:
-    """JSON 파일에서 특정 날짜의 성인을 가져옵니다."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
-    
-    saints_for_date = [
-        saint for saint in all_saints
-        if saint.get('month') == month and saint.get('day') == day
-    ]
-    
-    return saints_for_date
+    """JSON 파일에서 특정 날짜의 성인을 가져옵니다 (여러 날짜는 SaintsStore를 직접 사용)."""
+    return SaintsStore.load(json_path).on(month, day)
 
 def ask_chatgpt_for_saints(api_key: str, year: int, month: int, day: int, language_code: str = 'ja') -> List[Dict[str, str]]:
     """ChatGPT에게 특정 날짜의 성인을 물어봅니다."""
@@ -232,9 +205,8 @@ def check_date_range(json_path: Path, api_key: str, start_date: datetime = None,
         print(f"샘플링: 매 {sample_days}일마다 확인")
     print(f"{'='*60}\n")
     
-    # JSON 파일 로드
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # JSON 파일 로드 (한 번만)
+    store = SaintsStore.load(json_path)
     
     all_missing = []
     checked_dates = 0
@@ -248,7 +220,7 @@ def check_date_range(json_path: Path, api_key: str, start_date: datetime = None,
         print(f"[{checked_dates}/{len(dates_to_check)}] {year}년 {month}월 {day}일 확인 중...", end=' ')
         
         # JSON에서 성인 가져오기
-        json_saints = get_saints_from_json(json_path, month, day)
+        json_saints = store.on(month, day)
         
         # ChatGPT에게 물어보기
         chatgpt_saints = ask_chatgpt_for_saints(api_key, year, month, day, 'ja')
@@ -287,23 +259,16 @@ def check_date_range(json_path: Path, api_key: str, start_date: datetime = None,
         print(f"총 {len(all_missing)}명의 누락된 성인을 발견했습니다.")
         print(f"{'='*60}\n")
         
-        # JSON에 추가
-        data['saints'].extend(all_missing)
-        
-        # 월/일 순으로 정렬
-        data['saints'].sort(key=lambda x: (x.get('month', 0), x.get('day', 0)))
+        # JSON의 saints 목록에 추가 (저장 시 월/일 순으로 정렬됨)
+        for saint in all_missing:
+            store.add(saint, 'saints')
         
-        # 백업 생성
+        # 백업 생성 후 JSON 파일 저장
         backup_path = json_path.with_suffix('.json.backup')
-        if not backup_path.exists():
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+        had_backup = backup_path.exists()
+        if store.save(backup_suffix='.json.backup') and not had_backup:
             print(f"백업 파일 생성: {backup_path}")
         
-        # JSON 파일 저장
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
         print(f"✅ {len(all_missing)}명의 성인이 추가되었습니다!")
     else:
         print(f"\n{'='*60}")
@@ -350,7 +315,8 @@ def main():
     year = datetime.now().year
     
     if months_to_check:
-        # 여러 월을 개별적으로 확인
+        # 여러 월을 개별적으로 확인 (JSON 파일은 한 번만 로드)
+        store = SaintsStore.load(json_path)
         all_missing_total = []
         for month in months_to_check:
             # 해당 월의 첫 날과 마지막 날 계산
@@ -369,10 +335,6 @@ def main():
             print(f"{month}월 확인 시작")
             print(f"{'='*60}")
             
-            # JSON 파일 로드 (각 월마다)
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             all_missing = []
             dates_to_check = []
             current = start_date
@@ -390,7 +352,7 @@ def main():
                 print(f"[{checked_dates}/{len(dates_to_check)}] {year_num}년 {month_num}월 {day}일 확인 중...", end=' ')
                 
                 # JSON에서 성인 가져오기
-                json_saints = get_saints_from_json(json_path, month_num, day)
+                json_saints = store.on(month_num, day)
                 
                 # ChatGPT에게 물어보기
                 chatgpt_saints = ask_chatgpt_for_saints(api_key, year_num, month_num, day, 'ja')
@@ -430,27 +392,16 @@ def main():
             print(f"총 {len(all_missing_total)}명의 누락된 성인을 발견했습니다.")
             print(f"{'='*60}\n")
             
-            # JSON 파일 로드
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # JSON에 추가
-            data['saints'].extend(all_missing_total)
+            # JSON의 saints 목록에 추가 (저장 시 월/일 순으로 정렬됨)
+            for saint in all_missing_total:
+                store.add(saint, 'saints')
             
-            # 월/일 순으로 정렬
-            data['saints'].sort(key=lambda x: (x.get('month', 0), x.get('day', 0)))
-            
-            # 백업 생성
+            # 백업 생성 후 JSON 파일 저장
             backup_path = json_path.with_suffix('.json.backup')
-            if not backup_path.exists():
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+            had_backup = backup_path.exists()
+            if store.save(backup_suffix='.json.backup') and not had_backup:
                 print(f"백업 파일 생성: {backup_path}")
             
-            # JSON 파일 저장
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
             print(f"✅ {len(all_missing_total)}명의 성인이 추가되었습니다!")
         else:
             print(f"\n{'='*60}")
@@ -3,18 +3,16 @@
 성인 축일 JSON 파일에서 각 언어별 name 필드가 제대로 추가되어 있는지 확인하는 스크립트
 """
 
-import json
 from pathlib import Path
 from collections import defaultdict
 
+from saints import SaintsStore
+
 def check_saint_names(json_path: Path):
     """성인 이름 필드를 확인합니다."""
     print(f"📖 파일 읽기: {json_path}")
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
+    all_saints = list(SaintsStore.load(json_path))
     total_saints = len(all_saints)
     
     print(f"✅ 총 성인 수: {total_saints}개\n")
@@ -4,44 +4,17 @@
 """
 
 import json
-import os
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
 import requests
 
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                break
-    
-    return api_key
+from saints import SaintsStore, load_env_file
 
 def get_saints_from_json(json_path: Path, month: int, day: int) -> List[Dict[str, Any]]:
-    """JSON 파일에서 특정 날짜의 성인을 가져옵니다."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
-    
-    saints_for_date = [
-        saint for saint in all_saints
-        if saint.get('month') == month and saint.get('day') == day
-    ]
-    
-    return saints_for_date
+    """JSON 파일에서 특정 날짜의 성인을 가져옵니다 (여러 날짜는 SaintsStore를 직접 사용)."""
+    return SaintsStore.load(json_path).on(month, day)
 
 def ask_chatgpt_for_saints(api_key: str, year: int, month: int, day: int, language_code: str = 'ko') -> List[Dict[str, str]]:
     """ChatGPT에게 특정 날짜의 성인을 물어봅니다."""
@@ -4,11 +4,12 @@
 더 정교한 이름 매칭으로 빠진 항목 찾기
 """
 
-import json
 import re
+from pathlib import Path
 from urllib.request import urlopen
 from html.parser import HTMLParser
-from collections import defaultdict
+
+from saints import ID_KEY, NameIndex, NameMatcher, SaintsStore
 
 BASE_URL = "https://www.pauline.or.jp/calendariosanti/saint365.php?id="
 MONTHS = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
@@ -71,74 +72,16 @@ def crawl_month(month_code):
         print(f"Error crawling {month_code}: {e}")
         return []
 
-def extract_core_name(name):
-    """이름에서 핵심 부분만 추출 (비교용)"""
-    # 괄호 내용 제거
-    core = re.sub(r'[（(].*?[）)]', '', name)
-    # 특수문자 제거
-    core = re.sub(r'[／/・]', '', core)
-    # 공백 제거
-    core = core.replace(" ", "").replace("　", "")
-    # "聖" 제거
-    core = core.replace("聖", "")
-    # 일반적인 접미사 제거
-    suffixes = ["司教", "司祭", "修道女", "修道者", "おとめ", "殉教者", "教皇", "大司教", "教会博士", "使徒", "福音記者"]
-    for suffix in suffixes:
-        core = core.replace(suffix, "")
-    return core.strip()
-
-def names_match(name1, name2):
-    """두 이름이 같은 성인을 가리키는지 확인"""
-    core1 = extract_core_name(name1)
-    core2 = extract_core_name(name2)
-    
-    # 정확히 일치
-    if core1 == core2:
-        return True
-    
-    # 한쪽이 다른 쪽을 포함
-    if len(core1) > 3 and len(core2) > 3:
-        if core1 in core2 or core2 in core1:
-            return True
-    
-    # 주요 단어가 일치하는지 확인 (2글자 이상)
-    if len(core1) >= 2 and len(core2) >= 2:
-        # 공통 부분 찾기
-        common = ""
-        for i in range(min(len(core1), len(core2))):
-            if core1[i] == core2[i]:
-                common += core1[i]
-            else:
-                break
-        if len(common) >= 3:  # 최소 3글자 이상 공통
-            return True
-    
-    return False
-
-def find_missing_saints(crawled, existing, month):
+def find_missing_saints(crawled, store, matcher, month):
     """크롤링한 데이터와 기존 JSON 비교하여 빠진 항목 찾기"""
-    existing_by_day = defaultdict(list)
-    for saint in existing.get("saints", []):
-        if saint["month"] == month:
-            existing_by_day[saint["day"]].append(saint["name"])
-    
-    for saint in existing.get("japaneseSaints", []):
-        if saint["month"] == month:
-            existing_by_day[saint["day"]].append(saint["name"])
-    
     missing = []
     for saint in crawled:
         day = saint["day"]
         name = saint["name"]
         
         # 해당 날짜에 같은 성인이 있는지 확인
-        found = False
-        for existing_name in existing_by_day[day]:
-            if names_match(name, existing_name):
-                found = True
-                break
-        
-        if not found:
+        existing_ids = [s.get(ID_KEY) for s in store.on(month, day)]
+        if matcher.best(name, existing_ids) is None:
             missing.append({
                 "month": month,
                 "day": day,
@@ -233,8 +176,8 @@ def generate_name_en(japanese_name):
 
 def main():
     print("JSON 파일 로드 중...")
-    with open(JSON_FILE, 'r', encoding='utf-8') as f:
-        existing_data = json.load(f)
+    store = SaintsStore.load(Path(JSON_FILE))
+    matcher = NameMatcher(NameIndex.for_store(store))
     
     all_missing = []
     
@@ -243,7 +186,7 @@ def main():
         crawled = crawl_month(month_code)
         print(f"  크롤링된 항목: {len(crawled)}개")
         
-        missing = find_missing_saints(crawled, existing_data, i)
+        missing = find_missing_saints(crawled, store, matcher, i)
         if missing:
             print(f"  빠진 항목: {len(missing)}개")
             for m in missing[:5]:  # 처음 5개만 출력
@@ -262,14 +205,10 @@ def main():
                 missing["day"],
                 missing["name"]
             )
-            existing_data["saints"].append(new_entry)
-        
-        # 월/일 순으로 정렬
-        existing_data["saints"].sort(key=lambda x: (x["month"], x["day"]))
+            store.add(new_entry)
         
-        # JSON 파일 저장
-        with open(JSON_FILE, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, ensure_ascii=False, indent=2)
+        # JSON 파일 저장 (날짜 항목별로 저장되므로 별도 정렬 불필요)
+        store.save()
         
         print(f"✅ {len(all_missing)}개 항목이 추가되었습니다!")
     else:
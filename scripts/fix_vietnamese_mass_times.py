@@ -2,10 +2,17 @@
 """
 massTime 텍스트에 있는 베트ナム어 미사를 foreignMassTimes에 추가하는 스크립트
 """
-import json
 import os
 import re
-from typing import Dict, List, Any
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from massparse import PARISHES_DIR, ParishManifest, iter_parish_files, process_parish_file, source_digest
+from massparse.schedule import MassSlot, Schedule, week_mask_from_note
+
+# 매니페스트 패스 ID (스크립트가 바뀌면 전체 재처리)
+PASS_ID = f'fix_vietnamese:{source_digest(Path(__file__))}'
 
 # 요일 매핑
 WEEKDAY_MAP = {
@@ -19,11 +26,16 @@ WEEKDAY_MAP = {
     '主日': 'sunday',
 }
 
-def extract_vietnamese_masses(mass_time_str: str) -> Dict[str, List[Dict[str, str]]]:
+def _vietnamese_slot(weekday: str, time_str: str, note: str = '') -> MassSlot:
+    """베트남어 미사 MassSlot"""
+    return MassSlot(weekday, time_str, 'VI', week_mask_from_note(note), note)
+
+
+def extract_vietnamese_masses(mass_time_str: str) -> List[MassSlot]:
     """
     massTime 텍스트에서 베트ナム어 미사 정보 추출
     """
-    result: Dict[str, List[Dict[str, str]]] = {}
+    result: List[MassSlot] = []
     
     if not mass_time_str or 'ベトナム語' not in mass_time_str:
         return result
@@ -56,25 +68,13 @@ def extract_vietnamese_masses(mass_time_str: str) -> Dict[str, List[Dict[str, st
         # 첫 번째 시간
         weekday_key = WEEKDAY_MAP.get(weekday1_ja)
         if weekday_key:
-            if weekday_key not in result:
-                result[weekday_key] = []
-            result[weekday_key].append({
-                "time": time1,
-                "language": "VI",
-                "note": ""
-            })
+            result.append(_vietnamese_slot(weekday_key, time1))
         
         # 두 번째 시간 (있는 경우)
         if weekday2_ja and time2:
             weekday_key = WEEKDAY_MAP.get(weekday2_ja)
             if weekday_key:
-                if weekday_key not in result:
-                    result[weekday_key] = []
-                result[weekday_key].append({
-                    "time": time2,
-                    "language": "VI",
-                    "note": ""
-                })
+                result.append(_vietnamese_slot(weekday_key, time2))
     
     # 패턴 2: "第X日曜XX:XX(ベトナム語)" 처리
     pattern2_matches = re.finditer(r'第(\d+)[・]?第?(\d*)[日主]曜[：:]?\s*(\d{1,2}:\d{2})\s*\(ベトナム語', mass_time_str)
@@ -87,13 +87,7 @@ def extract_vietnamese_masses(mass_time_str: str) -> Dict[str, List[Dict[str, st
         if week2:
             note = f"第{week1}・第{week2}日曜"
         
-        if 'sunday' not in result:
-            result['sunday'] = []
-        result['sunday'].append({
-            "time": time_str,
-            "language": "VI",
-            "note": note
-        })
+        result.append(_vietnamese_slot('sunday', time_str, note))
     
     # 패턴 3: 일반적인 "XX:XX(ベトナム語)" 처리 (다른 패턴에 매칭되지 않은 경우)
     if not result:  # 다른 패턴에 매칭되지 않은 경우만
@@ -109,13 +103,7 @@ def extract_vietnamese_masses(mass_time_str: str) -> Dict[str, List[Dict[str, st
                     break
             
             if weekday_key:
-                if weekday_key not in result:
-                    result[weekday_key] = []
-                result[weekday_key].append({
-                    "time": time_str,
-                    "language": "VI",
-                    "note": ""
-                })
+                result.append(_vietnamese_slot(weekday_key, time_str))
     
     return result
 
@@ -137,64 +125,53 @@ def process_parish(parish: Dict[str, Any]) -> bool:
     if not vietnamese_masses:
         return False
     
-    # foreignMassTimes 객체가 없으면 생성
-    if 'foreignMassTimes' not in parish or not parish['foreignMassTimes']:
-        parish['foreignMassTimes'] = {}
+    # 기존 foreignMassTimes를 IR로 읽어 추가
+    schedule = Schedule.from_parish(parish)
     
-    foreign_mass_times = parish['foreignMassTimes']
+    # 각 요일에 베트ナム어 미사 추가 (같은 요일·시간의 베트남어 미사가 있으면 건너뜀)
+    for slot in vietnamese_masses:
+        if not schedule.has_time(slot.weekday, slot.time_text, 'VI'):
+            schedule.add(slot)
+            changed = True
     
-    # 각 요일에 베트ナム어 미사 추가
-    for weekday, masses in vietnamese_masses.items():
-        if weekday not in foreign_mass_times:
-            foreign_mass_times[weekday] = []
-        
-        for mass in masses:
-            # 중복 확인
-            exists = any(
-                existing.get('time') == mass['time'] and 
-                existing.get('language') == 'VI'
-                for existing in foreign_mass_times[weekday]
-            )
-            
-            if not exists:
-                foreign_mass_times[weekday].append(mass)
-                changed = True
+    if changed:
+        parish['foreignMassTimes'] = schedule.foreign_mass_times_json()
     
     return changed
 
 
-def process_file(file_path: str) -> int:
+def process_file(
+    file_path: str,
+    manifest: Optional[ParishManifest] = None,
+    changed_only: bool = False,
+) -> int:
     """
     파일을 처리하여 변경된 성당 수 반환
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    changed_count = 0
-    parishes = data.get('parishes', [])
-    
-    for parish in parishes:
-        if process_parish(parish):
-            changed_count += 1
+    changed_count, _ = process_parish_file(
+        Path(file_path), passes=(process_parish,), backup_suffix=None,
+        manifest=manifest, pass_id=PASS_ID, changed_only=changed_only)
     
     if changed_count > 0:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"{os.path.basename(file_path)}: {changed_count}개 성당 업데이트")
     
     return changed_count
 
 
 def main():
-    """모든 성당 파일 처리"""
-    parishes_dir = 'assets/data/parishes'
+    """
+    모든 성당 파일 처리
+    --changed-only: 마지막 실행 이후 massTime이 바뀐 성당만 처리
+    """
+    changed_only = '--changed-only' in sys.argv
+    manifest = ParishManifest()
     total_changed = 0
     
-    for filename in os.listdir(parishes_dir):
-        if filename.endswith('.json') and filename != 'dioceses.json':
-            file_path = os.path.join(parishes_dir, filename)
-            changed = process_file(file_path)
-            total_changed += changed
+    for file_path in iter_parish_files(PARISHES_DIR):
+        changed = process_file(str(file_path), manifest, changed_only)
+        total_changed += changed
+    
+    manifest.save()
     
     print(f"\n총 {total_changed}개 성당 업데이트 완료")
 
@@ -3,10 +3,17 @@
 "第X曜日" 형식의 미사 시간을 해당 요일로 이동하고 시간 옆에 괄호로 주차 정보 추가
 예: "第1金曜日：10:00" → friday 배열에 "10:00(第1週)" 추가
 """
-import json
-import re
 import os
-from typing import Dict, List, Any
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from massparse import PARISHES_DIR, ParishManifest, iter_parish_files, process_parish_file, source_digest
+from massparse.schedule import MassSlot, Schedule, week_mask_from_numbers
+
+# 매니페스트 패스 ID (스크립트가 바뀌면 전체 재처리)
+PASS_ID = f'fix_weekday:{source_digest(Path(__file__))}'
 
 # 요일 매핑
 WEEKDAY_MAP = {
@@ -20,12 +27,12 @@ WEEKDAY_MAP = {
     '主日': 'sunday',
 }
 
-def parse_weekday_mass_time(mass_time_str: str) -> Dict[str, List[str]]:
+def parse_weekday_mass_time(mass_time_str: str) -> List[MassSlot]:
     """
-    "第X曜日：시간" 패턴을 파싱하여 {요일: [시간(주차정보)]} 형태로 반환
-    "第1・第3" 같은 경우는 각각 분리하여 추가
+    "第X曜日：시간" 패턴을 파싱하여 주차가 지정된 MassSlot 목록으로 반환
+    "第1・第3" 같은 경우는 각각 분리하여 추가 (직렬화 시 "10:00(第1週)")
     """
-    result: Dict[str, List[str]] = {}
+    result: Dict[MassSlot, None] = {}
     
     # "第X曜日：시간" 패턴 찾기 (복합 패턴 지원)
     # 예: "第1金曜日：10:00", "第2・第4日曜：14:30", "第1・第3日曜14:00"
@@ -80,18 +87,12 @@ def parse_weekday_mass_time(mass_time_str: str) -> Dict[str, List[str]]:
                     if num_match:
                         week_numbers.append(num_match.group(1))
                 
-                # 각 주차별로 시간 추가
-                for week_num in week_numbers:
-                    week_str = f"第{week_num}週"
-                    time_with_week = f"{time_str}({week_str})"
-                    
-                    if weekday_key not in result:
-                        result[weekday_key] = []
-                    
-                    if time_with_week not in result[weekday_key]:
-                        result[weekday_key].append(time_with_week)
+                # 주차는 비트마스크 하나로 (직렬화 시 주차별 "10:00(第1週)")
+                if week_numbers:
+                    slot = MassSlot(weekday_key, time_str, week_mask=week_mask_from_numbers(week_numbers))
+                    result.setdefault(slot, None)
     
-    return result
+    return list(result)
 
 
 def process_parish(parish: Dict[str, Any]) -> bool:
@@ -106,62 +107,57 @@ def process_parish(parish: Dict[str, Any]) -> bool:
         return False
     
     # "第X曜日" 패턴 찾기
-    weekday_times = parse_weekday_mass_time(mass_time_str)
+    weekday_slots = parse_weekday_mass_time(mass_time_str)
     
-    if not weekday_times:
+    if not weekday_slots:
         return False
     
-    # massTimes 객체가 없으면 생성
-    if 'massTimes' not in parish or not parish['massTimes']:
-        parish['massTimes'] = {}
-    
-    mass_times = parish['massTimes']
+    # 기존 massTimes를 IR로 읽어 집합 단위로 추가
+    schedule = Schedule.from_parish(parish)
+    for slot in weekday_slots:
+        schedule.add(slot)
     
-    # 각 요일에 시간 추가
-    for weekday, times in weekday_times.items():
-        if weekday not in mass_times:
-            mass_times[weekday] = []
-        
-        for time_with_week in times:
-            if time_with_week not in mass_times[weekday]:
-                mass_times[weekday].append(time_with_week)
-                changed = True
+    # 주차별 항목이 이미 있으면 직렬화 결과가 같으므로 변경 없음
+    mass_times = schedule.mass_times_json()
+    if mass_times != parish.get('massTimes'):
+        parish['massTimes'] = mass_times
+        changed = True
     
     return changed
 
 
-def process_file(file_path: str) -> int:
+def process_file(
+    file_path: str,
+    manifest: Optional[ParishManifest] = None,
+    changed_only: bool = False,
+) -> int:
     """
     파일을 처리하여 변경된 성당 수 반환
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    changed_count = 0
-    parishes = data.get('parishes', [])
-    
-    for parish in parishes:
-        if process_parish(parish):
-            changed_count += 1
+    changed_count, _ = process_parish_file(
+        Path(file_path), passes=(process_parish,), backup_suffix=None,
+        manifest=manifest, pass_id=PASS_ID, changed_only=changed_only)
     
     if changed_count > 0:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"{os.path.basename(file_path)}: {changed_count}개 성당 업데이트")
     
     return changed_count
 
 
 def main():
-    """모든 성당 파일 처리"""
-    parishes_dir = 'assets/data/parishes'
+    """
+    모든 성당 파일 처리
+    --changed-only: 마지막 실행 이후 massTime이 바뀐 성당만 처리
+    """
+    changed_only = '--changed-only' in sys.argv
+    manifest = ParishManifest()
     total_changed = 0
     
-    for filename in os.listdir(parishes_dir):
-        if filename.endswith('.json') and filename != 'dioceses.json':
-            file_path = os.path.join(parishes_dir, filename)
-            changed = process_file(file_path)
-            total_changed += changed
+    for file_path in iter_parish_files(PARISHES_DIR):
+        changed = process_file(str(file_path), manifest, changed_only)
+        total_changed += changed
+    
+    manifest.save()
     
     print(f"\n총 {total_changed}개 성당 업데이트 완료")
 
@@ -0,0 +1,65 @@
+"""
+미사 시간(massTime) 파싱 패키지
+규칙 테이블(rules) 하나를 공유하고 parse()를 단일 진입점으로 제공
+날짜별 미사 색인은 python -m massparse.index로도 실행하므로 다시 내보내지 않음: from massparse.index import MassIndex
+"""
+
+from .cache import PARSE_CACHE_PATH, PARSER_VERSION, ParseCache
+from .manifest import MANIFEST_PATH, ParishManifest, source_digest
+from .parallel import FileResult, RunSummary, jobs_from_argv, regenerate_files, summarize
+from .parser import (
+    detect_language,
+    is_foreign_language,
+    parse,
+    parse_individual_weekdays,
+    parse_schedule,
+    parse_weekday,
+)
+from .regenerate import (
+    PARISHES_DIR,
+    REGENERATE_PASS_ID,
+    iter_parish_files,
+    process_parish_file,
+    regenerate_parish,
+)
+from .rules import LANGUAGE_PATTERNS, WEEKDAY_MAP
+from .schedule import MassSlot, Schedule, masses_on, week_bit, week_mask_from_note
+from .stream import MissingParishesError, iter_parishes, rewrite_parish_file
+from .tokenizer import Token, tokenize
+
+__all__ = [
+    'FileResult',
+    'LANGUAGE_PATTERNS',
+    'MANIFEST_PATH',
+    'MassSlot',
+    'MissingParishesError',
+    'PARISHES_DIR',
+    'PARSER_VERSION',
+    'PARSE_CACHE_PATH',
+    'ParishManifest',
+    'ParseCache',
+    'REGENERATE_PASS_ID',
+    'RunSummary',
+    'Schedule',
+    'Token',
+    'WEEKDAY_MAP',
+    'detect_language',
+    'is_foreign_language',
+    'iter_parish_files',
+    'iter_parishes',
+    'jobs_from_argv',
+    'masses_on',
+    'parse',
+    'parse_individual_weekdays',
+    'parse_schedule',
+    'parse_weekday',
+    'process_parish_file',
+    'regenerate_files',
+    'regenerate_parish',
+    'rewrite_parish_file',
+    'source_digest',
+    'summarize',
+    'tokenize',
+    'week_bit',
+    'week_mask_from_note',
+]
@@ -0,0 +1,69 @@
+"""
+python -m massparse [--changed-only] [--jobs N] [교회 데이터 디렉토리]
+모든 교구 파일의 massTimes/foreignMassTimes를 massTime 기준으로 재생성
+--changed-only: 마지막 실행 이후 massTime이 바뀐 성당만 처리
+--jobs N: 교구 파일을 N개 프로세스로 병렬 처리 (0이면 CPU 코어 수)
+"""
+
+import sys
+from pathlib import Path
+
+from .cache import ParseCache
+from .manifest import ParishManifest
+from .parallel import jobs_from_argv, regenerate_files, summarize
+from .regenerate import PARISHES_DIR, iter_parish_files
+
+
+def _positional_args(argv):
+    """옵션과 옵션 값을 제외한 인자"""
+    args = []
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg == '--jobs':
+            skip_next = True
+        elif not arg.startswith('--'):
+            args.append(arg)
+    return args
+
+
+def main():
+    """메인 함수"""
+    args = _positional_args(sys.argv[1:])
+    changed_only = '--changed-only' in sys.argv
+    jobs = jobs_from_argv(sys.argv)
+    parishes_dir = Path(args[0]) if args else PARISHES_DIR
+
+    if not parishes_dir.exists():
+        print(f"❌ 디렉토리를 찾을 수 없습니다: {parishes_dir}")
+        return
+
+    cache = ParseCache()
+    manifest = ParishManifest()
+    results = regenerate_files(
+        iter_parish_files(parishes_dir), jobs=jobs, cache=cache,
+        manifest=manifest, changed_only=changed_only)
+
+    for result in results:
+        if result.error is not None:
+            print(f"  ❌ 오류: {result.file_path.name}: {result.error}")
+        elif result.modified:
+            print(f"  ✅ {result.file_path.name}: {result.modified}/{result.total}개 성당 업데이트")
+        else:
+            print(f"  ℹ️  {result.file_path.name}: 변경사항 없음 ({result.total}개 성당)")
+
+    cache.save()
+    manifest.save()
+
+    summary = summarize(results)
+    print(f"\n{'='*70}")
+    print(f"✅ 완료: {summary.modified}/{summary.total}개 성당 업데이트")
+    if summary.failed_files:
+        print(f"❌ 실패: {summary.failed_files}개 파일")
+    print(f"ℹ️  {cache.summary()}")
+    print(f"{'='*70}")
+
+
+if __name__ == '__main__':
+    main()
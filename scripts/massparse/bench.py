@@ -0,0 +1,171 @@
+"""
+massTime 파서 벤치마크 및 골든 스냅샷 비교
+assets/data/parishes의 실제 massTime 문자열 전체를 대상으로
+처리량(parses/sec), 파싱당 메모리 할당량, 빈 결과 비율을 측정하고
+golden/mass_times.json과 파싱 결과를 비교
+
+python -m massparse.bench [--repeat N] [--update-golden]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .parser import parse
+from .regenerate import PARISHES_DIR, iter_parish_files
+from .stream import iter_parishes
+
+# 골든 스냅샷 위치 (massTime → parse() 결과)
+GOLDEN_PATH = Path(__file__).parent / 'golden' / 'mass_times.json'
+
+
+class BenchResult(NamedTuple):
+    """벤치마크 결과"""
+    strings: int               # massTime 문자열 수 (중복 포함)
+    unique_strings: int        # 고유 문자열 수
+    parses_per_sec: float
+    bytes_per_parse: float     # 파싱 한 번에 할당되는 메모리 (peak 기준 평균)
+    empty_share: float         # massTimes/foreignMassTimes가 모두 빈 결과의 비율
+
+
+def load_corpus(parishes_dir: Path = PARISHES_DIR) -> List[str]:
+    """교구 파일의 massTime 문자열 전체 (파일·성당 순서, 중복 포함)"""
+    corpus = []
+    for file_path in iter_parish_files(parishes_dir):
+        for parish in iter_parishes(file_path):
+            mass_time = parish.get('massTime')
+            if mass_time:
+                corpus.append(mass_time)
+    return corpus
+
+
+def is_empty_result(parsed: Dict[str, Any]) -> bool:
+    """massTimes/foreignMassTimes에 미사가 하나도 없는지 확인"""
+    return not any(parsed['massTimes'].values()) and not any(parsed['foreignMassTimes'].values())
+
+
+def measure(corpus: List[str], repeat: int = 5) -> BenchResult:
+    """처리량, 메모리 할당량, 빈 결과 비율 측정"""
+    # 처리량 (캐시 없이 parse() 직접 호출)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for mass_time in corpus:
+            parse(mass_time)
+    elapsed = time.perf_counter() - start
+    parses_per_sec = (len(corpus) * repeat / elapsed) if elapsed else 0.0
+
+    # 파싱당 할당량 (tracemalloc peak, 처리량 측정과 분리)
+    tracemalloc.start()
+    try:
+        total_bytes = 0
+        for mass_time in corpus:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            parse(mass_time)
+            _, peak = tracemalloc.get_traced_memory()
+            total_bytes += peak - base
+    finally:
+        tracemalloc.stop()
+
+    empty_count = sum(1 for mass_time in corpus if is_empty_result(parse(mass_time)))
+
+    return BenchResult(
+        strings=len(corpus),
+        unique_strings=len(set(corpus)),
+        parses_per_sec=parses_per_sec,
+        bytes_per_parse=(total_bytes / len(corpus)) if corpus else 0.0,
+        empty_share=(empty_count / len(corpus)) if corpus else 0.0,
+    )
+
+
+def snapshot(corpus: List[str]) -> Dict[str, Any]:
+    """고유 massTime 문자열 → parse() 결과 (키 정렬)"""
+    return {mass_time: parse(mass_time) for mass_time in sorted(set(corpus))}
+
+
+def load_golden(path: Path = GOLDEN_PATH) -> Optional[Dict[str, Any]]:
+    """골든 스냅샷 로드 (없으면 None)"""
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_golden(current: Dict[str, Any], path: Path = GOLDEN_PATH):
+    """골든 스냅샷 저장"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(current, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+class GoldenDiff(NamedTuple):
+    """골든 스냅샷과의 차이"""
+    changed: List[str]   # 결과가 달라진 massTime
+    added: List[str]     # 스냅샷에 없던 massTime
+    removed: List[str]   # 데이터에서 사라진 massTime
+
+
+def diff_golden(golden: Dict[str, Any], current: Dict[str, Any]) -> GoldenDiff:
+    """골든 스냅샷과 현재 결과 비교"""
+    return GoldenDiff(
+        changed=[key for key in current if key in golden and golden[key] != current[key]],
+        added=[key for key in current if key not in golden],
+        removed=[key for key in golden if key not in current],
+    )
+
+
+def main():
+    """
+    메인 함수
+    --repeat N: 처리량 측정 반복 횟수 (기본 5)
+    --update-golden: 현재 결과로 골든 스냅샷 갱신
+    골든 스냅샷과 결과가 다르면 종료 코드 1
+    """
+    repeat = 5
+    for i, arg in enumerate(sys.argv):
+        if arg == '--repeat' and i + 1 < len(sys.argv):
+            repeat = int(sys.argv[i + 1])
+    update_golden = '--update-golden' in sys.argv
+
+    corpus = load_corpus()
+    result = measure(corpus, repeat)
+
+    print(f"{'='*70}")
+    print(f"massTime 문자열: {result.strings}개 (고유 {result.unique_strings}개)")
+    print(f"처리량: {result.parses_per_sec:,.0f} parses/sec")
+    print(f"파싱당 할당: {result.bytes_per_parse:,.0f} bytes")
+    print(f"빈 결과: {result.empty_share * 100:.1f}%")
+    print(f"{'='*70}")
+
+    current = snapshot(corpus)
+    golden = load_golden()
+
+    if update_golden or golden is None:
+        save_golden(current)
+        print(f"✅ 골든 스냅샷 저장: {GOLDEN_PATH} ({len(current)}개)")
+        return
+
+    diff = diff_golden(golden, current)
+    if not diff.changed:
+        print(f"✅ 골든 스냅샷과 일치 ({len(current)}개)")
+        if diff.added or diff.removed:
+            print(f"ℹ️  데이터 변경: 추가 {len(diff.added)}개, 삭제 {len(diff.removed)}개 "
+                  f"(--update-golden으로 갱신)")
+        return
+
+    print(f"❌ 골든 스냅샷과 다른 결과: {len(diff.changed)}개")
+    for mass_time in diff.changed[:10]:
+        print(f"\n  {mass_time}")
+        print(f"    golden:  {json.dumps(golden[mass_time], ensure_ascii=False)}")
+        print(f"    current: {json.dumps(current[mass_time], ensure_ascii=False)}")
+    if len(diff.changed) > 10:
+        print(f"\n  ... 외 {len(diff.changed) - 10}개")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+massTime 파싱 결과의 디스크 캐시
+키는 정규화된 massTime 문자열의 해시, 파서 버전(규칙/파서/직렬화 소스 해시)이 바뀌면 전체 무효화
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .parser import parse
+
+# 기본 캐시 파일 위치
+PARSE_CACHE_PATH = Path(__file__).parent / '.cache' / 'parse_cache.json'
+
+# 파싱 결과에 영향을 주는 모듈
+_VERSIONED_SOURCES = ('rules.py', 'tokenizer.py', 'parser.py', 'schedule.py')
+
+
+def _compute_parser_version() -> str:
+    """규칙 테이블과 파서 소스의 해시"""
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).parent
+    for name in _VERSIONED_SOURCES:
+        digest.update(name.encode('utf-8'))
+        digest.update((package_dir / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+PARSER_VERSION = _compute_parser_version()
+
+
+def normalize_mass_time(mass_time_str: str) -> str:
+    """캐시 키용 정규화 (파싱 결과가 달라지지 않는 범위에서 앞뒤 공백만 제거)"""
+    return mass_time_str.strip()
+
+
+def mass_time_key(mass_time_str: str) -> str:
+    """정규화된 massTime 문자열의 해시 키"""
+    return hashlib.sha1(normalize_mass_time(mass_time_str).encode('utf-8')).hexdigest()
+
+
+def _copy_parsed(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """캐시 항목이 호출자 쪽 수정으로 오염되지 않도록 복사"""
+    return {
+        'massTimes': {day: list(times) for day, times in parsed['massTimes'].items()},
+        'foreignMassTimes': {
+            day: [dict(entry) for entry in entries]
+            for day, entries in parsed['foreignMassTimes'].items()
+        },
+    }
+
+
+class ParseCache:
+    """massTime → parse() 결과 캐시"""
+
+    def __init__(self, path: Optional[Path] = PARSE_CACHE_PATH):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # 이번 실행에서 새로 추가된 항목 (병렬 작업 결과 병합용)
+        self.added: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if path is not None:
+            self._load()
+
+    def _load(self):
+        """캐시 파일 로드 (파서 버전이 다르거나 손상된 경우 빈 캐시로 시작)"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == PARSER_VERSION:
+            self.entries = data.get('entries', {})
+
+    def parse(self, mass_time_str: str) -> Dict[str, Any]:
+        """캐시에 있으면 그대로, 없으면 파싱 후 저장"""
+        key = mass_time_key(mass_time_str)
+        cached = self.entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            return _copy_parsed(cached)
+
+        self.misses += 1
+        parsed = parse(mass_time_str)
+        self.entries[key] = self.added[key] = _copy_parsed(parsed)
+        self._dirty = True
+        return parsed
+
+    def merge(self, entries: Dict[str, Dict[str, Any]], hits: int = 0, misses: int = 0):
+        """다른 프로세스에서 추가된 항목과 적중 통계 병합"""
+        if entries:
+            self.entries.update(entries)
+            self._dirty = True
+        self.hits += hits
+        self.misses += misses
+
+    def save(self):
+        """변경된 경우에만 임시 파일에 쓴 뒤 교체"""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': PARSER_VERSION, 'entries': self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def summary(self) -> str:
+        """적중률 요약 문자열"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return f"캐시 적중 {self.hits}/{total} ({rate:.1f}%), 새로 파싱 {self.misses}"
@@ -0,0 +1,290 @@
+"""
+전체 성당 미사 일정의 열(column) 지향 인덱스
+(parish_id, weekday, minute, lang, week_mask)를 타입 배열로 보관하고 요일별로 정렬하여
+"특정 날짜·시간대·언어에 미사가 있는 성당" 조회를 JSON 로드 없이 정수 연산으로 처리
+
+python -m massparse.index [출력 경로]
+"""
+
+import json
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .regenerate import PARISHES_DIR, iter_parish_files
+from .schedule import WEEKDAY_KEYS, Schedule, week_bit
+
+# 기본 출력 경로
+INDEX_PATH = PARISHES_DIR / 'mass_index.bin'
+
+INDEX_MAGIC = b'MIDX'
+INDEX_VERSION = 1
+
+# 요일 코드: 0=월 ~ 6=일 (date.weekday()와 동일), 7=기타
+WEEKDAY_CODES = {key: code for code, key in enumerate(WEEKDAY_KEYS)}
+OTHER_WEEKDAY = len(WEEKDAY_KEYS)
+WEEKDAY_COUNT = OTHER_WEEKDAY + 1
+
+# 시간이 없는 미사의 minute 값
+NO_MINUTE = 0xFFFF
+
+# 일본어(massTimes) 미사의 언어 코드
+JAPANESE = 'JA'
+
+_HEADER = struct.Struct('<4sHHII')
+_STRING_LENGTH = struct.Struct('<H')
+
+
+class MassRow(NamedTuple):
+    """인덱스 행 하나"""
+    parish_id: int
+    weekday: int
+    minute: int
+    lang: str
+    week_mask: int
+
+
+class MassIndex:
+    """
+    열 지향 미사 인덱스
+    행은 (weekday, minute, parish_id) 순으로 정렬되어 있고,
+    weekday_offsets[w]:weekday_offsets[w + 1]이 요일 w의 행 범위
+    """
+
+    def __init__(self):
+        self.parishes: List[Tuple[str, str]] = []  # parish_id → (교구, 성당 이름)
+        self.languages: List[str] = [JAPANESE]     # lang 코드 → 언어
+        self.parish_ids = array('H')
+        self.weekdays = array('B')
+        self.minutes = array('H')
+        self.langs = array('B')
+        self.week_masks = array('B')
+        self.weekday_offsets = array('I', [0] * (WEEKDAY_COUNT + 1))
+
+    def __len__(self):
+        return len(self.parish_ids)
+
+    def __eq__(self, other):
+        return isinstance(other, MassIndex) and self._state() == other._state()
+
+    def _state(self):
+        return (self.parishes, self.languages, self.parish_ids, self.weekdays,
+                self.minutes, self.langs, self.week_masks, self.weekday_offsets)
+
+    # ----- 생성 -----
+
+    @classmethod
+    def build(cls, parishes_dir: Path = PARISHES_DIR) -> 'MassIndex':
+        """교구 파일의 massTimes/foreignMassTimes에서 인덱스 생성"""
+        index = cls()
+        lang_codes: Dict[str, int] = {JAPANESE: 0}
+        rows: List[Tuple[int, int, int, int, int]] = []
+
+        for file_path in iter_parish_files(parishes_dir):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            diocese = data.get('diocese', file_path.stem)
+            for parish in data.get('parishes', []):
+                parish_id = len(index.parishes)
+                index.parishes.append((diocese, parish.get('name', '')))
+                for slot in Schedule.from_parish(parish):
+                    lang = slot.lang if slot.lang is not None else JAPANESE
+                    if lang not in lang_codes:
+                        lang_codes[lang] = len(lang_codes)
+                        index.languages.append(lang)
+                    minute = slot.minute_of_day if slot.minute_of_day is not None else NO_MINUTE
+                    # 저장된 데이터에 남아 있는 "weekdays"는 월~금으로 펼침
+                    if slot.weekday == 'weekdays':
+                        weekday_codes = range(5)
+                    else:
+                        weekday_codes = (WEEKDAY_CODES.get(slot.weekday, OTHER_WEEKDAY),)
+                    for weekday in weekday_codes:
+                        rows.append((weekday, minute, parish_id, lang_codes[lang], slot.week_mask))
+
+        if len(index.parishes) > 0xFFFF:
+            raise ValueError(f"성당 수가 너무 많습니다: {len(index.parishes)}")
+
+        rows.sort()
+        for weekday, minute, parish_id, lang, week_mask in rows:
+            index.weekdays.append(weekday)
+            index.minutes.append(minute)
+            index.parish_ids.append(parish_id)
+            index.langs.append(lang)
+            index.week_masks.append(week_mask)
+        index._compute_offsets()
+        return index
+
+    def _compute_offsets(self):
+        """요일별 행 범위 계산"""
+        for weekday in range(WEEKDAY_COUNT + 1):
+            self.weekday_offsets[weekday] = bisect_left(self.weekdays, weekday)
+
+    # ----- 조회 -----
+
+    def lang_code(self, lang: str) -> Optional[int]:
+        """언어 이름 → lang 코드 (인덱스에 없으면 None)"""
+        try:
+            return self.languages.index(lang)
+        except ValueError:
+            return None
+
+    def row_ids_on(
+        self,
+        day: date,
+        start_minute: int = 0,
+        end_minute: int = 24 * 60,
+        lang: Optional[str] = None,
+    ) -> List[int]:
+        """
+        날짜 day의 [start_minute, end_minute) 시간대에 있는 미사 행 번호
+        요일 범위와 시간 범위는 이진 탐색, 주차/언어는 정수 비교로 거름
+        """
+        lang_code = None
+        if lang is not None:
+            lang_code = self.lang_code(lang)
+            if lang_code is None:
+                return []
+
+        weekday = day.weekday()
+        lo = self.weekday_offsets[weekday]
+        hi = self.weekday_offsets[weekday + 1]
+        lo = bisect_left(self.minutes, start_minute, lo, hi)
+        hi = bisect_left(self.minutes, end_minute, lo, hi)
+
+        bit = week_bit(day)
+        week_masks = self.week_masks
+        langs = self.langs
+        return [
+            row for row in range(lo, hi)
+            if (not week_masks[row] or week_masks[row] & bit) and
+            (lang_code is None or langs[row] == lang_code)
+        ]
+
+    def row(self, row_id: int) -> MassRow:
+        """행 번호 → MassRow"""
+        return MassRow(
+            self.parish_ids[row_id],
+            self.weekdays[row_id],
+            self.minutes[row_id],
+            self.languages[self.langs[row_id]],
+            self.week_masks[row_id],
+        )
+
+    def masses_on(self, day: date, start_minute: int = 0, end_minute: int = 24 * 60,
+                  lang: Optional[str] = None) -> List[MassRow]:
+        """날짜·시간대·언어 조건에 맞는 미사 (시간순)"""
+        return [self.row(row_id) for row_id in self.row_ids_on(day, start_minute, end_minute, lang)]
+
+    def parishes_on(self, day: date, start_minute: int = 0, end_minute: int = 24 * 60,
+                    lang: Optional[str] = None) -> List[Tuple[str, str]]:
+        """날짜·시간대·언어 조건에 맞는 미사가 있는 성당 (교구, 이름) 목록"""
+        parish_ids = {self.parish_ids[row_id] for row_id in self.row_ids_on(day, start_minute, end_minute, lang)}
+        return [self.parishes[parish_id] for parish_id in sorted(parish_ids)]
+
+    # ----- 직렬화 -----
+
+    def to_bytes(self) -> bytes:
+        """
+        바이너리 직렬화 (리틀 엔디언)
+        헤더 | 요일 오프셋 | 언어 문자열 | 성당 (교구, 이름) 문자열 | 열 배열 5개
+        """
+        chunks = [_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(self.languages),
+                               len(self.parishes), len(self))]
+        chunks.append(_to_le_bytes(self.weekday_offsets))
+        for lang in self.languages:
+            chunks.append(_pack_string(lang))
+        for diocese, name in self.parishes:
+            chunks.append(_pack_string(diocese))
+            chunks.append(_pack_string(name))
+        for column in self._columns():
+            chunks.append(_to_le_bytes(column))
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'MassIndex':
+        """to_bytes()의 역변환"""
+        magic, version, lang_count, parish_count, row_count = _HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 인덱스 형식: {magic!r} v{version}")
+        offset = _HEADER.size
+
+        index = cls()
+        offset = _from_le_bytes(index.weekday_offsets, data, offset, WEEKDAY_COUNT + 1)
+        index.languages = []
+        for _ in range(lang_count):
+            lang, offset = _unpack_string(data, offset)
+            index.languages.append(lang)
+        for _ in range(parish_count):
+            diocese, offset = _unpack_string(data, offset)
+            name, offset = _unpack_string(data, offset)
+            index.parishes.append((diocese, name))
+        for column in index._columns():
+            offset = _from_le_bytes(column, data, offset, row_count)
+        if offset != len(data):
+            raise ValueError(f"인덱스 크기가 맞지 않습니다: {offset} != {len(data)}")
+        return index
+
+    def _columns(self) -> Tuple[array, ...]:
+        return (self.parish_ids, self.weekdays, self.minutes, self.langs, self.week_masks)
+
+    def save(self, path: Path = INDEX_PATH):
+        """바이너리 파일로 저장"""
+        path.write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> 'MassIndex':
+        """바이너리 파일에서 로드"""
+        return cls.from_bytes(path.read_bytes())
+
+
+def _to_le_bytes(column: array) -> bytes:
+    if sys.byteorder == 'little' or column.itemsize == 1:
+        return column.tobytes()
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _from_le_bytes(column: array, data: bytes, offset: int, count: int) -> int:
+    """data[offset:]에서 count개 항목을 column에 채우고 다음 오프셋 반환"""
+    del column[:]
+    end = offset + count * column.itemsize
+    column.frombytes(data[offset:end])
+    if sys.byteorder != 'little' and column.itemsize > 1:
+        column.byteswap()
+    return end
+
+
+def _pack_string(value: str) -> bytes:
+    encoded = value.encode('utf-8')
+    return _STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_string(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _STRING_LENGTH.unpack_from(data, offset)
+    start = offset + _STRING_LENGTH.size
+    return data[start:start + length].decode('utf-8'), start + length
+
+
+def main():
+    """인덱스 생성 → 저장 → 다시 읽어 검증"""
+    output_path = Path(sys.argv[1]) if len(sys.argv) > 1 else INDEX_PATH
+
+    index = MassIndex.build()
+    index.save(output_path)
+
+    loaded = MassIndex.load(output_path)
+    if loaded != index:
+        print(f"❌ 검증 실패: {output_path}")
+        sys.exit(1)
+
+    print(f"✅ {output_path}: 성당 {len(index.parishes)}개, 미사 {len(index)}행, "
+          f"언어 {len(index.languages)}개, {output_path.stat().st_size:,} bytes")
+
+
+if __name__ == '__main__':
+    main()
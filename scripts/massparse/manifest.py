@@ -0,0 +1,112 @@
+"""
+교회 데이터의 content-addressed 매니페스트
+패스별로 성당마다 massTime 해시와 파생 필드(massTimes/foreignMassTimes) 해시를 기록하여
+--changed-only 실행 시 massTime이 바뀐 성당만 다시 처리
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 기본 매니페스트 파일 위치
+MANIFEST_PATH = Path(__file__).parent / '.cache' / 'manifest.json'
+
+MANIFEST_VERSION = 1
+
+
+def content_hash(value: Any) -> str:
+    """JSON 직렬화 기준 해시 (키 순서 무관)"""
+    encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def source_digest(*paths: Path) -> str:
+    """패스 버전용 소스 파일 해시"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def parish_key(parish: Dict[str, Any]) -> str:
+    """교구 파일 안에서 성당을 구분하는 키"""
+    return f"{parish.get('name', '')}|{parish.get('address', '')}"
+
+
+def derived_hash(parish: Dict[str, Any]) -> str:
+    """massTime에서 파생된 필드의 해시"""
+    return content_hash([parish.get('massTimes'), parish.get('foreignMassTimes')])
+
+
+class ParishManifest:
+    """패스 ID → 파일 이름 → 성당 키 → {massTime, derived} 해시"""
+
+    def __init__(self, path: Optional[Path] = MANIFEST_PATH):
+        self.path = path
+        self.passes: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = {}
+        self._dirty = False
+        if path is not None:
+            self._load()
+
+    def _load(self):
+        """매니페스트 로드 (버전이 다르거나 손상된 경우 빈 매니페스트로 시작)"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.passes = data.get('passes', {})
+
+    def _entries(self, pass_id: str, file_name: str) -> Dict[str, Dict[str, str]]:
+        return self.passes.setdefault(pass_id, {}).setdefault(file_name, {})
+
+    def is_unchanged(self, pass_id: str, file_name: str, parish: Dict[str, Any]) -> bool:
+        """
+        마지막 기록 이후 massTime도, 파생 필드도 바뀌지 않았는지 확인
+        파생 필드가 다른 스크립트나 수작업으로 바뀐 경우도 변경으로 간주
+        """
+        entry = self.passes.get(pass_id, {}).get(file_name, {}).get(parish_key(parish))
+        if entry is None:
+            return False
+        return (entry.get('massTime') == content_hash(parish.get('massTime', '')) and
+                entry.get('derived') == derived_hash(parish))
+
+    def record(self, pass_id: str, file_name: str, parish: Dict[str, Any]):
+        """패스 적용 후 성당의 현재 해시 기록"""
+        entry = {
+            'massTime': content_hash(parish.get('massTime', '')),
+            'derived': derived_hash(parish),
+        }
+        entries = self._entries(pass_id, file_name)
+        key = parish_key(parish)
+        if entries.get(key) != entry:
+            entries[key] = entry
+            self._dirty = True
+
+    def file_entries(self, pass_id: str, file_name: str) -> Dict[str, Dict[str, str]]:
+        """파일 하나에 대한 기록 (병렬 작업 결과 병합용)"""
+        return self.passes.get(pass_id, {}).get(file_name, {})
+
+    def merge_file(self, pass_id: str, file_name: str, entries: Dict[str, Dict[str, str]]):
+        """다른 프로세스에서 기록한 파일 하나의 항목 병합"""
+        current = self._entries(pass_id, file_name)
+        if current != entries:
+            current.clear()
+            current.update(entries)
+            self._dirty = True
+
+    def save(self):
+        """변경된 경우에만 임시 파일에 쓴 뒤 교체"""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'passes': self.passes}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
@@ -0,0 +1,141 @@
+"""
+교구 파일 단위 병렬 재생성
+파일마다 독립적이므로 프로세스 풀로 나누어 처리하고, 결과는 입력 순서대로 병합
+캐시/매니페스트는 부모 프로세스만 저장하고 작업 프로세스는 변경분만 돌려줌
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from .cache import ParseCache
+from .manifest import ParishManifest
+from .regenerate import REGENERATE_PASS_ID, process_parish_file
+
+
+class FileResult(NamedTuple):
+    """교구 파일 하나의 처리 결과"""
+    file_path: Path
+    modified: int
+    total: int
+    error: Optional[str]
+    cache_entries: Dict[str, Dict[str, Any]]
+    cache_hits: int
+    cache_misses: int
+    manifest_entries: Dict[str, Dict[str, str]]
+
+
+class RunSummary(NamedTuple):
+    """전체 실행 요약"""
+    files: int
+    changed_files: int
+    failed_files: int
+    modified: int
+    total: int
+
+
+# 작업 프로세스별 상태 (_init_worker에서 한 번 설정)
+_worker_cache: Optional[ParseCache] = None
+_worker_manifest: Optional[ParishManifest] = None
+_worker_options: Dict[str, Any] = {}
+
+
+def jobs_from_argv(argv: Sequence[str], default: int = 1) -> int:
+    """
+    "--jobs N" 또는 "--jobs=N" 인자 해석
+    0 이하이면 CPU 코어 수
+    """
+    value = None
+    for i, arg in enumerate(argv):
+        if arg == '--jobs' and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif arg.startswith('--jobs='):
+            value = arg.split('=', 1)[1]
+    if value is None:
+        return default
+    jobs = int(value)
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def _init_worker(cache_entries, manifest_passes, options):
+    """작업 프로세스 초기화: 부모의 캐시/매니페스트 내용을 메모리에 복사"""
+    global _worker_cache, _worker_manifest, _worker_options
+    _worker_cache = ParseCache(path=None)
+    _worker_cache.entries = cache_entries
+    _worker_manifest = ParishManifest(path=None)
+    _worker_manifest.passes = manifest_passes
+    _worker_options = options
+
+
+def _run_one(file_path: Path, cache: ParseCache, manifest: ParishManifest, options: Dict[str, Any]) -> FileResult:
+    """파일 하나를 처리하고 캐시/매니페스트 변경분을 함께 반환"""
+    hits, misses = cache.hits, cache.misses
+    cache.added = {}
+    error = None
+    modified = total = 0
+    try:
+        modified, total = process_parish_file(
+            file_path, backup_suffix=options['backup_suffix'], cache=cache,
+            manifest=manifest, changed_only=options['changed_only'])
+    except Exception as e:
+        error = str(e)
+    return FileResult(
+        file_path=file_path,
+        modified=modified,
+        total=total,
+        error=error,
+        cache_entries=cache.added,
+        cache_hits=cache.hits - hits,
+        cache_misses=cache.misses - misses,
+        manifest_entries=dict(manifest.file_entries(REGENERATE_PASS_ID, file_path.name)),
+    )
+
+
+def _worker(file_path: Path) -> FileResult:
+    return _run_one(file_path, _worker_cache, _worker_manifest, _worker_options)
+
+
+def regenerate_files(
+    files: Sequence[Path],
+    jobs: int = 1,
+    backup_suffix: Optional[str] = '.json.bak',
+    cache: Optional[ParseCache] = None,
+    manifest: Optional[ParishManifest] = None,
+    changed_only: bool = False,
+) -> List[FileResult]:
+    """
+    교구 파일들을 regenerate_parish로 재생성
+    jobs > 1이면 프로세스 풀에서 처리하며, 결과는 항상 files 순서
+    작업 프로세스의 캐시/매니페스트 변경분은 cache/manifest에 병합 (저장은 호출자)
+    """
+    cache = cache if cache is not None else ParseCache(path=None)
+    manifest = manifest if manifest is not None else ParishManifest(path=None)
+    options = {'backup_suffix': backup_suffix, 'changed_only': changed_only}
+
+    if jobs <= 1 or len(files) <= 1:
+        return [_run_one(file_path, cache, manifest, options) for file_path in files]
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(files)),
+        initializer=_init_worker,
+        initargs=(cache.entries, manifest.passes, options),
+    ) as executor:
+        results = list(executor.map(_worker, files))
+
+    for result in results:
+        cache.merge(result.cache_entries, result.cache_hits, result.cache_misses)
+        if result.error is None:
+            manifest.merge_file(REGENERATE_PASS_ID, result.file_path.name, result.manifest_entries)
+    return results
+
+
+def summarize(results: Sequence[FileResult]) -> RunSummary:
+    """파일별 결과를 하나의 요약으로 병합"""
+    return RunSummary(
+        files=len(results),
+        changed_files=sum(1 for r in results if r.error is None and r.modified > 0),
+        failed_files=sum(1 for r in results if r.error is not None),
+        modified=sum(r.modified for r in results),
+        total=sum(r.total for r in results),
+    )
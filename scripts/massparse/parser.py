@@ -0,0 +1,389 @@
+"""
+미사 시간 문자열 파서
+tokenize()로 각 " / " 구간을 한 번만 스캔하고, 규칙은 토큰 위에서 동작
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .rules import (
+    BRACKET_TO_LANG,
+    CONTINUATION_TIME_PATTERN,
+    MULTIPLE_WEEKDAY_PATTERN,
+    SATURDAY_PREFIX_PATTERN,
+    SINGLE_WEEKDAY_PATTERN,
+    SUNDAY_PREFIX_PATTERN,
+    TIME_PATTERN,
+    WEEK_SUNDAY_PATTERN,
+    WEEKDAY_CHAR_PATTERN,
+    WEEKDAY_EXCEPTION_PATTERN,
+    WEEKDAY_MAP,
+    WEEKDAYS,
+)
+from .schedule import MassSlot, Schedule, week_mask_from_numbers
+from .tokenizer import (
+    TOKEN_LANG,
+    TOKEN_TIME,
+    TOKEN_WEEK,
+    TOKEN_WEEKDAY,
+    Token,
+    find_language_token,
+    first_time,
+    last_token,
+    split_by_sep,
+    strip_offset,
+    time_spans,
+    tokenize,
+    week_note,
+)
+
+
+def detect_language(text: str) -> Optional[Tuple[str, str]]:
+    """
+    텍스트에서 언어를 감지
+    Returns: (language_code, matched_text) or None
+    """
+    token = find_language_token(tokenize(text))
+    if token:
+        return (token.value, token.text)
+    return None
+
+
+def is_foreign_language(text: str) -> bool:
+    """외국어 미사인지 확인"""
+    return detect_language(text) is not None
+
+
+def parse_weekday(text: str) -> Optional[str]:
+    """요일 파싱"""
+    for ja_key, en_key in WEEKDAY_MAP.items():
+        if text.startswith(ja_key):
+            return en_key
+    return None
+
+
+def _add_prefixed_times(
+    part: str,
+    tokens: List[Token],
+    prefix_length: int,
+    weekday: str,
+    schedule: Schedule,
+):
+    """"主日：08:00, 12:00(韓国語ミサ)" 형식의 시간 목록을 쉼표 단위로 처리"""
+    times_start = strip_offset(part, prefix_length, len(part))
+    for piece_start, piece_end in split_by_sep(tokens, times_start, len(part)):
+        time_str = first_time(tokens, piece_start, piece_end)
+        if not time_str:
+            continue
+
+        lang_token = find_language_token(tokens, piece_start, piece_end)
+
+        # 외국어 미사인 경우
+        if lang_token and lang_token.value != 'JA':
+            schedule.add_foreign(weekday, time_str, lang_token.value)
+        else:
+            # 일본어 미사인 경우
+            schedule.add_time(weekday, time_str)
+
+
+def _add_time_span(
+    tokens: List[Token],
+    time_token: Token,
+    span_start: int,
+    span_end: int,
+    weekday: str,
+    schedule: Schedule,
+) -> str:
+    """
+    time_spans()의 구간 하나를 슬롯으로 추가 (예: "/第3日曜12:30(韓国語)" → 일요일 12:30 KR, 노트 "第3日曜")
+    구간에 요일이 없으면 weekday (앞 구간의 요일)
+    Returns: 이 구간의 요일
+    """
+    week_token = last_token(tokens, TOKEN_WEEK, span_start, span_end)
+    weekday_token = last_token(tokens, TOKEN_WEEKDAY, span_start, time_token.start)
+    if week_token:
+        weekday = week_token.value[1]
+    elif weekday_token:
+        weekday = weekday_token.value
+    # 시간 바로 뒤 괄호의 언어를 먼저 (예: "土曜19：00（英語）／第4日曜14:00(スペイン語)"의 14:00은 ES)
+    lang_token = find_language_token(tokens, time_token.end, span_end) or find_language_token(tokens, span_start, span_end)
+    if lang_token and lang_token.value != 'JA':
+        schedule.add_foreign(weekday, time_token.value, lang_token.value, week_note(week_token) if week_token else '')
+    elif week_token:
+        schedule.add_time(weekday, time_token.value, week_mask_from_numbers(week_token.value[0]))
+    else:
+        schedule.add_time(weekday, time_token.value)
+    return weekday
+
+
+def parse(mass_time_str: str) -> Dict[str, Any]:
+    """
+    미사 시간 문자열을 파싱하여 구조화된 데이터로 변환
+    parse_schedule()의 결과를 앱이 읽는 JSON 형태로 직렬화
+
+    Returns:
+    {
+        "massTimes": {
+            "weekdays": ["07:00"],
+            "sunday": ["08:00", "10:00"]
+        },
+        "foreignMassTimes": {
+            "sunday": [
+                {
+                    "time": "14:00",
+                    "language": "EN",
+                    "note": "第2・第4日曜"
+                }
+            ]
+        }
+    }
+    """
+    return parse_schedule(mass_time_str).to_json()
+
+
+def parse_schedule(mass_time_str: str) -> Schedule:
+    """
+    미사 시간 문자열을 Schedule(IR)로 파싱
+    각 " / " 구간은 tokenize()로 한 번만 스캔하고, 이후 규칙은 토큰 위에서 동작
+    """
+    schedule = Schedule()
+    if not mass_time_str or not mass_time_str.strip():
+        return schedule
+    
+    # " / "로 분리
+    parts = [p.strip() for p in mass_time_str.split(' / ') if p.strip()]
+    
+    # 이전 부분의 요일 정보를 저장 (예: "主日：09:00 / 14:00英語ミサ"에서 두 번째 부분이 일요일)
+    previous_weekday = None
+    
+    for i, part in enumerate(parts):
+        # "第X日曜XX:XX(언어)" 형식 먼저 처리
+        week_matches = list(WEEK_SUNDAY_PATTERN.finditer(part)) if '第' in part else []
+        if week_matches:
+            for match in week_matches:
+                week1 = match.group(1)
+                week2 = match.group(2) if match.group(2) else ""
+                time_str = match.group(3)
+                lang_text = match.group(4)
+                
+                lang_info = detect_language(lang_text)
+                if lang_info and lang_info[0] != 'JA':
+                    lang_code = lang_info[0]
+                    # 주 정보는 하나의 슬롯에 비트마스크로 (예: "第2・第4日曜" → 0b1010)
+                    if week2:
+                        week_numbers = [week1, week2]
+                        note = f"第{week1}・第{week2}日曜"
+                    else:
+                        week_numbers = [week1]
+                        note = f"第{week1}日曜"
+                    
+                    schedule.add_foreign('sunday', time_str, lang_code, note,
+                                         week_mask=week_mask_from_numbers(week_numbers))
+            
+            # 처리된 패턴을 part에서 제거하고 계속 처리
+            for match in week_matches:
+                part = part.replace(match.group(0), '').strip()
+            # part가 비어있으면 다음으로
+            if not part:
+                continue
+        
+        # 구간 전체를 한 번만 토큰화
+        tokens = tokenize(part)
+        
+        # 먼저 언어 코드 패턴 확인 ([E], [V], [S], [P], [T], [O] 등)
+        lang_code_from_bracket = None
+        for token in tokens:
+            if token.kind == TOKEN_LANG and token.text[0] == '[' and token.text[1] in BRACKET_TO_LANG:
+                lang_code_from_bracket = BRACKET_TO_LANG[token.text[1]]
+                break
+        
+        # 외국어 미사인지 확인
+        lang_token = find_language_token(tokens)
+        if lang_code_from_bracket:
+            lang_code = lang_code_from_bracket
+        elif lang_token:
+            lang_code = lang_token.value
+        else:
+            lang_code = None
+        
+        # 구간 맨 앞의 요일 토큰
+        leading_weekday = tokens[0].value if tokens and tokens[0].kind == TOKEN_WEEKDAY and tokens[0].start == 0 else None
+        # 주차 토큰 (예: "第1,3日曜日 13:00 (ベトナム語)")
+        week_token = next((token for token in tokens if token.kind == TOKEN_WEEK), None)
+        
+        if lang_code:
+            # 외국어 미사 처리
+            # 요일 파싱
+            weekday = leading_weekday
+            
+            # 특정 주일 처리 (예: 第2・第4日曜14:00, 第4土曜日 17:00 (インドネシア語), 第3主日 14:00 [V])
+            if not weekday and week_token:
+                weekday = week_token.value[1]
+            if not weekday:
+                if '日曜' in part or '主日' in part:
+                    weekday = 'sunday'
+                elif '土曜' in part:
+                    weekday = 'saturday'
+            
+            # 이전 부분이 일요일이었고 현재 부분에 요일 표시가 없으면 일요일로 처리
+            if not weekday and previous_weekday == 'sunday' and not leading_weekday:
+                weekday = 'sunday'
+            
+            if not weekday:
+                weekday = 'other'
+            
+            # 시간마다 괄호로 언어를 붙인 경우 시간별로 추가 (예: "17:00(インドネシア語), 19:30(タガログ語)")
+            # 요일·주차·언어는 그 시간의 구간에서 찾고, 없으면 구간 전체의 요일 (괄호에 언어가 없으면 일본어 미사)
+            spans = time_spans(part, tokens)
+            if spans:
+                span_weekday = weekday
+                for time_token, span_start, span_end in spans:
+                    span_weekday = _add_time_span(tokens, time_token, span_start, span_end, span_weekday, schedule)
+            else:
+                # 시간 추출
+                time_str = first_time(tokens) or ''
+                
+                # 노트 추출 (예: "第2・第4日曜")
+                note = week_note(week_token) if week_token else ''
+                
+                schedule.add_foreign(weekday, time_str, lang_code, note)
+            if leading_weekday:
+                previous_weekday = leading_weekday
+        else:
+            # 일본어 미사 처리
+            weekday = None
+            times_start = 0
+            
+            # 특정 주의 미사 (예: "第4日曜日 8:30" → "8:30(第4週)", 前晩 미사는 제외)
+            if week_token and week_token.start == 0 and '前' not in part:
+                weeks, weekday = week_token.value
+                for token in tokens:
+                    if token.kind == TOKEN_TIME:
+                        schedule.add_time(weekday, token.value, week_mask_from_numbers(weeks))
+                previous_weekday = weekday
+                continue
+            # 평일 처리
+            elif part.startswith('平日：') or part.startswith('平日:'):
+                weekday = 'weekdays'
+                times_start = len('平日：')
+            # 토요일 처리
+            elif part.startswith('土曜日：') or part.startswith('土曜日:') or \
+                 part.startswith('土曜：') or part.startswith('土曜:'):
+                weekday = 'saturday'
+                prefix_length = SATURDAY_PREFIX_PATTERN.match(part).end()
+                _add_prefixed_times(part, tokens, prefix_length, weekday, schedule)
+                previous_weekday = weekday
+                continue  # 이미 처리했으므로 다음으로
+            # 일요일 처리
+            elif part.startswith('主日：') or part.startswith('主日:') or \
+                 part.startswith('日曜：') or part.startswith('日曜:'):
+                weekday = 'sunday'
+                prefix_length = SUNDAY_PREFIX_PATTERN.match(part).end()
+                _add_prefixed_times(part, tokens, prefix_length, weekday, schedule)
+                previous_weekday = weekday
+                continue  # 이미 처리했으므로 다음으로
+            # 개별 요일 처리
+            else:
+                for ja_key, en_key in WEEKDAY_MAP.items():
+                    if part.startswith(ja_key):
+                        weekday = en_key
+                        times_start = len(ja_key)
+                        if part[times_start:times_start + 1] in ('：', ':'):
+                            times_start += 1
+                        break
+                # 시간만 있는 구간은 앞 구간의 요일 (예: "日曜日 8:30 (5～10月) / 10:30 (11～4月)")
+                if not weekday and previous_weekday and CONTINUATION_TIME_PATTERN.match(part):
+                    weekday = previous_weekday
+            
+            if weekday:
+                times_start = strip_offset(part, times_start, len(part))
+                times_str = part[times_start:].rstrip()
+                
+                # 시간 추출 (쉼표로 구분된 여러 시간)
+                # 외국어 표시가 포함된 시간은 제외
+                all_times = [token.value for token in tokens if token.kind == TOKEN_TIME and token.start >= times_start]
+                japanese_times = []
+                
+                # 각 시간이 외국어 미사인지 확인
+                for time in all_times:
+                    # 시간 주변 텍스트 확인
+                    time_index = times_str.find(time)
+                    context_start = times_start + max(0, time_index - 20)
+                    context_end = times_start + min(len(times_str), time_index + len(time) + 20)
+                    context_lang = find_language_token(tokens, context_start, context_end)
+                    
+                    if not context_lang:
+                        japanese_times.append(time)
+                    else:
+                        # 외국어 미사로 추가
+                        schedule.add_foreign(weekday, time, context_lang.value)
+                
+                for time in japanese_times:
+                    schedule.add_time(weekday, time)
+                
+                # 시간 형식이 아닌 경우 (예: "火、木、土曜 6:30、水曜 10:00")
+                if not all_times:
+                    parse_individual_weekdays(part, schedule)
+                
+                # 다음 반복을 위해 요일 저장
+                previous_weekday = weekday
+        
+        # "平日：月曜日から土曜日XX:XX(日本語・水曜日は英語)" 형식 처리
+        if '平日' in part and 'から' in part and 'まで' in part:
+            time = first_time(tokens)
+            if time:
+                # 기본적으로 모든 평일에 일본어 미사로 추가
+                for day in ['monday', 'tuesday', 'thursday', 'friday', 'saturday']:
+                    schedule.add_time(day, time)
+                
+                # 특정 요일 예외 처리 (예: "水曜日は英語")
+                exception_match = WEEKDAY_EXCEPTION_PATTERN.search(part)
+                if exception_match:
+                    exception_day = parse_weekday(exception_match.group(1))
+                    exception_lang_text = exception_match.group(2)
+                    exception_lang = detect_language(exception_lang_text)
+                    if exception_day and exception_lang and exception_lang[0] != 'JA':
+                        exception_lang_code = exception_lang[0]
+                        # 해당 요일은 외국어 미사로
+                        schedule.add_foreign(exception_day, time, exception_lang_code)
+                        # massTimes에서 제거
+                        schedule.remove(MassSlot(exception_day, time))
+    
+    # weekdays를 월~금요일로 분리
+    schedule.expand_day('weekdays', WEEKDAYS)
+    
+    return schedule
+
+
+def parse_individual_weekdays(text: str, schedule: Schedule):
+    """개별 요일 파싱 (예: "火、木、土曜 6:30、水曜 10:00")"""
+    # "、"로 분리
+    items = [item.strip() for item in text.split('、') if item.strip()]
+    
+    for item in items:
+        # 단일 요일 패턴 (예: "水曜 10:00")
+        single_match = SINGLE_WEEKDAY_PATTERN.match(item)
+        if single_match:
+            weekday_ja = single_match.group(1)
+            times_str = single_match.group(2)
+            weekday = WEEKDAY_MAP.get(weekday_ja)
+            if weekday:
+                times = TIME_PATTERN.findall(times_str)
+                for time in times:
+                    schedule.add_time(weekday, time)
+            continue
+        
+        # 복수 요일 패턴 (예: "火、木、土曜 6:30")
+        multiple_match = MULTIPLE_WEEKDAY_PATTERN.match(item)
+        if multiple_match:
+            weekdays_str = multiple_match.group(1)
+            times_str = multiple_match.group(2)
+            times = TIME_PATTERN.findall(times_str)
+            
+            # 개별 요일 추출
+            weekday_chars = WEEKDAY_CHAR_PATTERN.findall(weekdays_str)
+            for char in weekday_chars:
+                weekday_ja = f'{char}曜'
+                weekday = WEEKDAY_MAP.get(weekday_ja)
+                if weekday:
+                    for time in times:
+                        schedule.add_time(weekday, time)
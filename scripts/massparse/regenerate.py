@@ -0,0 +1,92 @@
+"""
+교구 파일 단위 massTimes/foreignMassTimes 재생성
+파일마다 로드 → 패스 적용 → 쓰기를 한 번씩만 수행
+"""
+
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .cache import PARSER_VERSION, ParseCache
+from .manifest import ParishManifest
+from .parser import parse
+from .stream import MissingParishesError, rewrite_parish_file
+
+# 기본 교회 데이터 디렉토리
+PARISHES_DIR = Path(__file__).parent.parent.parent / 'assets' / 'data' / 'parishes'
+
+# 성당 하나를 수정하고 변경 여부를 반환하는 패스
+ParishPass = Callable[[Dict[str, Any]], bool]
+
+# 기본 패스(regenerate_parish)의 매니페스트 ID
+REGENERATE_PASS_ID = f'regenerate:{PARSER_VERSION}'
+
+
+def iter_parish_files(parishes_dir: Path = PARISHES_DIR) -> List[Path]:
+    """교구 JSON 파일 목록 (dioceses.json 제외, 이름순)"""
+    return [f for f in sorted(parishes_dir.glob('*.json'))
+            if f.name != 'dioceses.json']
+
+
+def regenerate_parish(parish: Dict[str, Any], cache: Optional[ParseCache] = None) -> bool:
+    """massTime을 파싱하여 massTimes/foreignMassTimes를 재생성, 변경 여부 반환"""
+    mass_time_str = parish.get('massTime', '')
+    if not mass_time_str:
+        return False
+
+    parsed = cache.parse(mass_time_str) if cache is not None else parse(mass_time_str)
+    if (parish.get('massTimes') == parsed['massTimes'] and
+            parish.get('foreignMassTimes') == parsed['foreignMassTimes']):
+        return False
+
+    parish['massTimes'] = parsed['massTimes']
+    parish['foreignMassTimes'] = parsed['foreignMassTimes']
+    return True
+
+
+def process_parish_file(
+    file_path: Path,
+    passes: Optional[Iterable[ParishPass]] = None,
+    backup_suffix: Optional[str] = '.json.bak',
+    cache: Optional[ParseCache] = None,
+    manifest: Optional[ParishManifest] = None,
+    pass_id: str = REGENERATE_PASS_ID,
+    changed_only: bool = False,
+) -> Tuple[int, int]:
+    """
+    교구 파일 하나에 패스를 순서대로 적용 (기본: cache를 쓰는 regenerate_parish)
+    manifest가 있으면 처리 결과를 pass_id 아래에 기록하고,
+    changed_only이면 마지막 기록 이후 바뀌지 않은 성당은 건너뜀
+    성당을 하나씩 스트리밍으로 읽고 써서 파일 전체를 메모리에 올리지 않으며,
+    직렬화 결과가 원본과 바이트 단위로 같으면 쓰지 않고,
+    쓸 때만 수정 전 원본 내용을 백업한 뒤 임시 파일로 원자적으로 교체
+    Returns: (수정된 성당 수, massTime이 있는 성당 수)
+    """
+    if passes is None:
+        passes = (partial(regenerate_parish, cache=cache),)
+    passes = list(passes)
+    total_count = 0
+
+    def apply_passes(parish: Dict[str, Any]) -> bool:
+        nonlocal total_count
+        if not parish.get('massTime'):
+            return False
+        total_count += 1
+        if changed_only and manifest is not None and manifest.is_unchanged(pass_id, file_path.name, parish):
+            return False
+        changed = False
+        for parish_pass in passes:
+            if parish_pass(parish):
+                changed = True
+        if manifest is not None:
+            manifest.record(pass_id, file_path.name, parish)
+        return changed
+
+    try:
+        modified_count, _, _ = rewrite_parish_file(file_path, apply_passes, backup_suffix)
+    except MissingParishesError:
+        print(f"  ⚠️  'parishes' 키를 찾을 수 없음: {file_path.name}")
+        return (0, 0)
+
+    return (modified_count, total_count)
+
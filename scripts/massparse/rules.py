@@ -0,0 +1,85 @@
+"""
+미사 시간 파싱 규칙 테이블
+언어/요일 매핑과 토크나이저 패턴을 한 곳에서 정의하고 모듈 로드 시 한 번만 컴파일
+"""
+
+import re
+
+# 언어 코드 매핑 (먼저 정의된 언어가 우선)
+LANGUAGE_PATTERNS = {
+    'EN': [r'英語', r'English', r'\[E\]'],
+    'ES': [r'スペイン語', r'Spanish', r'Español', r'\[S\]'],
+    'CN': [r'中国語', r'Chinese', r'中文'],
+    'PH': [r'フィリピン', r'タガログ', r'Filipino'],
+    'PT': [r'ポルトガル', r'Português', r'\[P\]'],
+    'KR': [r'韓国語', r'Korean'],
+    'FR': [r'フランス語', r'French', r'Français'],
+    'DE': [r'ドイツ語', r'German', r'Deutsch'],
+    'IT': [r'イタリア語', r'Italian', r'Italiano'],
+    'VI': [r'ベトナム', r'Vietnamese', r'\[V\]'],
+    'TH': [r'タイ', r'Thai', r'\[T\]'],
+    'ID': [r'インドネシア', r'Indonesian', r'\[O\]'],
+    'PL': [r'ポーランド', r'Polish'],
+    'JA': [r'\[J\]'],  # 일본어는 보통 기본이므로 특별히 표시할 때만
+}
+
+# 요일 매핑
+WEEKDAY_MAP = {
+    '平日': 'weekdays',
+    '月曜': 'monday',
+    '火曜': 'tuesday',
+    '水曜': 'wednesday',
+    '木曜': 'thursday',
+    '金曜': 'friday',
+    '土曜': 'saturday',
+    '土曜日': 'saturday',
+    '主日': 'sunday',
+    '日曜': 'sunday',
+}
+
+# 괄호 언어 코드 매핑 ([E], [V] 등)
+BRACKET_TO_LANG = {
+    'E': 'EN', 'V': 'VI', 'S': 'ES', 'P': 'PT',
+    'T': 'TH', 'O': 'ID', 'J': 'JA'
+}
+
+# 언어 우선순위 (LANGUAGE_PATTERNS 순서)
+LANGUAGE_PRIORITY = {lang_code: i for i, lang_code in enumerate(LANGUAGE_PATTERNS)}
+
+# 월~금요일 ("weekdays" 분리용)
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
+
+
+def _build_token_pattern() -> 're.Pattern[str]':
+    """모든 토큰 규칙을 하나의 alternation 패턴으로 컴파일"""
+    alternatives = [
+        # "第2・第4日曜", "第1,3日曜", "第4土曜" (오사카 교구 형식 포함, "、"는 시간 구분자로 남김)
+        r'(?P<week>第(?P<week1>\d+)(?:(?:[・・]?第|[・・,])(?P<week2>\d+))?(?P<week_day>[日月火水木金土])曜)',
+        r'(?P<time>\d{1,2}:\d{2})',
+    ]
+    for lang_code, patterns in LANGUAGE_PATTERNS.items():
+        alternatives.append(f"(?P<lang_{lang_code}>{'|'.join(patterns)})")
+    # 긴 요일 표기를 먼저 시도 (예: "土曜日"을 "土曜"보다 먼저)
+    weekday_keys = sorted(WEEKDAY_MAP, key=len, reverse=True)
+    alternatives.append(f"(?P<weekday>{'|'.join(weekday_keys)})")
+    alternatives.append(r'(?P<sep>[,、])')
+    return re.compile('|'.join(alternatives), re.IGNORECASE)
+
+
+TOKEN_PATTERN = _build_token_pattern()
+
+# 시간 바로 뒤의 괄호 노트 (예: "17:00(インドネシア語)"의 "(インドネシア語)")
+TIME_NOTE_PATTERN = re.compile(r'\s*[（(][^)）]*[)）]')
+# "第X日曜XX:XX(언어)" 형식
+WEEK_SUNDAY_PATTERN = re.compile(r'第(\d+)[・]?第?(\d*)[日曜]\s*(\d{1,2}:\d{2})\s*\(([^)]+)\)')
+# "水曜日は英語" 형식의 예외 요일
+WEEKDAY_EXCEPTION_PATTERN = re.compile(r'(\w+曜日)は([^・)]+)')
+SATURDAY_PREFIX_PATTERN = re.compile(r'^土曜日?[：:]')
+SUNDAY_PREFIX_PATTERN = re.compile(r'^(主日|日曜)[：:]')
+# "火、木、土曜 6:30、水曜 10:00" 형식
+SINGLE_WEEKDAY_PATTERN = re.compile(r'^([月火水木金土]曜)[：:]?\s*(.+)')
+MULTIPLE_WEEKDAY_PATTERN = re.compile(r'^([月火水木金土、]+)曜[：:]?\s*(.+)')
+WEEKDAY_CHAR_PATTERN = re.compile(r'[月火水木金土]')
+TIME_PATTERN = re.compile(r'\d{1,2}:\d{2}')
+# 요일 없이 시간(+ 괄호 설명)만 있는 구간 (예: "10:30 (11～4月)")
+CONTINUATION_TIME_PATTERN = re.compile(r'^\d{1,2}:\d{2}\s*(?:[（(][^)）]*[)）])?$')
@@ -0,0 +1,285 @@
+"""
+미사 일정 중간 표현(IR)
+MassSlot 레코드를 요일별 순서 있는 집합에 담아 중복 제거를 O(1)로 처리하고,
+앱이 읽는 massTimes/foreignMassTimes JSON은 직렬화 시점에만 생성
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# "10:00" 또는 "10:00(第1週)" 형식의 massTimes 항목
+_MASS_TIME_ENTRY_PATTERN = re.compile(r'^(\d{1,2}):(\d{2})(?:\(第(\d+)週\))?$')
+# date.weekday() 순서의 요일 키
+WEEKDAY_KEYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# 노트의 주차 번호 (전각 숫자 포함, 예: "第2・第4日曜", "第４日曜")
+_WEEK_NUMBER_PATTERN = re.compile(r'第([0-9０-９]+)')
+
+
+@lru_cache(maxsize=4096)
+def parse_minute_of_day(time_str: str) -> Optional[int]:
+    """"7:30" → 450, 시간 형식이 아니면 None"""
+    hour, sep, minute = time_str.partition(':')
+    if not sep or not hour.isdigit() or not minute[:2].isdigit() or len(minute) != 2:
+        return None
+    return int(hour) * 60 + int(minute)
+
+
+def week_mask_from_numbers(week_numbers) -> int:
+    """주차 번호 목록 → 비트마스크 (第1週 = bit 0, ... 第5週 = bit 4), 0은 매주"""
+    mask = 0
+    for week_num in week_numbers:
+        week = int(week_num)
+        if 1 <= week <= 5:
+            mask |= 1 << (week - 1)
+    return mask
+
+
+def week_mask_from_note(note: str) -> int:
+    """노트의 "第N" 표기에서 주차 비트마스크 추출"""
+    if not note or '第' not in note:
+        return 0
+    return week_mask_from_numbers(int(num) for num in _WEEK_NUMBER_PATTERN.findall(note))
+
+
+def week_numbers(week_mask: int) -> List[int]:
+    """비트마스크 → 주차 번호 목록"""
+    return [week for week in range(1, 6) if week_mask & (1 << (week - 1))]
+
+
+def week_bit(day: date) -> int:
+    """날짜가 속한 그 달의 N번째 요일 비트 (1~7일 = 第1, 8~14일 = 第2, ...)"""
+    return 1 << ((day.day - 1) // 7)
+
+
+def weekday_key(day: date) -> str:
+    """날짜의 요일 키 ("monday" ~ "sunday")"""
+    return WEEKDAY_KEYS[day.weekday()]
+
+
+class MassSlot:
+    """
+    미사 하나
+    lang이 None이면 일본어(기본) 미사로 massTimes에, 그 외에는 foreignMassTimes에 직렬화
+    time_text는 원본 표기("7:00"/"07:00")를 그대로 보존하기 위한 값
+    생성 후에는 변경하지 않는 값 객체로 취급 (key를 생성 시 한 번만 계산)
+    """
+
+    __slots__ = ('weekday', 'minute_of_day', 'lang', 'week_mask', 'note', 'time_text', 'key', '_hash')
+
+    def __init__(
+        self,
+        weekday: str,
+        time_text: str,
+        lang: Optional[str] = None,
+        week_mask: int = 0,
+        note: str = '',
+    ):
+        self.weekday = weekday
+        self.minute_of_day = parse_minute_of_day(time_text)
+        self.lang = lang
+        self.week_mask = week_mask
+        self.note = note
+        self.time_text = time_text
+        # 중복 판정 키 (시간은 표기와 무관하게 분 단위로 비교)
+        time_key = self.minute_of_day if self.minute_of_day is not None else time_text
+        self.key: Tuple[Any, ...] = (weekday, time_key, lang, week_mask, note)
+        self._hash = hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, MassSlot) and self.key == other.key
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return (f"MassSlot({self.weekday!r}, {self.time_text!r}, lang={self.lang!r}, "
+                f"week_mask={self.week_mask:#x}, note={self.note!r})")
+
+    def occurs_in_week(self, bit: int) -> bool:
+        """week_bit() 값에 해당하는 주에 있는 미사인지 (week_mask가 0이면 매주)"""
+        return not self.week_mask or bool(self.week_mask & bit)
+
+    def to_mass_time_entries(self) -> List[str]:
+        """massTimes 문자열 목록 (주차가 있으면 주차별로 "10:00(第1週)")"""
+        if not self.week_mask:
+            return [self.time_text]
+        return [f"{self.time_text}(第{week}週)" for week in week_numbers(self.week_mask)]
+
+    def to_foreign_entry(self) -> Dict[str, str]:
+        """foreignMassTimes 항목"""
+        return {"time": self.time_text, "language": self.lang, "note": self.note}
+
+
+# 요일 → {MassSlot: None} (dict를 삽입 순서가 유지되는 집합으로 사용)
+_DaySlots = Dict[MassSlot, None]
+
+
+class Schedule:
+    """성당 하나의 미사 일정"""
+
+    __slots__ = ('mass_times', 'foreign_mass_times', '_time_index')
+
+    def __init__(self):
+        self.mass_times: Dict[str, _DaySlots] = {}
+        self.foreign_mass_times: Dict[str, _DaySlots] = {}
+        # (요일, 언어, 분) → 개수, 노트와 무관한 시간 중복 확인용
+        self._time_index: Dict[Tuple[str, Optional[str], Any], int] = {}
+
+    def _days(self, lang: Optional[str]) -> Dict[str, _DaySlots]:
+        return self.mass_times if lang is None else self.foreign_mass_times
+
+    @staticmethod
+    def _time_key(slot: MassSlot) -> Tuple[str, Optional[str], Any]:
+        return (slot.weekday, slot.lang, slot.key[1])
+
+    def ensure_day(self, weekday: str, foreign: bool = False) -> _DaySlots:
+        """요일 목록을 (비어 있더라도) 생성"""
+        days = self.foreign_mass_times if foreign else self.mass_times
+        return days.setdefault(weekday, {})
+
+    def add(self, slot: MassSlot) -> bool:
+        """미사 추가, 새로 추가되었으면 True"""
+        day_slots = self._days(slot.lang).setdefault(slot.weekday, {})
+        if slot in day_slots:
+            return False
+        day_slots[slot] = None
+        time_key = self._time_key(slot)
+        self._time_index[time_key] = self._time_index.get(time_key, 0) + 1
+        return True
+
+    def add_time(self, weekday: str, time_text: str, week_mask: int = 0) -> bool:
+        """일본어 미사 추가"""
+        return self.add(MassSlot(weekday, time_text, week_mask=week_mask))
+
+    def add_foreign(
+        self,
+        weekday: str,
+        time_text: str,
+        lang: str,
+        note: str = '',
+        week_mask: Optional[int] = None,
+    ) -> bool:
+        """외국어 미사 추가 (week_mask가 없으면 노트에서 추출)"""
+        if week_mask is None:
+            week_mask = week_mask_from_note(note)
+        return self.add(MassSlot(weekday, time_text, lang, week_mask, note))
+
+    def remove(self, slot: MassSlot) -> bool:
+        """미사 제거 (요일 목록은 비어 있더라도 유지)"""
+        day_slots = self._days(slot.lang).get(slot.weekday)
+        if not day_slots or slot not in day_slots:
+            return False
+        del day_slots[slot]
+        time_key = self._time_key(slot)
+        self._time_index[time_key] -= 1
+        return True
+
+    def has_time(self, weekday: str, time_text: str, lang: Optional[str] = None) -> bool:
+        """노트/주차와 무관하게 같은 요일·언어·시간의 미사가 있는지 확인"""
+        minute = parse_minute_of_day(time_text)
+        time_key = minute if minute is not None else time_text
+        return self._time_index.get((weekday, lang, time_key), 0) > 0
+
+    def __iter__(self) -> Iterator[MassSlot]:
+        for days in (self.mass_times, self.foreign_mass_times):
+            for day_slots in days.values():
+                yield from day_slots
+
+    def __len__(self):
+        return sum(len(day_slots) for days in (self.mass_times, self.foreign_mass_times)
+                   for day_slots in days.values())
+
+    def expand_day(self, source: str, targets: List[str]):
+        """source 요일(예: "weekdays")의 미사를 targets 요일로 복사하고 source 제거"""
+        for days in (self.mass_times, self.foreign_mass_times):
+            if source not in days:
+                continue
+            slots = list(days.pop(source))
+            for slot in slots:
+                time_key = self._time_key(slot)
+                self._time_index[time_key] -= 1
+            foreign = days is self.foreign_mass_times
+            for target in targets:
+                self.ensure_day(target, foreign)
+                for slot in slots:
+                    self.add(MassSlot(target, slot.time_text, slot.lang, slot.week_mask, slot.note))
+
+    def masses_on(self, day: date) -> List[MassSlot]:
+        """
+        날짜에 있는 미사 목록 (시간순, 일본어 미사 먼저)
+        요일 키 조회와 주차 비트 AND만으로 판정하므로 노트 문자열을 다시 파싱하지 않음
+        """
+        key = weekday_key(day)
+        bit = week_bit(day)
+        slots = []
+        for days in (self.mass_times, self.foreign_mass_times):
+            for slot in days.get(key, ()):
+                if slot.occurs_in_week(bit):
+                    slots.append(slot)
+        slots.sort(key=lambda slot: (slot.minute_of_day is None, slot.minute_of_day or 0))
+        return slots
+
+    def mass_times_json(self) -> Dict[str, List[str]]:
+        """massTimes JSON"""
+        result: Dict[str, List[str]] = {}
+        for weekday, day_slots in self.mass_times.items():
+            entries = result[weekday] = []
+            for slot in day_slots:
+                if not slot.week_mask:
+                    entries.append(slot.time_text)
+                    continue
+                # 여러 주차를 가진 슬롯은 주차별 항목으로 펼치며 이미 있는 항목은 건너뜀
+                for entry in slot.to_mass_time_entries():
+                    if entry not in entries:
+                        entries.append(entry)
+        return result
+
+    def foreign_mass_times_json(self) -> Dict[str, List[Dict[str, str]]]:
+        """foreignMassTimes JSON"""
+        return {
+            weekday: [slot.to_foreign_entry() for slot in day_slots]
+            for weekday, day_slots in self.foreign_mass_times.items()
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        """parse() 결과와 같은 형태의 JSON"""
+        return {
+            "massTimes": self.mass_times_json(),
+            "foreignMassTimes": self.foreign_mass_times_json(),
+        }
+
+    @classmethod
+    def from_json(
+        cls,
+        mass_times: Optional[Dict[str, List[str]]],
+        foreign_mass_times: Optional[Dict[str, List[Dict[str, str]]]],
+    ) -> 'Schedule':
+        """massTimes/foreignMassTimes JSON → Schedule"""
+        schedule = cls()
+        for weekday, entries in (mass_times or {}).items():
+            schedule.ensure_day(weekday)
+            for entry in entries:
+                match = _MASS_TIME_ENTRY_PATTERN.match(entry)
+                if match and match.group(3):
+                    time_text = entry[:entry.index('(')]
+                    schedule.add_time(weekday, time_text, week_mask_from_numbers([match.group(3)]))
+                else:
+                    schedule.add_time(weekday, entry)
+        for weekday, entries in (foreign_mass_times or {}).items():
+            schedule.ensure_day(weekday, foreign=True)
+            for entry in entries:
+                schedule.add_foreign(weekday, entry.get('time', ''), entry.get('language') or '', entry.get('note', ''))
+        return schedule
+
+    @classmethod
+    def from_parish(cls, parish: Dict[str, Any]) -> 'Schedule':
+        """성당 데이터의 massTimes/foreignMassTimes → Schedule"""
+        return cls.from_json(parish.get('massTimes'), parish.get('foreignMassTimes'))
+
+
+def masses_on(parish: Dict[str, Any], day: date) -> List[MassSlot]:
+    """성당 데이터(massTimes/foreignMassTimes)에서 날짜에 있는 미사 목록"""
+    return Schedule.from_parish(parish).masses_on(day)
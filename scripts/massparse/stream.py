@@ -0,0 +1,236 @@
+"""
+교구 파일 스트리밍 입출력
+{"diocese": ..., "parishes": [...]} 문서에서 parishes 배열의 성당을 하나씩 읽고,
+변환된 성당을 임시 파일에 바로 쓴 뒤 원자적으로 교체
+메모리는 문서 전체가 아니라 성당 하나 + 읽기 버퍼 크기로 제한됨
+출력 형식은 json.dump(..., ensure_ascii=False, indent=2)와 바이트 단위로 동일
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# 읽기 버퍼 크기
+CHUNK_SIZE = 64 * 1024
+
+# 스트리밍 대상 배열 키
+PARISHES_KEY = 'parishes'
+
+_WHITESPACE = ' \t\n\r'
+
+# parishes 배열의 끝 표시
+_ARRAY_END = object()
+
+
+class MissingParishesError(KeyError):
+    """문서에 parishes 배열이 없음"""
+
+
+class _Reader:
+    """raw_decode 기반 증분 JSON 토큰 리더"""
+
+    def __init__(self, f, on_read: Optional[Callable[[str], None]] = None):
+        self._file = f
+        self._on_read = on_read
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """버퍼에 다음 청크 추가 (이미 소비한 부분은 버림)"""
+        if self._eof:
+            return False
+        chunk = self._file.read(CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._on_read:
+            self._on_read(chunk)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (문서 끝이면 '')"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        """다음 문자가 char인지 확인하고 소비"""
+        actual = self.peek()
+        if actual != char:
+            raise ValueError(f"'{char}' 대신 {actual!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나를 디코딩 (값이 버퍼 경계에 걸리면 더 읽어서 재시도)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 숫자 등은 버퍼 끝에서 잘린 채로 디코딩될 수 있으므로 끝에 닿았으면 더 읽음
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def rest(self) -> str:
+        """남은 문서 전체 (마지막 검증용)"""
+        while self._fill():
+            pass
+        return self._buffer[self._pos:]
+
+
+def _iter_document(reader: _Reader) -> Iterator[Tuple[str, Any, bool]]:
+    """
+    최상위 객체를 (키, 값, 배열 여부) 단위로 순회
+    parishes 키는 값 대신 성당 하나씩을 (키, 성당, True)로 내보내고,
+    배열이 끝나면 (키, _ARRAY_END, False)를 내보냄
+    """
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.expect('}')
+        return
+    while True:
+        key = reader.value()
+        reader.expect(':')
+        if key == PARISHES_KEY and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield key, reader.value(), True
+                    if reader.peek() == ',':
+                        reader.expect(',')
+                        continue
+                    reader.expect(']')
+                    break
+            yield key, _ARRAY_END, False
+        else:
+            yield key, reader.value(), False
+        if reader.peek() == ',':
+            reader.expect(',')
+            continue
+        reader.expect('}')
+        break
+    if reader.rest().strip(_WHITESPACE):
+        raise ValueError("문서 끝에 불필요한 내용이 있습니다")
+
+
+def iter_parishes(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """교구 파일의 성당을 하나씩 읽기"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for key, value, is_item in _iter_document(_Reader(f)):
+            if is_item:
+                yield value
+
+
+def _dumps_indented(value: Any, level: int) -> str:
+    """json.dump(indent=2)로 level 깊이에 중첩되었을 때와 같은 문자열"""
+    text = json.dumps(value, ensure_ascii=False, indent=2)
+    if level:
+        text = text.replace('\n', '\n' + '  ' * level)
+    return text
+
+
+class _HashingWriter:
+    """쓰면서 내용 해시를 계산하는 파일 래퍼"""
+
+    def __init__(self, f):
+        self._file = f
+        self.digest = hashlib.sha1()
+
+    def write(self, text: str):
+        self._file.write(text)
+        self.digest.update(text.encode('utf-8'))
+
+
+def rewrite_parish_file(
+    file_path: Path,
+    transform: Callable[[Dict[str, Any]], bool],
+    backup_suffix: Optional[str] = None,
+) -> Tuple[int, int, bool]:
+    """
+    성당을 하나씩 transform(성당) → 변경 여부로 처리하며 임시 파일에 기록
+    변경된 성당이 없거나 결과가 원본과 바이트 단위로 같으면 임시 파일을 버리고,
+    그 외에는 (백업이 없을 때만 원본을 백업한 뒤) 원본을 원자적으로 교체
+    parishes 배열이 없으면 MissingParishesError
+    Returns: (변경된 성당 수, 전체 성당 수, 파일을 썼는지 여부)
+    """
+    modified_count = 0
+    total_count = 0
+    source_digest = hashlib.sha1()
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f'.{file_path.name}.', suffix='.tmp', dir=file_path.parent)
+    try:
+        with open(file_path, 'r', encoding='utf-8') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8') as dst:
+            out = _HashingWriter(dst)
+            reader = _Reader(src, on_read=lambda chunk: source_digest.update(chunk.encode('utf-8')))
+            out.write('{')
+            first_key = True
+            in_array = False
+            first_item = True
+            has_parishes = False
+            for key, value, is_item in _iter_document(reader):
+                if key == PARISHES_KEY:
+                    has_parishes = True
+                if is_item or (value is _ARRAY_END and in_array):
+                    if not in_array:
+                        # parishes 배열 시작
+                        out.write(('\n' if first_key else ',\n') + f'  {json.dumps(key)}: [')
+                        first_key = False
+                        in_array = True
+                    if not is_item:
+                        # parishes 배열 끝
+                        out.write('\n  ]' if not first_item else ']')
+                        in_array = False
+                        continue
+                    total_count += 1
+                    if transform(value):
+                        modified_count += 1
+                    out.write(('\n' if first_item else ',\n') + '    ' + _dumps_indented(value, 2))
+                    first_item = False
+                    continue
+                if value is _ARRAY_END:
+                    # 빈 parishes 배열
+                    out.write(('\n' if first_key else ',\n') + f'  {json.dumps(key)}: []')
+                    first_key = False
+                    continue
+                out.write(('\n' if first_key else ',\n') + f'  {json.dumps(key, ensure_ascii=False)}: '
+                          + _dumps_indented(value, 1))
+                first_key = False
+            out.write('}' if first_key else '\n}')
+
+        if not has_parishes:
+            raise MissingParishesError(PARISHES_KEY)
+        if not modified_count or out.digest.digest() == source_digest.digest():
+            os.unlink(tmp_name)
+            return (modified_count, total_count, False)
+
+        if backup_suffix:
+            backup_path = file_path.with_suffix(backup_suffix)
+            if not backup_path.exists():
+                shutil.copyfile(file_path, backup_path)
+        shutil.copymode(file_path, tmp_name)
+        os.replace(tmp_name, file_path)
+        return (modified_count, total_count, True)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
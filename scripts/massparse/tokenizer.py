@@ -0,0 +1,122 @@
+"""
+massTime 구간 토크나이저
+한 번의 선형 스캔으로 요일/시간/언어/주차/구분자 토큰을 추출
+"""
+
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from .rules import LANGUAGE_PRIORITY, TIME_NOTE_PATTERN, TOKEN_PATTERN, WEEKDAY_MAP
+
+# 토큰 종류
+TOKEN_WEEKDAY = 'weekday'  # 요일 (예: "主日" -> "sunday")
+TOKEN_TIME = 'time'        # 시간 (예: "14:00")
+TOKEN_LANG = 'lang'        # 언어 표시 (예: "英語" -> "EN")
+TOKEN_WEEK = 'week'        # 주차 + 요일 (예: "第2・第4日曜", "第2,4日曜" -> (("2", "4"), "sunday"))
+TOKEN_SEP = 'sep'          # 시간 구분자 ("," 또는 "、")
+
+
+class Token(NamedTuple):
+    """massTime 구간에서 추출한 토큰"""
+    kind: str
+    value: Any
+    text: str
+    start: int
+    end: int
+
+
+def tokenize(text: str) -> List[Token]:
+    """
+    massTime 구간을 한 번의 선형 스캔으로 토큰화
+    Returns: 위치 순서대로 정렬된 Token 리스트
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind.startswith('lang_'):
+            tokens.append(Token(TOKEN_LANG, kind[5:], match.group(0), match.start(), match.end()))
+        elif kind == TOKEN_TIME:
+            tokens.append(Token(TOKEN_TIME, match.group(0), match.group(0), match.start(), match.end()))
+        elif kind == TOKEN_WEEK:
+            weeks = tuple(week for week in (match.group('week1'), match.group('week2')) if week)
+            weekday = WEEKDAY_MAP[match.group('week_day') + '曜']
+            tokens.append(Token(TOKEN_WEEK, (weeks, weekday), match.group(0), match.start(), match.end()))
+        elif kind == TOKEN_WEEKDAY:
+            tokens.append(Token(TOKEN_WEEKDAY, WEEKDAY_MAP[match.group(0)], match.group(0), match.start(), match.end()))
+        else:
+            tokens.append(Token(TOKEN_SEP, match.group(0), match.group(0), match.start(), match.end()))
+    return tokens
+
+
+def week_note(token: Token) -> str:
+    """주차 토큰의 노트 ("第1,3日曜" -> "第1・第3日曜")"""
+    weeks, _ = token.value
+    return '・'.join(f"第{week}" for week in weeks) + token.text[-2:]
+
+
+def find_language_token(tokens: List[Token], start: int = 0, end: Optional[int] = None) -> Optional[Token]:
+    """[start, end) 범위에 완전히 포함된 언어 토큰 중 우선순위가 가장 높은 토큰"""
+    best = None
+    for token in tokens:
+        if token.kind != TOKEN_LANG or token.start < start:
+            continue
+        if end is not None and token.end > end:
+            continue
+        if best is None or LANGUAGE_PRIORITY[token.value] < LANGUAGE_PRIORITY[best.value]:
+            best = token
+    return best
+
+
+def time_spans(text: str, tokens: List[Token]) -> Optional[List[Tuple[Token, int, int]]]:
+    """
+    시간마다 (시간 토큰, 구간 시작, 구간 끝): 앞 시간의 괄호 뒤부터 자기 괄호 끝까지
+    (예: "第2日曜15:00(ポルトガル語)/第3日曜12:30(韓国語)" -> "第2日曜15:00(ポルトガル語)", "/第3日曜12:30(韓国語)")
+    시간이 두 개 이상이고 모든 시간 바로 뒤에 괄호가 있을 때만 목록, 아니면 None
+    """
+    times = [token for token in tokens if token.kind == TOKEN_TIME]
+    if len(times) < 2:
+        return None
+    spans = []
+    span_start = 0
+    for token in times:
+        note = TIME_NOTE_PATTERN.match(text, token.end)
+        if not note:
+            return None
+        spans.append((token, span_start, note.end()))
+        span_start = note.end()
+    return spans
+
+
+def last_token(tokens: List[Token], kind: str, start: int = 0, end: Optional[int] = None) -> Optional[Token]:
+    """[start, end) 범위의 마지막 kind 토큰"""
+    found = None
+    for token in tokens:
+        if token.kind == kind and token.start >= start and (end is None or token.end <= end):
+            found = token
+    return found
+
+
+def first_time(tokens: List[Token], start: int = 0, end: Optional[int] = None) -> Optional[str]:
+    """[start, end) 범위의 첫 번째 시간 토큰 값"""
+    for token in tokens:
+        if token.kind == TOKEN_TIME and token.start >= start and (end is None or token.end <= end):
+            return token.value
+    return None
+
+
+def split_by_sep(tokens: List[Token], start: int, end: int) -> List[Tuple[int, int]]:
+    """[start, end) 범위를 구분자 토큰 기준으로 분리한 구간 목록"""
+    spans = []
+    piece_start = start
+    for token in tokens:
+        if token.kind == TOKEN_SEP and start <= token.start < end:
+            spans.append((piece_start, token.start))
+            piece_start = token.end
+    spans.append((piece_start, end))
+    return spans
+
+
+def strip_offset(text: str, start: int, end: int) -> int:
+    """text[start:end].strip() 결과가 시작하는 위치"""
+    while start < end and text[start].isspace():
+        start += 1
+    return start
@@ -3,10 +3,14 @@
 파싱 가능한 빈 데이터 항목 처리 스크립트
 """
 
-import json
-import glob
-import os
 import re
+import sys
+from pathlib import Path
+
+from massparse import PARISHES_DIR, ParishManifest, iter_parish_files, process_parish_file, source_digest
+
+# 매니페스트 패스 ID (스크립트가 바뀌면 전체 재처리)
+PASS_ID = f'fix_parsable_empty:{source_digest(Path(__file__))}'
 
 def parse_week_pattern(mass_time_str):
     """주별 패턴 파싱 (제X주 일요일, 제X주 토요일 등)"""
@@ -117,68 +121,66 @@ def is_empty(parish):
     
     return mass_times_empty and foreign_empty
 
-def fix_parsable_empty():
-    """파싱 가능한 빈 데이터 항목 처리"""
-    parish_files = glob.glob("assets/data/parishes/*.json")
+def fix_parish(parish):
+    """빈 데이터 항목이고 주별 패턴으로 파싱 가능하면 채움, 변경 여부 반환"""
+    mass_time = parish.get('massTime', '').strip()
+    
+    if not mass_time:
+        return False
+    
+    # 빈 데이터 항목인지 확인
+    if not is_empty(parish):
+        return False
+    
+    # 파싱 가능한 패턴인지 확인
+    if not re.search(r'第\d+[・,]?第?\d*[日前]?[日土金]曜\s*\d{1,2}:\d{2}', mass_time):
+        return False
+    
+    # 파싱 시도
+    parsed = parse_week_pattern(mass_time)
+    
+    # 결과가 있는 경우 업데이트
+    has_results = False
+    for day, times in parsed['massTimes'].items():
+        if times and len(times) > 0:
+            has_results = True
+            break
+    
+    if not has_results:
+        return False
+    
+    parish['massTimes'] = parsed['massTimes']
+    parish['foreignMassTimes'] = parsed['foreignMassTimes']
+    print(f"  ✅ {parish.get('name', 'Unknown')}")
+    print(f"     {mass_time[:70]}")
+    return True
+
+def fix_parsable_empty(changed_only=False):
+    """
+    파싱 가능한 빈 데이터 항목 처리
+    changed_only: 마지막 실행 이후 massTime이 바뀐 성당만 처리
+    """
+    manifest = ParishManifest()
     total_fixed = 0
     files_modified = []
     
-    for file_path in sorted(parish_files):
+    for file_path in iter_parish_files(PARISHES_DIR):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # 백업은 실제로 파일을 쓸 때만 수정 전 원본으로 한 번 생성
+            fixed_in_file, _ = process_parish_file(
+                file_path, passes=(fix_parish,), backup_suffix='.json.bak_parsable',
+                manifest=manifest, pass_id=PASS_ID, changed_only=changed_only)
             
-            if 'parishes' not in data:
-                continue
-            
-            file_modified = False
-            fixed_in_file = 0
-            
-            for parish in data['parishes']:
-                mass_time = parish.get('massTime', '').strip()
-                
-                if not mass_time:
-                    continue
-                
-                # 빈 데이터 항목인지 확인
-                if is_empty(parish):
-                    # 파싱 가능한 패턴인지 확인
-                    if re.search(r'第\d+[・,]?第?\d*[日前]?[日土金]曜\s*\d{1,2}:\d{2}', mass_time):
-                        # 파싱 시도
-                        parsed = parse_week_pattern(mass_time)
-                        
-                        # 결과가 있는 경우 업데이트
-                        has_results = False
-                        for day, times in parsed['massTimes'].items():
-                            if times and len(times) > 0:
-                                has_results = True
-                                break
-                        
-                        if has_results:
-                            parish['massTimes'] = parsed['massTimes']
-                            parish['foreignMassTimes'] = parsed['foreignMassTimes']
-                            file_modified = True
-                            fixed_in_file += 1
-                            print(f"  ✅ {parish.get('name', 'Unknown')}")
-                            print(f"     {mass_time[:70]}")
-            
-            if file_modified:
-                # 백업 생성
-                backup_path = file_path + '.bak_parsable'
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                
-                # 원본 업데이트
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                
-                files_modified.append(os.path.basename(file_path))
+            if fixed_in_file > 0:
+                files_modified.append(file_path.name)
                 total_fixed += fixed_in_file
-                print(f"✅ [{os.path.basename(file_path)}] {fixed_in_file}개 수정")
+                print(f"✅ [{file_path.name}] {fixed_in_file}개 수정")
         
         except Exception as e:
             print(f"❌ Error processing {file_path}: {e}")
     
+    manifest.save()
+    
     print("\n" + "=" * 80)
     print(f"✅ 총 {total_fixed}개의 파싱 가능한 빈 데이터 항목 수정 완료")
     print(f"📝 수정된 파일: {len(files_modified)}개")
@@ -186,4 +188,4 @@ def fix_parsable_empty():
         print(f"   - {', '.join(files_modified)}")
 
 if __name__ == '__main__':
-    fix_parsable_empty()
+    fix_parsable_empty(changed_only='--changed-only' in sys.argv)
@@ -5,40 +5,8 @@ Remove ALL duplicate saints from saints_feast_days.json
 """
 import json
 from pathlib import Path
-import re
-
-def normalize_name(name):
-    """이름을 정규화하여 비교"""
-    if not name:
-        return ""
-    name = str(name).strip().lower()
-    # "Saint", "St.", "St" 제거
-    name = re.sub(r'\b(saint|st\.?)\s+', '', name, flags=re.IGNORECASE)
-    # 공백 제거
-    name = name.replace(" ", "").replace("　", "")
-    return name
-
-def normalize_korean_name(name):
-    """한국어 이름 정규화"""
-    if not name:
-        return ""
-    name = str(name).strip()
-    # "성", "聖" 제거
-    name = re.sub(r'^[성聖]\s*', '', name)
-    # 공백 제거
-    name = name.replace(" ", "").replace("　", "")
-    return name.lower()
-
-def get_saint_key(saint):
-    """성인의 고유 키 생성"""
-    # nameEn 정규화
-    name_en = normalize_name(saint.get('nameEn', ''))
-    # nameKo 정규화
-    name_ko = normalize_korean_name(saint.get('nameKo', ''))
-    
-    # nameEn 우선, 없으면 nameKo
-    key = name_en if name_en else name_ko
-    return key
+
+from saints import DedupRule, SaintDeduplicator, count_filled_fields, get_saint_key
 
 def are_saints_duplicate(saint1, saint2):
     """두 성인이 중복인지 확인"""
@@ -59,58 +27,70 @@ def are_saints_duplicate(saint1, saint2):
     
     return False
 
+def _saint_name(saint):
+    return saint.get('name', '').strip().lower()
+
+def _matches(saint, existing):
+    """키가 있으면 are_saints_duplicate, 없으면 name 비교"""
+    if get_saint_key(saint):
+        return are_saints_duplicate(saint, existing)
+    name1 = _saint_name(saint)
+    name2 = _saint_name(existing)
+    return bool(name1 and name2 and name1 == name2)
+
+def _bucket_keys(saint):
+    keys = []
+    name = _saint_name(saint)
+    if name:
+        keys.append(f"name:{name}")
+    key = get_saint_key(saint)
+    if key:
+        keys.append(f"key:{key}")
+    return keys
+
+# 키 버킷 + 3글자 이상 키의 포함 관계 색인
+DEDUP_RULE = DedupRule(_matches, bucket_keys=_bucket_keys, containment_key=get_saint_key, min_length=3)
+
+def is_better_saint(saint, existing):
+    """saint가 existing보다 완전한 데이터인지 (필드 수, "Saint" 표기, nameEn 길이)"""
+    saint_fields = count_filled_fields(saint)
+    existing_fields = count_filled_fields(existing)
+    
+    # nameEn이 더 완전한 것 우선
+    saint_name_en = saint.get('nameEn', '')
+    existing_name_en = existing.get('nameEn', '')
+    saint_has_saint = 'saint' in saint_name_en.lower()
+    existing_has_saint = 'saint' in existing_name_en.lower()
+    
+    return (saint_fields > existing_fields) or \
+           (saint_has_saint and not existing_has_saint) or \
+           (len(saint_name_en) > len(existing_name_en))
+
 def remove_duplicates_from_list(saints):
     """리스트에서 중복 제거 (더 완전한 데이터 우선)"""
     if len(saints) <= 1:
         return saints
     
-    unique_saints = []
+    dedup = SaintDeduplicator(DEDUP_RULE)
     seen_keys = set()
     
     for saint in saints:
         key = get_saint_key(saint)
-        is_duplicate = False
         
-        if key:
-            # 이미 본 키인지 확인
-            if key in seen_keys:
-                is_duplicate = True
-            else:
-                # 기존 unique_saints와 비교
-                for i, existing in enumerate(unique_saints):
-                    if are_saints_duplicate(saint, existing):
-                        is_duplicate = True
-                        # 더 완전한 데이터로 교체
-                        saint_fields = sum(1 for k, v in saint.items() if v and k not in ['month', 'day'])
-                        existing_fields = sum(1 for k, v in existing.items() if v and k not in ['month', 'day'])
-                        
-                        # nameEn이 더 완전한 것 우선
-                        saint_name_en = saint.get('nameEn', '')
-                        existing_name_en = existing.get('nameEn', '')
-                        saint_has_saint = 'saint' in saint_name_en.lower()
-                        existing_has_saint = 'saint' in existing_name_en.lower()
-                        
-                        if (saint_fields > existing_fields) or \
-                           (saint_has_saint and not existing_has_saint) or \
-                           (len(saint_name_en) > len(existing_name_en)):
-                            unique_saints[i] = saint
-                        break
-                
-                if not is_duplicate:
-                    seen_keys.add(key)
-        else:
-            # 키가 없으면 중복 체크만 (같은 name으로 비교)
-            name1 = saint.get('name', '').strip().lower()
-            for existing in unique_saints:
-                name2 = existing.get('name', '').strip().lower()
-                if name1 and name2 and name1 == name2:
-                    is_duplicate = True
-                    break
+        # 이미 본 키면 교체 없이 중복
+        if key and key in seen_keys:
+            continue
         
-        if not is_duplicate:
-            unique_saints.append(saint)
+        handle = dedup.find(saint)
+        if handle is None:
+            dedup.add(saint)
+            if key:
+                seen_keys.add(key)
+        elif key and is_better_saint(saint, dedup.get(handle)):
+            # 더 완전한 데이터로 교체 (키가 없으면 중복 체크만)
+            dedup.replace(handle, saint)
     
-    return unique_saints
+    return dedup.saints
 
 def main():
     file_path = Path(__file__).parent.parent / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
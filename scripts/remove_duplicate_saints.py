@@ -5,7 +5,8 @@ Remove duplicate saints from saints_feast_days.json
 """
 import json
 from pathlib import Path
-from collections import defaultdict
+
+from saints import DedupRule, SaintDeduplicator, count_filled_fields
 
 def normalize_name(name):
     """이름을 정규화하여 비교 (Saint, St. 등 제거)"""
@@ -44,53 +45,62 @@ def are_saints_duplicate(saint1, saint2):
     
     return False
 
+def _bucket_keys(saint):
+    """are_saints_duplicate의 세 조건별 버킷 (nameEn, nameKo, name)"""
+    keys = []
+    name_en = normalize_name(saint.get('nameEn', ''))
+    if name_en:
+        keys.append(f"en:{name_en}")
+    name_ko = saint.get('nameKo', '').strip()
+    if name_ko:
+        keys.append(f"ko:{name_ko}")
+    name = normalize_name(saint.get('name', ''))
+    if name:
+        keys.append(f"name:{name}")
+    return keys
+
+DEDUP_RULE = DedupRule(are_saints_duplicate, bucket_keys=_bucket_keys)
+
+def get_saint_key(saint):
+    """고유 키 생성 (nameEn 또는 nameKo 사용)"""
+    name_en = saint.get('nameEn', '').strip().lower()
+    name_ko = saint.get('nameKo', '').strip()
+    
+    if name_en:
+        return f"en:{normalize_name(name_en)}"
+    elif name_ko:
+        return f"ko:{name_ko}"
+    return f"name:{normalize_name(saint.get('name', ''))}"
+
 def remove_duplicates_from_list(saints):
     """리스트에서 중복 제거 (더 완전한 데이터 우선)"""
     if len(saints) <= 1:
         return saints
     
-    # 중복 그룹 찾기
-    unique_saints = []
+    dedup = SaintDeduplicator(DEDUP_RULE)
     seen = set()
     
-    for i, saint in enumerate(saints):
-        is_duplicate = False
-        saint_key = None
-        
-        # 고유 키 생성 (nameEn 또는 nameKo 사용)
-        name_en = saint.get('nameEn', '').strip().lower()
-        name_ko = saint.get('nameKo', '').strip()
-        
-        if name_en:
-            saint_key = f"en:{normalize_name(name_en)}"
-        elif name_ko:
-            saint_key = f"ko:{name_ko}"
-        else:
-            saint_key = f"name:{normalize_name(saint.get('name', ''))}"
+    for saint in saints:
+        saint_key = get_saint_key(saint)
         
         # 이미 본 성인인지 확인
         if saint_key in seen:
-            is_duplicate = True
-        else:
-            # 기존 unique_saints와 비교
-            for existing in unique_saints:
-                if are_saints_duplicate(saint, existing):
-                    is_duplicate = True
-                    # 더 완전한 데이터로 교체
-                    saint_fields = sum(1 for v in saint.values() if v)
-                    existing_fields = sum(1 for v in existing.values() if v)
-                    if saint_fields > existing_fields:
-                        unique_saints.remove(existing)
-                        unique_saints.append(saint)
-                        seen.remove(saint_key)
-                        seen.add(saint_key)
-                    break
+            continue
+        
+        handle = dedup.find(saint)
+        if handle is None:
+            dedup.add(saint)
+            seen.add(saint_key)
+            continue
         
-        if not is_duplicate:
-            unique_saints.append(saint)
+        # 더 완전한 데이터로 교체 (교체된 성인은 목록 끝으로)
+        saint_fields = count_filled_fields(saint, exclude=())
+        existing_fields = count_filled_fields(dedup.get(handle), exclude=())
+        if saint_fields > existing_fields:
+            dedup.replace(handle, saint, move_to_end=True)
             seen.add(saint_key)
     
-    return unique_saints
+    return dedup.saints
 
 def main():
     file_path = Path(__file__).parent.parent / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
@@ -6,6 +6,26 @@ Remove duplicate saints from saints_feast_days.json
 import json
 from pathlib import Path
 
+from saints import DedupRule, SaintDeduplicator
+
+def get_direct_key(saint):
+    """고유 키 생성 (정규화된 nameEn 우선, 없으면 nameKo)"""
+    name_en = saint.get('nameEn', '').lower().strip()
+    name_en_norm = name_en.replace('saint ', '').replace('st. ', '').replace('st ', '').strip()
+    
+    name_ko = saint.get('nameKo', '').strip()
+    name_ko_norm = name_ko.replace('성 ', '').replace('성', '').replace(' ', '').strip()
+    
+    return name_en_norm if name_en_norm else name_ko_norm
+
+def _bucket_keys(saint):
+    key = get_direct_key(saint)
+    return [key] if key else []
+
+# 키가 같으면 중복
+DEDUP_RULE = DedupRule(lambda saint, existing: get_direct_key(saint) == get_direct_key(existing),
+                       bucket_keys=_bucket_keys)
+
 def main():
     file_path = Path(__file__).parent.parent / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
     
@@ -36,35 +56,20 @@ def main():
     total_removed = 0
     for day_data in data['days']:
         saints = day_data['saints']
-        unique_saints = []
-        seen_keys = set()
+        dedup = SaintDeduplicator(DEDUP_RULE)
         
         for saint in saints:
-            # 고유 키 생성 (nameEn 정규화)
-            name_en = saint.get('nameEn', '').lower().strip()
-            name_en_norm = name_en.replace('saint ', '').replace('st. ', '').replace('st ', '').strip()
-            
-            # nameKo 정규화
-            name_ko = saint.get('nameKo', '').strip()
-            name_ko_norm = name_ko.replace('성 ', '').replace('성', '').replace(' ', '').strip()
-            
-            # 키 생성 (nameEn 우선, 없으면 nameKo)
-            key = name_en_norm if name_en_norm else name_ko_norm
-            
-            if key and key not in seen_keys:
-                seen_keys.add(key)
-                unique_saints.append(saint)
-            elif key:
+            # 키가 없으면 그냥 추가
+            if not get_direct_key(saint) or dedup.find(saint) is None:
+                dedup.add(saint)
+            else:
                 total_removed += 1
                 date_str = day_data.get('date', f"{day_data['month']}-{day_data['day']}")
                 saint_name = saint.get('nameEn', saint.get('name', ''))
                 print(f"중복 제거: {date_str} - {saint_name}")
-            else:
-                # 키가 없으면 그냥 추가
-                unique_saints.append(saint)
         
-        if len(unique_saints) < len(saints):
-            day_data['saints'] = unique_saints
+        if len(dedup) < len(saints):
+            day_data['saints'] = dedup.saints
     
     print(f'\n전체 중복 제거: {total_removed}개')
     
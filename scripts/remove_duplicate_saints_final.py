@@ -5,29 +5,8 @@ Remove duplicate saints from saints_feast_days.json
 """
 import json
 from pathlib import Path
-import re
-
-def normalize_name(name):
-    """이름을 정규화하여 비교"""
-    if not name:
-        return ""
-    name = str(name).strip().lower()
-    # "Saint", "St.", "St" 제거
-    name = re.sub(r'\b(saint|st\.?)\s+', '', name, flags=re.IGNORECASE)
-    # 공백 제거
-    name = name.replace(" ", "").replace("　", "")
-    return name
-
-def normalize_korean_name(name):
-    """한국어 이름 정규화 (성, 聖 등 제거)"""
-    if not name:
-        return ""
-    name = str(name).strip()
-    # "성", "聖" 제거
-    name = re.sub(r'^[성聖]\s*', '', name)
-    # 공백 제거
-    name = name.replace(" ", "").replace("　", "")
-    return name.lower()
+
+from saints import DedupRule, count_filled_fields, dedupe, normalize_korean_name, normalize_name
 
 def are_saints_duplicate(saint1, saint2):
     """두 성인이 중복인지 확인"""
@@ -64,36 +43,38 @@ def are_saints_duplicate(saint1, saint2):
     
     return False
 
-def remove_duplicates_from_list(saints):
-    """리스트에서 중복 제거 (더 완전한 데이터 우선)"""
-    if len(saints) <= 1:
-        return saints
+def _name_en_key(saint):
+    return normalize_name(saint.get('nameEn', ''))
+
+def _bucket_keys(saint):
+    keys = []
+    name_en = _name_en_key(saint)
+    if name_en:
+        keys.append(f"en:{name_en}")
+    # 정규화 후 비어 있는 nameKo("성")도 마지막 판정 조건을 위해 버킷에 넣음
+    name_ko = saint.get('nameKo', '').strip()
+    if name_ko:
+        keys.append(f"ko:{normalize_korean_name(name_ko)}")
+    return keys
+
+# nameEn/nameKo 버킷 + 3글자 이상 nameEn의 포함 관계 색인
+DEDUP_RULE = DedupRule(are_saints_duplicate, bucket_keys=_bucket_keys, containment_key=_name_en_key, min_length=3)
+
+def is_better_saint(saint, existing):
+    """saint가 existing보다 완전한 데이터인지"""
+    # 더 완전한 데이터로 교체 (더 많은 필드가 있는 것)
+    saint_fields = count_filled_fields(saint)
+    existing_fields = count_filled_fields(existing)
     
-    unique_saints = []
+    # nameEn이 더 완전한 것 우선 (예: "Saint Monica" > "Monica")
+    saint_has_full_name = 'Saint' in str(saint.get('nameEn', '')).title() or len(str(saint.get('nameEn', ''))) > len(str(existing.get('nameEn', '')))
+    existing_has_full_name = 'Saint' in str(existing.get('nameEn', '')).title() or len(str(existing.get('nameEn', ''))) > len(str(saint.get('nameEn', '')))
     
-    for saint in saints:
-        is_duplicate = False
-        
-        # 기존 unique_saints와 비교
-        for i, existing in enumerate(unique_saints):
-            if are_saints_duplicate(saint, existing):
-                is_duplicate = True
-                # 더 완전한 데이터로 교체 (더 많은 필드가 있는 것)
-                saint_fields = sum(1 for k, v in saint.items() if v and k not in ['month', 'day'])
-                existing_fields = sum(1 for k, v in existing.items() if v and k not in ['month', 'day'])
-                
-                # nameEn이 더 완전한 것 우선 (예: "Saint Monica" > "Monica")
-                saint_has_full_name = 'Saint' in str(saint.get('nameEn', '')).title() or len(str(saint.get('nameEn', ''))) > len(str(existing.get('nameEn', '')))
-                existing_has_full_name = 'Saint' in str(existing.get('nameEn', '')).title() or len(str(existing.get('nameEn', ''))) > len(str(saint.get('nameEn', '')))
-                
-                if saint_fields > existing_fields or (saint_has_full_name and not existing_has_full_name):
-                    unique_saints[i] = saint
-                break
-        
-        if not is_duplicate:
-            unique_saints.append(saint)
-    
-    return unique_saints
+    return saint_fields > existing_fields or (saint_has_full_name and not existing_has_full_name)
+
+def remove_duplicates_from_list(saints):
+    """리스트에서 중복 제거 (더 완전한 데이터 우선)"""
+    return dedupe(saints, DEDUP_RULE, is_better_saint)
 
 def main():
     file_path = Path(__file__).parent.parent / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
@@ -6,6 +6,8 @@ Remove duplicate saints from saints_feast_days.json
 import json
 from pathlib import Path
 
+from saints import DedupRule, count_filled_fields, dedupe
+
 def normalize_name(name):
     """이름을 정규화하여 비교"""
     if not name:
@@ -42,32 +44,26 @@ def are_saints_duplicate(saint1, saint2):
     
     return False
 
+def _name_en_key(saint):
+    return normalize_name(saint.get('nameEn', ''))
+
+def _name_ko_key(saint):
+    return saint.get('nameKo', '').strip().replace(" ", "").replace("성", "").replace("聖", "")
+
+def _bucket_keys(saint):
+    name_ko = _name_ko_key(saint)
+    return [f"ko:{name_ko}"] if name_ko else []
+
+# nameKo 버킷 + nameEn 포함 관계 색인 (길이 제한 없음)
+DEDUP_RULE = DedupRule(are_saints_duplicate, bucket_keys=_bucket_keys, containment_key=_name_en_key, min_length=1)
+
+def is_better_saint(saint, existing):
+    """더 많은 필드가 있는 쪽을 더 완전한 데이터로 봄"""
+    return count_filled_fields(saint) > count_filled_fields(existing)
+
 def remove_duplicates_from_list(saints):
     """리스트에서 중복 제거 (더 완전한 데이터 우선)"""
-    if len(saints) <= 1:
-        return saints
-    
-    unique_saints = []
-    
-    for saint in saints:
-        is_duplicate = False
-        
-        # 기존 unique_saints와 비교
-        for i, existing in enumerate(unique_saints):
-            if are_saints_duplicate(saint, existing):
-                is_duplicate = True
-                # 더 완전한 데이터로 교체 (더 많은 필드가 있는 것)
-                saint_fields = sum(1 for k, v in saint.items() if v and k not in ['month', 'day'])
-                existing_fields = sum(1 for k, v in existing.items() if v and k not in ['month', 'day'])
-                
-                if saint_fields > existing_fields:
-                    unique_saints[i] = saint
-                break
-        
-        if not is_duplicate:
-            unique_saints.append(saint)
-    
-    return unique_saints
+    return dedupe(saints, DEDUP_RULE, is_better_saint)
 
 def main():
     file_path = Path(__file__).parent.parent / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
@@ -2,15 +2,31 @@
 """
 같은 날짜 내에서 nameEn과 nameKo가 정확히 동일한 중복 제거
 """
-import json
 from pathlib import Path
 
+from saints import DedupRule, SaintDeduplicator, SaintsStore
+
+def exact_key(saint):
+    """"nameEn|||nameKo" 키 (둘 중 하나라도 없으면 빈 문자열)"""
+    name_en = saint.get('nameEn', '').strip()
+    name_ko = saint.get('nameKo', '').strip()
+    if name_en and name_ko:
+        return f"{name_en}|||{name_ko}"
+    return ""
+
+def _bucket_keys(saint):
+    key = exact_key(saint)
+    return [key] if key else []
+
+# nameEn과 nameKo가 정확히 같으면 중복
+EXACT_RULE = DedupRule(lambda saint, existing: exact_key(saint) == exact_key(existing),
+                       bucket_keys=_bucket_keys)
+
 def main():
     file_path = Path(__file__).parent.parent / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
     
     print(f"파일 읽기: {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = SaintsStore.load(file_path)
     
     print("="*60)
     print("같은 날짜 내에서 nameEn과 nameKo가 동일한 중복 찾기 및 제거")
@@ -22,60 +38,50 @@ def main():
     # type 우선순위 (높을수록 우선)
     type_priority = {'solemnity': 3, 'feast': 2, 'memorial': 1}
     
-    for day_data in data.get('days', []):
-        month = day_data.get('month')
-        day = day_data.get('day')
+    for month, day in store.dates():
         date_key = f"{month:02d}-{day:02d}"
-        saints = day_data.get('saints', [])
+        saints = store.saints_on(month, day)
         
-        # 중복 제거
-        unique_saints = []
-        seen = {}  # key: "nameEn|||nameKo" -> saint
+        # 중복 제거 (nameEn과 nameKo가 모두 있는 성인만 비교)
+        dedup = SaintDeduplicator(EXACT_RULE)
         
         for saint in saints:
-            name_en = saint.get('nameEn', '').strip()
-            name_ko = saint.get('nameKo', '').strip()
+            if not exact_key(saint):
+                # nameEn이나 nameKo가 없는 경우는 그냥 추가
+                dedup.add(saint)
+                continue
+            
+            handle = dedup.find(saint)
+            if handle is None:
+                dedup.add(saint)
+                continue
             
-            # nameEn과 nameKo가 모두 있는 경우
-            if name_en and name_ko:
-                key = f"{name_en}|||{name_ko}"
-                
-                if key in seen:
-                    # 중복 발견
-                    existing = seen[key]
-                    existing_priority = type_priority.get(existing.get('type', ''), 0)
-                    current_priority = type_priority.get(saint.get('type', ''), 0)
-                    
-                    # 더 높은 우선순위로 교체
-                    if current_priority > existing_priority:
-                        # 기존 것을 제거하고 새로운 것으로 교체
-                        unique_saints.remove(existing)
-                        unique_saints.append(saint)
-                        seen[key] = saint
-                        total_removed += 1
-                        duplicates_info.append({
-                            'date': date_key,
-                            'removed': existing,
-                            'kept': saint
-                        })
-                    else:
-                        # 기존 것을 유지
-                        total_removed += 1
-                        duplicates_info.append({
-                            'date': date_key,
-                            'removed': saint,
-                            'kept': existing
-                        })
-                else:
-                    seen[key] = saint
-                    unique_saints.append(saint)
+            # 중복 발견
+            existing = dedup.get(handle)
+            existing_priority = type_priority.get(existing.get('type', ''), 0)
+            current_priority = type_priority.get(saint.get('type', ''), 0)
+            total_removed += 1
+            
+            # 더 높은 우선순위로 교체
+            if current_priority > existing_priority:
+                # 기존 것을 제거하고 새로운 것을 끝에 추가
+                dedup.replace(handle, saint, move_to_end=True)
+                duplicates_info.append({
+                    'date': date_key,
+                    'removed': existing,
+                    'kept': saint
+                })
             else:
-                # nameEn이나 nameKo가 없는 경우는 그냥 추가
-                unique_saints.append(saint)
+                # 기존 것을 유지
+                duplicates_info.append({
+                    'date': date_key,
+                    'removed': saint,
+                    'kept': existing
+                })
         
-        # 중복이 제거된 경우 업데이트
-        if len(unique_saints) < len(saints):
-            day_data['saints'] = unique_saints
+        # 중복이 제거된 경우 업데이트 (stats는 저장소가 함께 갱신)
+        if len(dedup) < len(saints):
+            store.set_saints(month, day, dedup.saints)
     
     # 결과 출력
     print(f"\n총 {total_removed}개 중복 제거됨")
@@ -95,8 +101,7 @@ def main():
     
     # 파일 저장
     print(f"\n파일 저장 중...")
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save()
     
     print("완료!")
 
@@ -0,0 +1,71 @@
+"""
+성인 축일 데이터(saints_feast_days.json) 처리 패키지
+날짜 색인 저장소, 바이너리 번들, 업데이트 저널, 다국어 이름 색인과 퍼지 매처,
+이름 정규화, 중복 제거 엔진, 일괄 검증, 번역 백엔드·묶음 번역·번역 메모리·토큰 용어집을 스크립트들이 공유
+HTTP 번역 클라이언트는 requests가 필요하므로 saints.client에서 직접 import
+다국어 이름 색인 다시 생성: python -m saints (saints.names는 다른 모듈이 import하므로 CLI를 __main__에 둠)
+python -m으로도 실행하는 모듈은 다시 내보내지 않으므로 모듈에서 직접 import (saints.bundle, saints.validate, saints.memory, saints.glossary)
+"""
+
+from .backends import (
+    ChatError,
+    GlossaryBackend,
+    StubBackend,
+    TranslationBackend,
+    create_backend,
+    load_env,
+    load_env_file,
+)
+from .batch import BATCH_SIZE, LANGUAGE_INFO, BatchItem, group_by_name, translate_batches
+from .dedup import DedupRule, SaintDeduplicator, dedupe
+from .journal import JOURNAL_DIR, UpdateJournal
+from .matcher import MATCH_THRESHOLD, Match, NameMatcher, name_score
+from .names import NAME_FIELDS, NameIndex, name_index_path, normalize_for
+from .normalize import (
+    count_filled_fields,
+    extract_core_name,
+    get_saint_key,
+    normalize_korean_name,
+    normalize_name,
+    normalize_plain_name,
+)
+from .store import ID_KEY, SAINT_LISTS, SAINTS_PATH, SaintsStore, date_key
+
+__all__ = [
+    'BATCH_SIZE',
+    'BatchItem',
+    'ChatError',
+    'DedupRule',
+    'GlossaryBackend',
+    'ID_KEY',
+    'JOURNAL_DIR',
+    'LANGUAGE_INFO',
+    'MATCH_THRESHOLD',
+    'Match',
+    'NAME_FIELDS',
+    'NameIndex',
+    'NameMatcher',
+    'SAINTS_PATH',
+    'SAINT_LISTS',
+    'SaintDeduplicator',
+    'SaintsStore',
+    'StubBackend',
+    'TranslationBackend',
+    'UpdateJournal',
+    'count_filled_fields',
+    'create_backend',
+    'date_key',
+    'dedupe',
+    'extract_core_name',
+    'get_saint_key',
+    'group_by_name',
+    'load_env',
+    'load_env_file',
+    'name_index_path',
+    'name_score',
+    'normalize_for',
+    'normalize_korean_name',
+    'normalize_name',
+    'normalize_plain_name',
+    'translate_batches',
+]
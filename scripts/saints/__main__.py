@@ -0,0 +1,35 @@
+"""
+python -m saints [데이터 파일 경로]
+성인에게 id 부여 → 다국어 이름 색인(saints_name_index.json) 다시 생성 → 다시 읽어 검증
+"""
+
+import sys
+from pathlib import Path
+
+from .names import NameIndex, file_digest, name_index_path
+from .store import SAINTS_PATH, SaintsStore
+
+
+def main():
+    """id 부여 → 색인 생성 → 저장 → 다시 읽어 검증"""
+    saints_path = Path(sys.argv[1]) if len(sys.argv) > 1 else SAINTS_PATH
+    store = SaintsStore.load(saints_path)
+    assigned = store.assign_ids()
+    if assigned:
+        store.save()
+        print(f"🆔 id {assigned}개 부여: {saints_path}")
+
+    output_path = name_index_path(saints_path)
+    index = NameIndex.build(store, file_digest(saints_path))
+    index.save(output_path)
+
+    if NameIndex.load(output_path) != index:
+        print(f"❌ 검증 실패: {output_path}")
+        sys.exit(1)
+
+    counts = ', '.join(f"{lang} {len(names)}" for lang, names in index.names.items())
+    print(f"✅ {output_path}: 성인 {len(store)}명, 이름 키 {counts}")
+
+
+if __name__ == '__main__':
+    main()
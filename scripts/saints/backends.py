@@ -0,0 +1,262 @@
+"""
+번역 백엔드
+번역 스크립트는 백엔드의 complete(messages, ..., items)만 호출하고, 어떤 백엔드를 쓸지는 설정으로 고름
+- openai: OpenAI 호환 chat completions HTTP API (saints.client.ChatClient, requests 필요)
+- stub: 네트워크 없이 지정한 지연 시간 뒤 결정적인 번역을 돌려줌 (처리량·동시성 측정용)
+- glossary: 데이터에 이미 있는 번역 (saints.glossary — 일본어·영어 이름이 같은 항목의 번역, 없으면 토큰 번역 조합)
+  'glossary+openai'처럼 앞에 두면 표에 없는 이름만 다음 백엔드로 넘김
+items는 요청에 담긴 (일본어 이름, 영어 이름, 언어 목록) — HTTP 백엔드는 무시하고 stub/glossary가 사용
+
+설정 (.env, 같은 이름의 환경 변수가 우선)
+  OPENAI_API_KEY, OPENAI_API_URL, OPENAI_MODEL
+  TRANSLATION_BACKEND (기본 openai), TRANSLATION_CONCURRENCY, TRANSLATION_RATE, TRANSLATION_STUB_LATENCY
+
+처리량 측정: python -m saints.bench
+"""
+
+import abc
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from .store import SAINTS_PATH, SaintsStore
+
+if TYPE_CHECKING:
+    from .glossary import TokenGlossary
+
+# 프로젝트 루트의 .env
+ENV_PATH = Path(__file__).parent.parent.parent / '.env'
+
+DEFAULT_BACKEND = 'openai'
+
+# stub 기본값 (요청당 지연 시간, 동시에 처리하는 요청 수)
+STUB_LATENCY = 0.05
+STUB_CONCURRENCY = 8
+
+Messages = List[Dict[str, str]]
+# (일본어 이름, 영어 이름, 언어 목록) — saints.batch.BatchItem과 같은 모양
+TranslationItem = Tuple[str, str, Sequence[str]]
+
+
+class ChatError(RuntimeError):
+    """백엔드가 응답을 주지 못함 (재시도 후 실패, 용어집에 없는 이름 등)"""
+
+
+def load_env(path: Path = ENV_PATH) -> Dict[str, str]:
+    """.env의 KEY=VALUE (따옴표 제거) 위에 같은 이름의 환경 변수를 덮어쓴 설정"""
+    env: Dict[str, str] = {}
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                env[key.strip()] = value.strip().strip('"').strip("'")
+    for key, value in os.environ.items():
+        if key in env or key.startswith(('OPENAI_', 'TRANSLATION_')):
+            env[key] = value
+    return env
+
+
+def load_env_file(path: Path = ENV_PATH) -> Optional[str]:
+    """OPENAI_API_KEY (.env 또는 환경 변수, 없으면 None)"""
+    if not path.exists():
+        print(f".env 파일을 찾을 수 없습니다: {path}")
+    return load_env(path).get('OPENAI_API_KEY') or None
+
+
+class TranslationBackend(abc.ABC):
+    """번역 백엔드 공통 인터페이스 (async with로 쓰고 나면 close)"""
+
+    name = 'backend'
+
+    def __init__(self):
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+
+    async def __aenter__(self) -> 'TranslationBackend':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        pass
+
+    @abc.abstractmethod
+    async def complete(
+        self,
+        messages: Messages,
+        temperature: float = 0.3,
+        max_tokens: int = 100,
+        response_format: Optional[Dict[str, str]] = None,
+        items: Sequence[TranslationItem] = (),
+    ) -> str:
+        """응답 메시지 내용 (실패하면 ChatError)"""
+
+    def summary(self) -> str:
+        return (f"{self.name}: 요청 {self.stats['requests']}회, 재시도 {self.stats['retries']}회, "
+                f"실패 {self.stats['failures']}건")
+
+
+def _wants_json(response_format: Optional[Dict[str, str]]) -> bool:
+    return bool(response_format) and response_format.get('type') == 'json_object'
+
+
+def _batch_content(translations: Dict[int, Dict[str, str]]) -> str:
+    """묶음 요청 응답 형식 (saints.batch.parse_batch_response가 읽는 모양)"""
+    return json.dumps(
+        {'translations': [{'key': key, **names} for key, names in sorted(translations.items())]},
+        ensure_ascii=False,
+    )
+
+
+class StubBackend(TranslationBackend):
+    """
+    네트워크 없이 latency초 뒤 결정적인 번역을 돌려주는 백엔드
+    같은 (이름, 언어)에는 항상 같은 값을 주고, 동시에 concurrency개까지만 처리 (서버 병렬도 흉내)
+    """
+
+    name = 'stub'
+
+    def __init__(self, latency: float = STUB_LATENCY, concurrency: int = STUB_CONCURRENCY):
+        super().__init__()
+        self.latency = latency
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    @staticmethod
+    def translate(name: str, name_en: str, lang: str) -> str:
+        return f"stub-{lang}:{name_en or name}"
+
+    async def complete(self, messages, temperature=0.3, max_tokens=100, response_format=None, items=()) -> str:
+        async with self._semaphore:
+            self.stats['requests'] += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        if _wants_json(response_format):
+            return _batch_content({
+                key: {lang: self.translate(name, name_en, lang) for lang in languages}
+                for key, (name, name_en, languages) in enumerate(items)
+            })
+        if items:
+            name, name_en, languages = items[0]
+            return self.translate(name, name_en, languages[0])
+        digest = hashlib.sha1(json.dumps(messages, ensure_ascii=False).encode('utf-8')).hexdigest()
+        return f"stub:{digest[:8]}"
+
+
+class GlossaryBackend(TranslationBackend):
+    """
+    saints.glossary.TokenGlossary로 답하는 백엔드 (일본어·영어 이름이 같은 항목의 번역, 토큰 번역 조합)
+    번역이 서로 다르거나 동명이인이 있는 이름은 답하지 않음
+    요청한 번역이 모두 용어집에 있으면 바로 답하고, 아니면 fallback 백엔드에 넘김 (없으면 ChatError)
+    묶음 요청을 넘긴 경우 응답에 용어집의 번역을 덮어써서 같은 성인의 표기를 맞춤
+    """
+
+    name = 'glossary'
+
+    def __init__(self, glossary: 'TokenGlossary', fallback: Optional[TranslationBackend] = None):
+        super().__init__()
+        self.glossary = glossary
+        self.fallback = fallback
+        self.stats['hits'] = 0
+
+    @classmethod
+    def from_store(cls, store: SaintsStore, fallback: Optional[TranslationBackend] = None) -> 'GlossaryBackend':
+        """데이터의 번역으로 용어집 생성"""
+        from .glossary import TokenGlossary  # python -m saints.glossary로도 실행하므로 패키지 로드 시 import하지 않음
+        return cls(TokenGlossary.from_store(store), fallback)
+
+    def lookup(self, name: str, name_en: str, lang: str) -> Optional[str]:
+        return self.glossary.resolve(name, name_en, lang)
+
+    def close(self):
+        if self.fallback is not None:
+            self.fallback.close()
+
+    async def complete(self, messages, temperature=0.3, max_tokens=100, response_format=None, items=()) -> str:
+        known: Dict[int, Dict[str, str]] = {}
+        missing = not items
+        for key, (name, name_en, languages) in enumerate(items):
+            for lang in languages:
+                value = self.lookup(name, name_en, lang)
+                if value:
+                    known.setdefault(key, {})[lang] = value
+                else:
+                    missing = True
+
+        if not missing:
+            self.stats['requests'] += 1
+            self.stats['hits'] += sum(len(names) for names in known.values())
+            return _batch_content(known) if _wants_json(response_format) else known[0][items[0][2][0]]
+
+        if self.fallback is None:
+            self.stats['failures'] += 1
+            raise ChatError("용어집에 없는 이름")
+        content = await self.fallback.complete(messages, temperature, max_tokens, response_format, items)
+        if not _wants_json(response_format) or not known:
+            return content
+        try:
+            data = json.loads(content)
+            for entry in data['translations']:
+                entry.update(known.get(entry.get('key'), {}))
+            self.stats['hits'] += sum(len(names) for names in known.values())
+            return json.dumps(data, ensure_ascii=False)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return content
+
+    def summary(self) -> str:
+        text = f"{self.name}: 적중 {self.stats['hits']}건 ({self.glossary.summary()})"
+        return f"{text}, {self.fallback.summary()}" if self.fallback is not None else text
+
+
+def _terminal_backend(name: str, env: Dict[str, str]) -> TranslationBackend:
+    if name == 'openai':
+        api_key = env.get('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY를 찾을 수 없습니다.")
+        from .client import ChatClient  # requests는 HTTP 백엔드를 쓸 때만 필요
+        options: Dict[str, Any] = {}
+        if env.get('OPENAI_API_URL'):
+            options['url'] = env['OPENAI_API_URL']
+        if env.get('OPENAI_MODEL'):
+            options['model'] = env['OPENAI_MODEL']
+        if env.get('TRANSLATION_CONCURRENCY'):
+            options['concurrency'] = int(env['TRANSLATION_CONCURRENCY'])
+        if env.get('TRANSLATION_RATE'):
+            options['rate'] = float(env['TRANSLATION_RATE'])
+        return ChatClient(api_key, **options)
+    if name == 'stub':
+        return StubBackend(
+            latency=float(env.get('TRANSLATION_STUB_LATENCY', STUB_LATENCY)),
+            concurrency=int(env.get('TRANSLATION_CONCURRENCY', STUB_CONCURRENCY)),
+        )
+    raise ValueError(f"알 수 없는 번역 백엔드: {name}")
+
+
+def create_backend(
+    spec: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    saints_path: Path = SAINTS_PATH,
+) -> TranslationBackend:
+    """
+    'openai', 'stub', 'glossary', 'glossary+openai', 'glossary+stub' 같은 설정으로 백엔드 생성
+    spec이 없으면 TRANSLATION_BACKEND 설정 (기본 openai), 설정이 잘못되면 ValueError
+    """
+    env = load_env() if env is None else env
+    spec = spec or env.get('TRANSLATION_BACKEND') or DEFAULT_BACKEND
+    *fronts, last = [part.strip() for part in spec.split('+')]
+
+    if last == 'glossary':
+        fronts.append(last)
+        backend = None
+    else:
+        backend = _terminal_backend(last, env)
+    for name in reversed(fronts):
+        if name != 'glossary':
+            raise ValueError(f"'+' 앞에는 glossary만 올 수 있습니다: {spec}")
+        backend = GlossaryBackend.from_store(SaintsStore.load(saints_path), backend)
+    return backend
@@ -0,0 +1,193 @@
+"""
+여러 성인의 누락된 언어를 한 번의 요청으로 번역
+요청: 성인마다 {"key", "name", "nameEn", "languages"}를 담은 JSON 목록 + 언어별 표기 규칙
+응답: {"translations": [{"key": 0, "ko": "...", "vi": "..."}, ...]} JSON 객체
+응답은 항목마다 형식을 검사하고, 빠졌거나 형식이 맞지 않는 (성인, 언어)만 개별 요청으로 다시 번역
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .backends import ChatError, Messages, TranslationBackend
+
+# 요청 하나에 담는 성인 수
+BATCH_SIZE = 20
+
+# 응답 토큰 한도 (고정분 + 번역 필드당)
+BATCH_BASE_TOKENS = 64
+BATCH_TOKENS_PER_FIELD = 40
+
+# 번역 결과로 인정하는 최대 길이
+MAX_NAME_LENGTH = 100
+
+# 언어 코드 → 이름, 접두사, 예시
+LANGUAGE_INFO = {
+    'ko': {
+        'name': '한국어',
+        'prefix': '성',
+        'example': '성 요한, 성 마리아'
+    },
+    'zh': {
+        'name': '중국어(简体中文)',
+        'prefix': '聖',
+        'example': '聖若望, 聖瑪利亞'
+    },
+    'vi': {
+        'name': 'Tiếng Việt',
+        'prefix': 'Thánh',
+        'example': 'Thánh Gioan, Thánh Maria'
+    },
+    'es': {
+        'name': 'Español',
+        'prefix': 'San/Santa',
+        'example': 'San Juan, Santa María'
+    },
+    'pt': {
+        'name': 'Português',
+        'prefix': 'São/Santa',
+        'example': 'São João, Santa Maria'
+    },
+}
+
+
+class BatchItem(NamedTuple):
+    """번역할 성인 이름 하나와 필요한 언어"""
+    name: str
+    name_en: str
+    languages: Tuple[str, ...]
+
+
+# (항목, 언어) → 번역 (실패하면 None)
+Fallback = Callable[[BatchItem, str], Awaitable[Optional[str]]]
+# 번역(또는 실패)이 확정될 때마다 호출
+ResultCallback = Callable[[BatchItem, str, Optional[str]], None]
+
+
+def group_by_name(keys: Iterable[Tuple[str, str, str]]) -> List[BatchItem]:
+    """(일본어 이름, 영어 이름, 언어) 목록 → 이름별 항목 (처음 나온 순서)"""
+    languages: Dict[Tuple[str, str], List[str]] = {}
+    for name, name_en, lang in keys:
+        languages.setdefault((name, name_en), []).append(lang)
+    return [BatchItem(name, name_en, tuple(langs)) for (name, name_en), langs in languages.items()]
+
+
+def build_batch_messages(items: List[BatchItem]) -> Messages:
+    """항목 목록 번역 요청 (key는 목록 안의 위치)"""
+    used = sorted({lang for item in items for lang in item.languages}, key=list(LANGUAGE_INFO).index)
+    rules = '\n'.join(
+        f"- {lang}: {LANGUAGE_INFO[lang]['name']}, {LANGUAGE_INFO[lang]['prefix']} 접두사 포함 "
+        f"(예: {LANGUAGE_INFO[lang]['example']})"
+        for lang in used
+    )
+    saints = json.dumps(
+        [
+            {'key': key, 'name': item.name, 'nameEn': item.name_en, 'languages': list(item.languages)}
+            for key, item in enumerate(items)
+        ],
+        ensure_ascii=False,
+    )
+    prompt = f'''다음 가톨릭 성인들의 이름을 각 항목의 languages에 있는 언어로 번역해주세요.
+
+언어별 표기:
+{rules}
+
+성인 목록 (name: 일본어 이름, nameEn: 영어 이름):
+{saints}
+
+요구사항:
+- 가톨릭 전례에서 사용하는 표준 이름 사용
+- 모든 key에 대해 요청한 언어를 빠짐없이 채울 것
+- 설명 없이 다음 형식의 JSON 객체만 반환: {{"translations": [{{"key": 0, "ko": "..."}}]}}'''
+
+    return [
+        {
+            'role': 'system',
+            'content': '당신은 가톨릭 성인 이름 번역 전문가입니다. 각 언어의 가톨릭 전례에서 사용하는 표준 이름을 사용하여 정확하게 번역하고, 요청한 JSON 형식으로만 답합니다.'
+        },
+        {'role': 'user', 'content': prompt}
+    ]
+
+
+def _valid_name(value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return None
+    value = value.replace('"', '').strip()
+    if not value or '\n' in value or len(value) > MAX_NAME_LENGTH:
+        return None
+    return value
+
+
+def parse_batch_response(content: str, items: List[BatchItem]) -> Dict[int, Dict[str, str]]:
+    """
+    응답에서 형식이 맞는 번역만 추출: key → 언어 → 이름
+    JSON이 아니거나 translations 목록이 없으면 빈 결과 (전부 개별 요청 대상)
+    """
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return {}
+    entries = data.get('translations') if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        return {}
+
+    results: Dict[int, Dict[str, str]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        key = entry.get('key')
+        if not isinstance(key, int) or isinstance(key, bool) or not 0 <= key < len(items):
+            continue
+        for lang in items[key].languages:
+            name = _valid_name(entry.get(lang))
+            if name:
+                results.setdefault(key, {})[lang] = name
+    return results
+
+
+async def translate_batches(
+    backend: TranslationBackend,
+    items: List[BatchItem],
+    fallback: Fallback,
+    on_result: ResultCallback,
+    batch_size: int = BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    batch_size개씩 묶어 동시에 요청하고 (동시 요청 수는 백엔드가 제한)
+    묶음 응답에서 얻지 못한 (항목, 언어)는 fallback으로 하나씩 번역
+    Returns: {'batches': 묶음 요청 수, 'batched': 묶음으로 얻은 번역 수, 'fallback': 개별 요청 수}
+    """
+    stats = {'batches': 0, 'batched': 0, 'fallback': 0}
+
+    async def retry(item: BatchItem, lang: str):
+        stats['fallback'] += 1
+        on_result(item, lang, await fallback(item, lang))
+
+    async def run(batch: List[BatchItem]):
+        fields = sum(len(item.languages) for item in batch)
+        stats['batches'] += 1
+        try:
+            content = await backend.complete(
+                build_batch_messages(batch),
+                max_tokens=BATCH_BASE_TOKENS + BATCH_TOKENS_PER_FIELD * fields,
+                response_format={'type': 'json_object'},
+                items=batch,
+            )
+            results = parse_batch_response(content, batch)
+        except ChatError:
+            results = {}
+
+        missing = []
+        for key, item in enumerate(batch):
+            for lang in item.languages:
+                name = results.get(key, {}).get(lang)
+                if name:
+                    stats['batched'] += 1
+                    on_result(item, lang, name)
+                else:
+                    missing.append(retry(item, lang))
+        await asyncio.gather(*missing)
+
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    await asyncio.gather(*(run(batch) for batch in batches))
+    return stats
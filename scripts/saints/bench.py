@@ -0,0 +1,85 @@
+"""
+번역 채우기 처리량 측정
+데이터의 모든 성인 × 채우기 대상 언어를 필드별 요청과 묶음 요청으로 각각 번역하여 시간과 요청 수를 비교
+stub 백엔드를 쓰면 네트워크 없이 동시성·묶음 크기의 효과만 측정 (파일은 쓰지 않음)
+
+python -m saints.bench [백엔드 (기본 stub)] [--latency 초] [--concurrency N] [--batch N] [--limit N]
+"""
+
+import asyncio
+import sys
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from .backends import STUB_CONCURRENCY, STUB_LATENCY, ChatError, TranslationBackend, create_backend, load_env
+from .batch import BATCH_SIZE, LANGUAGE_INFO, BatchItem, build_batch_messages, translate_batches
+from .store import SAINTS_PATH, SaintsStore
+
+
+async def run_fill(backend: TranslationBackend, items: List[BatchItem], batch_size: int) -> Tuple[int, int]:
+    """items 전체를 번역해 (성공, 실패) 필드 수 반환 (batch_size가 1이면 필드별 요청)"""
+    translated = Counter()
+
+    def on_result(item: BatchItem, lang: str, value: Optional[str]):
+        translated[bool(value)] += 1
+
+    async def single(item: BatchItem, lang: str) -> Optional[str]:
+        request = BatchItem(item.name, item.name_en, (lang,))
+        try:
+            return await backend.complete(build_batch_messages([request]), items=(request,))
+        except ChatError:
+            return None
+
+    async with backend:
+        if batch_size > 1:
+            await translate_batches(backend, items, single, on_result, batch_size)
+        else:
+            async def run(item: BatchItem, lang: str):
+                on_result(item, lang, await single(item, lang))
+            await asyncio.gather(*(run(item, lang) for item in items for lang in item.languages))
+    return translated[True], translated[False]
+
+
+def main():
+    """필드별 요청 / 묶음 요청 처리량 출력"""
+    def option(name: str, default: str) -> str:
+        if name in sys.argv:
+            index = sys.argv.index(name)
+            if index + 1 < len(sys.argv):
+                return sys.argv[index + 1]
+        return default
+
+    args = [arg for i, arg in enumerate(sys.argv[1:], 1)
+            if not arg.startswith('--') and not sys.argv[i - 1].startswith('--')]
+    env = load_env()
+    env['TRANSLATION_STUB_LATENCY'] = option('--latency', env.get('TRANSLATION_STUB_LATENCY', str(STUB_LATENCY)))
+    env['TRANSLATION_CONCURRENCY'] = option('--concurrency', env.get('TRANSLATION_CONCURRENCY', str(STUB_CONCURRENCY)))
+    spec = args[0] if args else 'stub'
+    batch_size = int(option('--batch', str(BATCH_SIZE)))
+    limit = int(option('--limit', '0'))
+
+    languages = tuple(LANGUAGE_INFO)  # 번역 채우기 스크립트가 채우는 언어
+    store = SaintsStore.load(SAINTS_PATH)
+    items = [BatchItem(saint.get('name', ''), saint.get('nameEn', ''), languages)
+             for saint in store if saint.get('name')]
+    if limit:
+        items = items[:limit]
+    print(f"⏱️  {spec}: 성인 {len(items)}명 × {len(languages)}개 언어 = {len(items) * len(languages)}개 필드, "
+          f"동시 {env['TRANSLATION_CONCURRENCY']}, stub 지연 {env['TRANSLATION_STUB_LATENCY']}초")
+
+    for size in (1, batch_size):
+        try:
+            backend = create_backend(spec, env)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        started = time.perf_counter()
+        ok, failed = asyncio.run(run_fill(backend, items, size))
+        elapsed = time.perf_counter() - started
+        mode = '필드별' if size == 1 else f'묶음({size})'
+        print(f"  {mode}: {elapsed:.2f}초, {ok / elapsed:,.0f} 필드/초, 실패 {failed}건 — {backend.summary()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,315 @@
+"""
+성인 축일 데이터의 열(column) 지향 바이너리 번들
+이름 필드별 문자열 테이블(중복 문자열은 한 번만 저장)과 성인별 정수 열,
+윤년 기준 366일의 날짜 오프셋 테이블로 구성하여 하루치 성인만 바로 읽을 수 있음
+다시 읽어 만든 문서가 JSON 문서와 같은지 검증한 뒤 저장
+
+python -m saints.bundle [데이터 파일 경로] [출력 경로]
+"""
+
+import json
+import struct
+import sys
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .store import DAYS_KEY, ID_KEY, SAINT_LISTS, SAINTS_PATH, SaintsStore, new_day_entry
+
+BUNDLE_MAGIC = b'SFDB'
+BUNDLE_VERSION = 1
+
+# 문자열 테이블을 쓰는 필드 (필드마다 테이블 하나, 참조 0은 필드 없음)
+STRING_FIELDS = ('name', 'nameEn', 'nameKo', 'nameZh', 'nameVi', 'nameEs', 'namePt', 'type', 'description')
+
+# 날짜 오프셋 테이블 크기 (2월 29일 포함)
+DAY_COUNT = 366
+
+# id가 없는 성인의 id 값
+NO_ID = 0xFFFFFFFF
+
+# flags 열의 비트
+FLAG_JAPANESE = 0x01          # isJapanese 값
+FLAG_HAS_JAPANESE = 0x02      # isJapanese 필드 있음
+FLAG_JAPANESE_LIST = 0x04     # japaneseSaints 목록에 있음
+
+# day_flags 열의 비트
+DAY_HAS_ENTRY = 0x01          # 날짜 항목 있음 (성인이 없어도)
+
+# 행에서 복원하는 필드 (그 밖의 필드가 있으면 번들을 만들 수 없음)
+_KNOWN_FIELDS = frozenset(STRING_FIELDS) | {'month', 'day', 'isJapanese', ID_KEY}
+
+_HEADER = struct.Struct('<4sHHI')
+_U32 = struct.Struct('<I')
+_STRING_LENGTH = struct.Struct('<H')
+
+# 날짜 순번 계산용 윤년
+_LEAP_YEAR = 2000
+
+
+def day_ordinal(month: int, day: int) -> int:
+    """윤년 기준 1월 1일 = 0 ~ 12월 31일 = 365"""
+    return date(_LEAP_YEAR, month, day).timetuple().tm_yday - 1
+
+
+def ordinal_date(ordinal: int) -> Tuple[int, int]:
+    """day_ordinal()의 역변환 → (월, 일)"""
+    day = date.fromordinal(date(_LEAP_YEAR, 1, 1).toordinal() + ordinal)
+    return day.month, day.day
+
+
+class _StringTable:
+    """중복을 합친 문자열 목록 (참조 0은 '없음'이므로 문자열은 1부터)"""
+
+    def __init__(self, strings: Optional[List[str]] = None):
+        self.strings: List[str] = strings or []
+        self._refs: Dict[str, int] = {value: i + 1 for i, value in enumerate(self.strings)}
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        ref = self._refs.get(value)
+        if ref is None:
+            self.strings.append(value)
+            ref = self._refs[value] = len(self.strings)
+            if ref > 0xFFFF:
+                raise ValueError("문자열 테이블이 너무 큽니다")
+        return ref
+
+    def get(self, ref: int) -> Optional[str]:
+        return self.strings[ref - 1] if ref else None
+
+
+class SaintsBundle:
+    """
+    열 지향 성인 번들
+    행은 (날짜, 목록, 파일 내 순서)로 정렬되어 있고,
+    day_offsets[d]:day_offsets[d + 1]이 날짜 순번 d의 행 범위
+    """
+
+    def __init__(self):
+        self.meta: Dict[str, Any] = {}  # days 밖의 최상위 키 (range, generatedAt, stats 등)
+        self.tables: Dict[str, _StringTable] = {field: _StringTable() for field in STRING_FIELDS}
+        self.day_offsets = array('I', [0] * (DAY_COUNT + 1))
+        self.day_flags = array('B', [0] * DAY_COUNT)
+        self.ids = array('I')
+        self.flags = array('B')
+        self.refs: Dict[str, array] = {field: array('H') for field in STRING_FIELDS}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __eq__(self, other):
+        return isinstance(other, SaintsBundle) and self.to_json() == other.to_json()
+
+    @classmethod
+    def build(cls, store: SaintsStore) -> 'SaintsBundle':
+        """저장소에서 생성 (복원할 수 없는 필드가 있으면 ValueError)"""
+        bundle = cls()
+        document = store.to_json()
+        bundle.meta = {key: value for key, value in document.items() if key != DAYS_KEY}
+
+        by_ordinal: Dict[int, Dict[str, Any]] = {}
+        for day_entry in document[DAYS_KEY]:
+            month, day = day_entry['month'], day_entry['day']
+            if {key: day_entry[key] for key in ('date', 'feastDayKo')} != \
+                    {key: new_day_entry(month, day)[key] for key in ('date', 'feastDayKo')}:
+                raise ValueError(f"날짜 항목 형식이 다릅니다: {month}/{day}")
+            by_ordinal[day_ordinal(month, day)] = day_entry
+
+        for ordinal in range(DAY_COUNT):
+            bundle.day_offsets[ordinal] = len(bundle.ids)
+            day_entry = by_ordinal.get(ordinal)
+            if day_entry is None:
+                continue
+            bundle.day_flags[ordinal] = DAY_HAS_ENTRY
+            for list_name in SAINT_LISTS:
+                for saint in day_entry[list_name]:
+                    bundle._append(saint, day_entry, list_name)
+        bundle.day_offsets[DAY_COUNT] = len(bundle.ids)
+        return bundle
+
+    def _append(self, saint: Dict[str, Any], day_entry: Dict[str, Any], list_name: str):
+        unknown = set(saint) - _KNOWN_FIELDS
+        if unknown:
+            raise ValueError(f"번들에 담을 수 없는 필드: {sorted(unknown)}")
+        if (saint.get('month'), saint.get('day')) != (day_entry['month'], day_entry['day']):
+            raise ValueError(f"성인 날짜가 날짜 항목과 다릅니다: {saint.get('name')}")
+
+        flags = FLAG_JAPANESE_LIST if list_name == 'japaneseSaints' else 0
+        if 'isJapanese' in saint:
+            flags |= FLAG_HAS_JAPANESE | (FLAG_JAPANESE if saint['isJapanese'] else 0)
+        self.flags.append(flags)
+        self.ids.append(saint[ID_KEY] if saint.get(ID_KEY) is not None else NO_ID)
+        for field in STRING_FIELDS:
+            self.refs[field].append(self.tables[field].intern(saint.get(field)))
+
+    # ----- 조회 -----
+
+    def saint(self, row: int, month: int, day: int) -> Dict[str, Any]:
+        """행 하나를 성인 dict로 복원"""
+        saint: Dict[str, Any] = {'month': month, 'day': day}
+        for field in STRING_FIELDS:
+            value = self.tables[field].get(self.refs[field][row])
+            if value is not None:
+                saint[field] = value
+        flags = self.flags[row]
+        if flags & FLAG_HAS_JAPANESE:
+            saint['isJapanese'] = bool(flags & FLAG_JAPANESE)
+        if self.ids[row] != NO_ID:
+            saint[ID_KEY] = self.ids[row]
+        return saint
+
+    def day_entry(self, month: int, day: int) -> Optional[Dict[str, Any]]:
+        """날짜 항목 하나만 복원 (없으면 None)"""
+        ordinal = day_ordinal(month, day)
+        if not self.day_flags[ordinal] & DAY_HAS_ENTRY:
+            return None
+        day_entry = new_day_entry(month, day)
+        for row in range(self.day_offsets[ordinal], self.day_offsets[ordinal + 1]):
+            list_name = 'japaneseSaints' if self.flags[row] & FLAG_JAPANESE_LIST else 'saints'
+            day_entry[list_name].append(self.saint(row, month, day))
+        return day_entry
+
+    def on(self, month: int, day: int) -> List[Dict[str, Any]]:
+        """날짜의 성인 (saints 다음 japaneseSaints)"""
+        day_entry = self.day_entry(month, day)
+        if day_entry is None:
+            return []
+        return [saint for list_name in SAINT_LISTS for saint in day_entry[list_name]]
+
+    def to_json(self) -> Dict[str, Any]:
+        """날짜별 형식 문서로 복원 (stats는 SaintsStore와 같이 다시 계산)"""
+        days = []
+        for ordinal in range(DAY_COUNT):
+            if self.day_flags[ordinal] & DAY_HAS_ENTRY:
+                days.append(self.day_entry(*ordinal_date(ordinal)))
+        document = dict(self.meta)
+        document[DAYS_KEY] = days
+        return SaintsStore(document).to_json()
+
+    # ----- 직렬화 -----
+
+    def to_bytes(self) -> bytes:
+        """
+        바이너리 직렬화 (리틀 엔디언)
+        헤더 | meta JSON | 문자열 테이블 (필드별) | 날짜 오프셋 | 날짜 플래그 | id | flags | 필드별 참조 열
+        """
+        meta = json.dumps(self.meta, ensure_ascii=False).encode('utf-8')
+        chunks = [_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(STRING_FIELDS), len(self)),
+                  _U32.pack(len(meta)), meta]
+        for field in STRING_FIELDS:
+            strings = self.tables[field].strings
+            chunks.append(_pack_string(field))
+            chunks.append(_U32.pack(len(strings)))
+            chunks.extend(_pack_string(value) for value in strings)
+        for column in self._columns():
+            chunks.append(_to_le_bytes(column))
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SaintsBundle':
+        """to_bytes()의 역변환"""
+        magic, version, field_count, row_count = _HEADER.unpack_from(data, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError(f"지원하지 않는 번들 형식: {magic!r} v{version}")
+        offset = _HEADER.size
+
+        bundle = cls()
+        (meta_length,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        bundle.meta = json.loads(data[offset:offset + meta_length].decode('utf-8'))
+        offset += meta_length
+
+        fields = []
+        for _ in range(field_count):
+            field, offset = _unpack_string(data, offset)
+            (count,) = _U32.unpack_from(data, offset)
+            offset += _U32.size
+            strings = []
+            for _ in range(count):
+                value, offset = _unpack_string(data, offset)
+                strings.append(value)
+            bundle.tables[field] = _StringTable(strings)
+            fields.append(field)
+        if tuple(fields) != STRING_FIELDS:
+            raise ValueError(f"문자열 필드가 다릅니다: {fields}")
+
+        offset = _from_le_bytes(bundle.day_offsets, data, offset, DAY_COUNT + 1)
+        offset = _from_le_bytes(bundle.day_flags, data, offset, DAY_COUNT)
+        for column in bundle._columns()[2:]:
+            offset = _from_le_bytes(column, data, offset, row_count)
+        if offset != len(data):
+            raise ValueError(f"번들 크기가 맞지 않습니다: {offset} != {len(data)}")
+        return bundle
+
+    def _columns(self) -> Tuple[array, ...]:
+        return (self.day_offsets, self.day_flags, self.ids, self.flags,
+                *(self.refs[field] for field in STRING_FIELDS))
+
+    def save(self, path: Path):
+        """바이너리 파일로 저장"""
+        path.write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path) -> 'SaintsBundle':
+        """바이너리 파일에서 로드"""
+        return cls.from_bytes(path.read_bytes())
+
+
+def bundle_path(saints_path: Path = SAINTS_PATH) -> Path:
+    """데이터 파일 옆의 번들 파일 (saints_feast_days.json → saints_feast_days.bin)"""
+    return saints_path.with_suffix('.bin')
+
+
+def _to_le_bytes(column: array) -> bytes:
+    if sys.byteorder == 'little' or column.itemsize == 1:
+        return column.tobytes()
+    swapped = array(column.typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _from_le_bytes(column: array, data: bytes, offset: int, count: int) -> int:
+    """data[offset:]에서 count개 항목을 column에 채우고 다음 오프셋 반환"""
+    del column[:]
+    end = offset + count * column.itemsize
+    column.frombytes(data[offset:end])
+    if sys.byteorder != 'little' and column.itemsize > 1:
+        column.byteswap()
+    return end
+
+
+def _pack_string(value: str) -> bytes:
+    encoded = value.encode('utf-8')
+    return _STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_string(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _STRING_LENGTH.unpack_from(data, offset)
+    start = offset + _STRING_LENGTH.size
+    return data[start:start + length].decode('utf-8'), start + length
+
+
+def main():
+    """번들 생성 → 다시 읽어 JSON 문서와 비교 → 저장"""
+    saints_path = Path(sys.argv[1]) if len(sys.argv) > 1 else SAINTS_PATH
+    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else bundle_path(saints_path)
+
+    store = SaintsStore.load(saints_path)
+    bundle = SaintsBundle.build(store)
+    data = bundle.to_bytes()
+
+    if SaintsBundle.from_bytes(data).to_json() != store.to_json():
+        print(f"❌ 검증 실패: {saints_path}와 번들 내용이 다릅니다")
+        sys.exit(1)
+
+    output_path.write_bytes(data)
+    strings = sum(len(table.strings) for table in bundle.tables.values())
+    print(f"✅ {output_path}: 성인 {len(bundle)}명, 문자열 {strings}개, "
+          f"{len(data):,} bytes (JSON {saints_path.stat().st_size:,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+OpenAI 호환 chat completions 비동기 클라이언트
+요청을 동시에 최대 concurrency개까지 보내고, 토큰 버킷으로 초당 요청 수를 제한
+응답의 rate limit 헤더(x-ratelimit-remaining-requests / x-ratelimit-reset-requests, Retry-After)를 보고
+버킷을 잠시 멈추며, 429·5xx·네트워크 오류는 지터를 준 지수 백오프로 재시도
+HTTP는 연결 풀을 쓰는 requests.Session을 전용 스레드 풀에서 호출
+로컬 목 서버로 재시도·rate limit 처리 확인: python -m saints.mock_server
+
+번역 백엔드(saints.backends)의 openai 구현
+requests가 필요하므로 패키지(__init__)에서 다시 내보내지 않음: from saints.client import ChatClient
+"""
+
+import asyncio
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .backends import ChatError, Messages, TranslationBackend, TranslationItem
+
+OPENAI_URL = 'https://api.openai.com/v1/chat/completions'
+DEFAULT_MODEL = 'gpt-4o-mini'
+
+# 동시 요청 수 / 초당 요청 수
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE = 5.0
+
+# 재시도 (백오프 상한은 backoff_base(기본 BACKOFF_BASE) * 2^시도, 최대 BACKOFF_MAX초 안에서 무작위)
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+REQUEST_TIMEOUT = 30
+
+# 다시 보내면 성공할 수 있는 응답
+RETRY_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """rate limit 헤더 값('2', '1.5', '20ms', '6m0s') → 초 (해석할 수 없으면 None)"""
+    if value is None:
+        return None
+    text = str(value).strip()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 (요청 하나에 토큰 하나)
+    pause()로 지정한 시간 동안 모든 요청을 멈출 수 있음 (rate limit 응답을 받았을 때)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (먼저 기다린 요청이 먼저 통과)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """지금부터 seconds 동안 토큰을 내주지 않고, 그 뒤에는 빈 버킷에서 다시 채움"""
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            self._tokens = 0.0
+            self._updated = until
+
+
+class ChatClient(TranslationBackend):
+    """
+    chat completions 요청을 동시에 보내는 클라이언트
+    async with 없이도 쓸 수 있으며, 다 쓰면 close()로 연결 풀과 스레드를 정리
+    """
+
+    name = 'openai'
+
+    def __init__(
+        self,
+        api_key: str,
+        url: str = OPENAI_URL,
+        model: str = DEFAULT_MODEL,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate: float = DEFAULT_RATE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        timeout: float = REQUEST_TIMEOUT,
+        backoff_base: float = BACKOFF_BASE,
+    ):
+        super().__init__()
+        self.url = url
+        self.model = model
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.bucket = TokenBucket(rate)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+        })
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='chat')
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    # ----- 요청 -----
+
+    def _post(self, payload: Dict[str, Any]) -> requests.Response:
+        return self.session.post(self.url, json=payload, timeout=self.timeout)
+
+    def _respect_headers(self, response: requests.Response):
+        """남은 요청 수가 0이면 리셋될 때까지 버킷을 멈춤"""
+        remaining = response.headers.get('x-ratelimit-remaining-requests')
+        if remaining is not None and remaining.strip() == '0':
+            reset = parse_duration(response.headers.get('x-ratelimit-reset-requests'))
+            if reset:
+                self.bucket.pause(reset)
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Retry-After가 있으면 그대로, 없으면 full jitter 지수 백오프"""
+        if response is not None:
+            retry_after = parse_duration(response.headers.get('retry-after'))
+            if retry_after is not None:
+                return retry_after
+        return random.uniform(0, min(BACKOFF_MAX, self.backoff_base * 2 ** attempt))
+
+    async def complete(
+        self,
+        messages: Messages,
+        temperature: float = 0.3,
+        max_tokens: int = 100,
+        response_format: Optional[Dict[str, str]] = None,
+        items: Sequence[TranslationItem] = (),
+    ) -> str:
+        """응답 메시지 내용 (재시도 후에도 실패하면 ChatError, items는 쓰지 않음)"""
+        payload: Dict[str, Any] = {
+            'model': self.model,
+            'messages': messages,
+            'temperature': temperature,
+            'max_tokens': max_tokens,
+        }
+        if response_format:
+            payload['response_format'] = response_format
+        loop = asyncio.get_running_loop()
+        error: Any = None
+        response: Optional[requests.Response] = None
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    delay = self._backoff(attempt - 1, response)
+                    if response is not None and response.status_code == 429:
+                        self.bucket.pause(delay)
+                    self.stats['retries'] += 1
+                    await asyncio.sleep(delay)
+
+                await self.bucket.acquire()
+                self.stats['requests'] += 1
+                response = None
+                try:
+                    response = await loop.run_in_executor(self._executor, self._post, payload)
+                except requests.RequestException as e:
+                    error = e
+                    continue
+
+                self._respect_headers(response)
+                if response.status_code == 200:
+                    try:
+                        return response.json()['choices'][0]['message']['content'].strip()
+                    except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                        error = f"응답 형식 오류: {e}"
+                        continue
+                error = f"HTTP {response.status_code}: {response.text[:200]}"
+                if response.status_code not in RETRY_STATUSES:
+                    break
+
+        self.stats['failures'] += 1
+        raise ChatError(str(error))
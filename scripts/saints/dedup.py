@@ -0,0 +1,191 @@
+"""
+성인 중복 제거 엔진
+유지한 성인들을 정규화 키 버킷과 n-gram/접두어 색인에 넣어 두고,
+새 성인과 겹칠 수 있는 후보만 골라 판정 함수로 확인
+판정 함수와 "목록에서 처음 일치하는 성인" 규칙은 기존 쌍별 비교와 같으므로
+같은 결과를 후보 수에 비례하는 시간에 얻음
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+Saint = Dict[str, Any]
+
+# 두 성인이 중복인지 판정 (새 성인, 유지 중인 성인)
+DuplicatePredicate = Callable[[Saint, Saint], bool]
+# 성인 → 버킷 키 목록 / 포함 관계 비교용 키
+BucketKeys = Callable[[Saint], Iterable[str]]
+ContainmentKey = Callable[[Saint], str]
+# 새 성인이 기존 성인보다 나은지 (교체 여부)
+Prefer = Callable[[Saint, Saint], bool]
+
+# 포함 관계 색인의 n-gram 길이
+GRAM_SIZE = 3
+
+
+class DedupRule:
+    """
+    중복 판정 규칙
+    is_duplicate가 최종 판정이고, bucket_keys/containment_key는 후보를 고르는 데만 쓰임
+    is_duplicate가 참인 쌍은 반드시 같은 버킷 키를 공유하거나
+    containment_key 중 하나가 다른 하나에 포함되어야 함 (길이 min_length 이상)
+    """
+
+    def __init__(
+        self,
+        is_duplicate: DuplicatePredicate,
+        bucket_keys: Optional[BucketKeys] = None,
+        containment_key: Optional[ContainmentKey] = None,
+        min_length: int = GRAM_SIZE,
+    ):
+        self.is_duplicate = is_duplicate
+        self.bucket_keys = bucket_keys
+        self.containment_key = containment_key
+        self.min_length = max(1, min_length)
+
+
+class _ContainmentIndex:
+    """
+    부분 문자열 포함 관계 후보 색인
+    grams: 키에 들어 있는 길이 1~GRAM_SIZE의 부분 문자열 → 핸들 (질의 키가 기존 키에 포함되는 경우)
+    prefixes: 키의 앞 GRAM_SIZE 글자 → 핸들 (기존 키가 질의 키에 포함되는 경우)
+    """
+
+    def __init__(self, min_length: int):
+        self.min_length = min_length
+        self._shortest_gram = min(min_length, GRAM_SIZE)
+        self.grams: Dict[str, Set[int]] = {}
+        self.prefixes: Dict[str, Set[int]] = {}
+
+    def _grams(self, key: str) -> Set[str]:
+        return {
+            key[start:start + size]
+            for size in range(self._shortest_gram, GRAM_SIZE + 1)
+            for start in range(len(key) - size + 1)
+        }
+
+    def add(self, handle: int, key: str):
+        if len(key) < self.min_length:
+            return
+        for gram in self._grams(key):
+            self.grams.setdefault(gram, set()).add(handle)
+        self.prefixes.setdefault(key[:GRAM_SIZE], set()).add(handle)
+
+    def discard(self, handle: int, key: str):
+        if len(key) < self.min_length:
+            return
+        for gram in self._grams(key):
+            self.grams[gram].discard(handle)
+        self.prefixes[key[:GRAM_SIZE]].discard(handle)
+
+    def candidates(self, key: str) -> Set[int]:
+        """key를 포함하거나 key에 포함되는 (길이 min_length 이상) 키의 핸들 후보"""
+        if len(key) < self.min_length:
+            return set()
+        found = set(self.grams.get(key[:GRAM_SIZE], ()))
+        for gram in self._grams(key):
+            found.update(self.prefixes.get(gram, ()))
+        return found
+
+
+class SaintDeduplicator:
+    """
+    중복 없이 유지한 성인 목록
+    find()는 목록 순서상 처음으로 중복 판정되는 성인을 찾고,
+    replace()는 그 자리를 새 성인으로 바꾸거나 (move_to_end이면) 목록 끝으로 옮김
+    """
+
+    def __init__(self, rule: DedupRule):
+        self.rule = rule
+        self._saints: Dict[int, Saint] = {}
+        self._order: Dict[int, int] = {}
+        self._next_handle = 0
+        self._next_order = 0
+        self._buckets: Dict[str, Set[int]] = {}
+        self._containment = (_ContainmentIndex(rule.min_length)
+                             if rule.containment_key is not None else None)
+
+    def __len__(self):
+        return len(self._saints)
+
+    def __iter__(self):
+        return iter(self.saints)
+
+    @property
+    def saints(self) -> List[Saint]:
+        """유지한 성인 목록 (순서대로)"""
+        return [self._saints[handle] for handle in sorted(self._saints, key=self._order.__getitem__)]
+
+    def get(self, handle: int) -> Saint:
+        return self._saints[handle]
+
+    # ----- 색인 -----
+
+    def _index(self, handle: int, saint: Saint):
+        if self.rule.bucket_keys is not None:
+            for key in self.rule.bucket_keys(saint):
+                self._buckets.setdefault(key, set()).add(handle)
+        if self._containment is not None:
+            self._containment.add(handle, self.rule.containment_key(saint))
+
+    def _unindex(self, handle: int, saint: Saint):
+        if self.rule.bucket_keys is not None:
+            for key in self.rule.bucket_keys(saint):
+                self._buckets[key].discard(handle)
+        if self._containment is not None:
+            self._containment.discard(handle, self.rule.containment_key(saint))
+
+    def _candidates(self, saint: Saint) -> Set[int]:
+        found: Set[int] = set()
+        if self.rule.bucket_keys is not None:
+            for key in self.rule.bucket_keys(saint):
+                found.update(self._buckets.get(key, ()))
+        if self._containment is not None:
+            found.update(self._containment.candidates(self.rule.containment_key(saint)))
+        return found
+
+    # ----- 조회/변경 -----
+
+    def find(self, saint: Saint) -> Optional[int]:
+        """목록 순서상 처음으로 saint와 중복인 성인의 핸들 (없으면 None)"""
+        is_duplicate = self.rule.is_duplicate
+        for handle in sorted(self._candidates(saint), key=self._order.__getitem__):
+            if is_duplicate(saint, self._saints[handle]):
+                return handle
+        return None
+
+    def add(self, saint: Saint) -> int:
+        """목록 끝에 추가하고 핸들 반환"""
+        handle = self._next_handle
+        self._next_handle += 1
+        self._saints[handle] = saint
+        self._order[handle] = self._next_order
+        self._next_order += 1
+        self._index(handle, saint)
+        return handle
+
+    def replace(self, handle: int, saint: Saint, move_to_end: bool = False):
+        """handle 자리의 성인을 saint로 교체"""
+        self._unindex(handle, self._saints[handle])
+        self._saints[handle] = saint
+        if move_to_end:
+            self._order[handle] = self._next_order
+            self._next_order += 1
+        self._index(handle, saint)
+
+
+def dedupe(saints: List[Saint], rule: DedupRule, prefer: Optional[Prefer] = None) -> List[Saint]:
+    """
+    목록에서 중복 제거
+    중복이면 처음 일치한 성인 자리에 남기되, prefer(새 성인, 기존 성인)가 참이면 새 성인으로 교체
+    """
+    if len(saints) <= 1:
+        return saints
+
+    dedup = SaintDeduplicator(rule)
+    for saint in saints:
+        handle = dedup.find(saint)
+        if handle is None:
+            dedup.add(saint)
+        elif prefer is not None and prefer(saint, dedup.get(handle)):
+            dedup.replace(handle, saint)
+    return dedup.saints
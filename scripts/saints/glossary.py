@@ -0,0 +1,318 @@
+"""
+토큰 단위 번역 용어집
+이미 번역된 성인 이름을 토큰별로 맞춰 ("聖ヨハネ・ボスコ" ↔ "성 요한 보스코") 토큰 → 번역 표를 만들고
+누락된 이름을 토큰 번역을 이어 붙여 채움 ("聖ヨハネ・マリア・ヴィアンネ" → "성 요한 마리아 비안네")
+- 일본어·영어 이름이 모두 같은 번역이 이미 있으면 그대로 사용 (번역이 서로 다르면 쓰지 않음)
+- 같은 일본어 이름이 다른 영어 이름으로 쓰인 적이 있으면 (聖マルティヌス: Tours / Porres) 다른 성인일 수 있으므로 조합하지 않음
+- 토큰 번역은 여러 이름에서 같은 번역으로 확인된 것만 쓰고, 하나라도 확실하지 않으면 조합하지 않음 (API로 번역)
+- 영어 이름의 이름 단어 수가 토큰 수와 다르면 조합하지 않음 (聖コルベ ↔ Maximilian Kolbe처럼 일본어 이름이 줄인 이름)
+- 접두사는 언어에 하나뿐이면 그대로 붙이고, 여러 개면 (San/Santa, 聖/圣) 첫 토큰에 쓰인 접두사를 따름
+"聖"으로 시작하고 가타카나·한자와 "・"로만 된 이름만 다룸 (호칭·괄호·"聖母" 이름 등은 제외)
+
+python -m saints.glossary [데이터 파일 경로] [--report 보고서 경로]
+"""
+
+import json
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .names import NAME_FIELDS, normalize_for
+from .store import SAINTS_PATH, SaintsStore
+
+# 조합하는 언어 → 번역 이름 앞의 접두사
+TOKEN_PREFIXES = {
+    'ko': ('성',),
+    'zh': ('聖', '圣'),
+    'vi': ('Thánh',),
+    'es': ('San', 'Santa', 'Santo'),
+    'pt': ('São', 'Santa', 'Santo'),
+}
+
+# 신뢰 조건: 토큰 번역을 확인한 서로 다른 이름 수, 그 토큰의 번역 중 같은 번역의 비율
+MIN_SUPPORT = 2
+MIN_AGREEMENT = 0.8
+
+# "聖" + 가타카나·한자 토큰을 "・"로 연결한 이름 ("聖母…"는 성모 축일이라 제외)
+_JAPANESE_NAME_PATTERN = re.compile(r'^聖(?!母)([ァ-ヺー一-鿿]+(?:[・･][ァ-ヺー一-鿿]+)*)$')
+_JAPANESE_SEPARATOR_PATTERN = re.compile(r'[・･]')
+# 중국어 이름의 구분 기호
+_CHINESE_SEPARATOR_PATTERN = re.compile(r'[·・･]')
+# 영어 이름 앞의 "Saint", "St." / 이름 단어 (대문자로 시작, "of", "the" 등은 제외)
+_ENGLISH_PREFIX_PATTERN = re.compile(r'^(?:saints?|sts?\.?)\s+', flags=re.IGNORECASE)
+_ENGLISH_WORD_PATTERN = re.compile(r"(?<![\w'’])[A-ZÀ-Þ][\w'’.-]*")
+
+
+def japanese_tokens(name: Any) -> Optional[Tuple[str, ...]]:
+    """"聖ヨハネ・ボスコ" → ("ヨハネ", "ボスコ") (다루지 않는 형식이면 None)"""
+    if not name:
+        return None
+    match = _JAPANESE_NAME_PATTERN.match(str(name).strip())
+    if not match:
+        return None
+    return tuple(_JAPANESE_SEPARATOR_PATTERN.split(match.group(1)))
+
+
+def english_words(name_en: Any) -> Tuple[str, ...]:
+    """"Saint Catherine of Siena" → ("Catherine", "Siena")"""
+    if not name_en:
+        return ()
+    return tuple(_ENGLISH_WORD_PATTERN.findall(_ENGLISH_PREFIX_PATTERN.sub('', str(name_en).strip())))
+
+
+def split_translation(lang: str, value: Any, count: int) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """
+    번역 이름 → (접두사, 일본어 토큰 수(count)만큼의 토큰)
+    "성 요한 보스코" → ("성", ("요한", "보스코")), "聖若望·鮑思高" → ("聖", ("若望", "鮑思高"))
+    접두사가 없거나 토큰 수가 다르면 None
+    """
+    if not value:
+        return None
+    value = str(value).strip()
+    if lang == 'zh':
+        prefix = value[:1]
+        parts = [part.strip() for part in _CHINESE_SEPARATOR_PATTERN.split(value[1:])]
+    else:
+        prefix, _, rest = value.partition(' ')
+        parts = rest.split()
+    if prefix not in TOKEN_PREFIXES[lang] or len(parts) != count or not all(parts):
+        return None
+    return prefix, tuple(parts)
+
+
+def join_translation(lang: str, prefix: str, tokens: Iterable[str]) -> str:
+    """접두사와 토큰 번역을 언어의 표기대로 연결"""
+    if lang == 'zh':
+        return prefix + '·'.join(tokens)
+    return ' '.join((prefix, *tokens))
+
+
+def name_key(name: Any, name_en: Any = '') -> Tuple[str, str]:
+    """이름 표의 키 (정규화한 일본어 이름, 정규화한 영어 이름)"""
+    return normalize_for('ja', name), normalize_for('en', name_en)
+
+
+def _confident(counter: Optional[Counter], min_support: int = MIN_SUPPORT) -> Optional[str]:
+    """가장 많이 쓰인 번역이 min_support번 이상이고 MIN_AGREEMENT 이상을 차지하면 그 번역"""
+    if not counter:
+        return None
+    value, support = counter.most_common(1)[0]
+    if support < min_support or support < MIN_AGREEMENT * sum(counter.values()):
+        return None
+    return value
+
+
+class TokenGlossary:
+    """
+    언어별 세 가지 표 (값은 번역 → 그 번역을 쓴 이름 수)
+      names: (일본어 이름, 영어 이름) → 번역 이름 (토큰으로 나뉘지 않는 이름도 포함)
+      tokens: 일본어 토큰 → 토큰 번역 (위치와 무관)
+      prefixes: 첫 토큰 → 접두사
+    senses: 일본어 이름 → 함께 쓰인 영어 이름 (동명이인 확인용)
+    resolved/unresolved는 resolve() 결과 수
+    """
+
+    def __init__(self):
+        self.names: Dict[str, Dict[Tuple[str, str], Counter]] = {lang: {} for lang in TOKEN_PREFIXES}
+        self.senses: Dict[str, Counter] = {}
+        self._sources: Counter = Counter()
+        self.tokens: Dict[str, Dict[str, Counter]] = {lang: {} for lang in TOKEN_PREFIXES}
+        self.prefixes: Dict[str, Dict[str, Counter]] = {lang: {} for lang in TOKEN_PREFIXES}
+        self.resolved = 0
+        self.unresolved = 0
+
+    @classmethod
+    def build(cls, saints: Iterable[Dict[str, Any]]) -> 'TokenGlossary':
+        """성인 목록의 기존 번역으로 생성 (같은 이름·번역은 날짜 항목이 여러 개여도 한 번만 셈)"""
+        glossary = cls()
+        for name, name_en, lang, value in _distinct_translations(saints):
+            glossary.add(name, name_en, lang, value)
+        return glossary
+
+    @classmethod
+    def from_store(cls, store: SaintsStore) -> 'TokenGlossary':
+        return cls.build(store)
+
+    def __len__(self) -> int:
+        return sum(len(tokens) for tokens in self.tokens.values())
+
+    def add(self, name: str, name_en: str, lang: str, value: str, weight: int = 1):
+        """일본어·영어 이름과 번역 한 쌍 반영 (weight=-1이면 되돌림)"""
+        key = name_key(name, name_en)
+        if not key[0]:
+            return
+        _count(self.names[lang], key, value, weight)
+        _count(self.senses, key[0], key[1], weight)
+        # 토큰 번역은 영어 이름과 무관하게 (일본어 이름, 번역)마다 한 번만 셈
+        source = (str(name).strip(), lang, value)
+        before = self._sources[source]
+        self._sources[source] += weight
+        if self._sources[source] <= 0:
+            del self._sources[source]
+        if (before > 0) == (source in self._sources):
+            return
+        tokens = japanese_tokens(name)
+        if not tokens:
+            return
+        split = split_translation(lang, value, len(tokens))
+        if not split:
+            return
+        prefix, translated = split
+        _count(self.prefixes[lang], tokens[0], prefix, weight)
+        for token, target in zip(tokens, translated):
+            _count(self.tokens[lang], token, target, weight)
+
+    def discard(self, name: str, name_en: str, lang: str, value: str):
+        self.add(name, name_en, lang, value, -1)
+
+    # ----- 조회 -----
+
+    def prefix(self, lang: str, first_token: str) -> Optional[str]:
+        """첫 토큰에 붙일 접두사 (여러 개 중 확실하지 않으면 None)"""
+        if len(TOKEN_PREFIXES[lang]) == 1:
+            return TOKEN_PREFIXES[lang][0]
+        return _confident(self.prefixes[lang].get(first_token), min_support=1)
+
+    def known(self, name: Any, name_en: Any, lang: str) -> Optional[str]:
+        """
+        일본어·영어 이름이 모두 같은 항목의 번역
+        번역이 서로 다르거나 같은 일본어 이름이 다른 영어 이름으로 쓰였으면 None
+        """
+        ja, en = name_key(name, name_en)
+        counter = self.names[lang].get((ja, en)) if ja else None
+        if not counter or len(counter) > 1 or len(self.senses.get(ja, ())) > 1:
+            return None
+        return next(iter(counter))
+
+    def compose(self, name: Any, name_en: Any, lang: str) -> Optional[str]:
+        """
+        같은 이름의 번역 또는 토큰 번역 조합 (확실하지 않으면 None, 통계는 세지 않음)
+        이름 표에 있는 이름(번역이 서로 다른 경우 포함)과 동명이인이 있는 이름, 영어 이름과 토큰 수가 다른 이름은 조합하지 않음
+        """
+        if lang not in TOKEN_PREFIXES:
+            return None
+        ja, en = name_key(name, name_en)
+        if not ja:
+            return None
+        if (ja, en) in self.names[lang] or any(other != en for other in self.senses.get(ja, ())):
+            return self.known(name, name_en, lang)
+        tokens = japanese_tokens(name)
+        if not tokens or len(english_words(name_en)) != len(tokens):
+            return None
+        prefix = self.prefix(lang, tokens[0])
+        translated = [_confident(self.tokens[lang].get(token)) for token in tokens]
+        if not prefix or not all(translated):
+            return None
+        return join_translation(lang, prefix, translated)
+
+    def resolve(self, name: Any, name_en: Any, lang: str) -> Optional[str]:
+        """compose() + 적중률 통계"""
+        value = self.compose(name, name_en, lang)
+        if value:
+            self.resolved += 1
+        else:
+            self.unresolved += 1
+        return value
+
+    # ----- 보고 -----
+
+    def summary(self) -> str:
+        lookups = self.resolved + self.unresolved
+        rate = self.resolved / lookups if lookups else 0.0
+        return f"토큰 용어집 조합 {self.resolved}/{lookups} ({rate:.1%}), 토큰 {len(self)}개"
+
+    def report(self) -> Dict[str, Any]:
+        """언어별 이름·토큰 수와 신뢰 조건을 만족하는 토큰 수"""
+        languages = {}
+        for lang, tokens in self.tokens.items():
+            confident = sum(1 for counter in tokens.values() if _confident(counter))
+            languages[lang] = {'names': len(self.names[lang]), 'tokens': len(tokens), 'confident': confident}
+        return {'minSupport': MIN_SUPPORT, 'minAgreement': MIN_AGREEMENT, 'languages': languages}
+
+
+def _count(table: Dict[Any, Counter], key: Any, value: str, weight: int):
+    counter = table.setdefault(key, Counter())
+    counter[value] += weight
+    if counter[value] <= 0:
+        del counter[value]
+        if not counter:
+            del table[key]
+
+
+def _distinct_translations(saints: Iterable[Dict[str, Any]]) -> List[Tuple[str, str, str, str]]:
+    """(일본어 이름, 영어 이름, 언어, 번역) 중복 없이"""
+    found: Dict[Tuple[str, str, str, str], None] = {}
+    for saint in saints:
+        name = str(saint.get(NAME_FIELDS['ja']) or '').strip()
+        if not name:
+            continue
+        name_en = str(saint.get(NAME_FIELDS['en']) or '').strip()
+        for lang in TOKEN_PREFIXES:
+            value = saint.get(NAME_FIELDS[lang])
+            if value and str(value).strip():
+                found[(name, name_en, lang, str(value).strip())] = None
+    return list(found)
+
+
+def check_glossary(store: SaintsStore) -> Dict[str, Dict[str, int]]:
+    """
+    이미 번역된 이름마다 그 이름(일본어·영어)의 번역을 뺀 용어집으로 조합해 기존 번역과 비교
+    언어 → {'resolved': 조합한 이름 수, 'matched': 기존 번역 중 하나와 같은 수}
+    """
+    glossary = TokenGlossary.build(store)
+    by_name: Dict[Tuple[Tuple[str, str], str], List[Tuple[str, str, str]]] = {}
+    for name, name_en, lang, value in _distinct_translations(store):
+        by_name.setdefault((name_key(name, name_en), lang), []).append((name, name_en, value))
+
+    results = {lang: {'resolved': 0, 'matched': 0} for lang in TOKEN_PREFIXES}
+    for (_, lang), entries in by_name.items():
+        for name, name_en, value in entries:
+            glossary.discard(name, name_en, lang, value)
+        name, name_en, _ = entries[0]
+        composed = glossary.compose(name, name_en, lang)
+        for name, name_en, value in entries:
+            glossary.add(name, name_en, lang, value)
+        if composed:
+            results[lang]['resolved'] += 1
+            results[lang]['matched'] += composed in {value for _, _, value in entries}
+    return results
+
+
+def main():
+    """용어집 생성 → 누락 필드 중 조합할 수 있는 수와 기존 번역 대비 일치율 출력 → (선택) 보고서 저장"""
+    args = [arg for i, arg in enumerate(sys.argv[1:], 1)
+            if not arg.startswith('--') and sys.argv[i - 1] != '--report']
+    report_path = None
+    if '--report' in sys.argv:
+        index = sys.argv.index('--report')
+        if index + 1 < len(sys.argv):
+            report_path = Path(sys.argv[index + 1])
+    saints_path = Path(args[0]) if args else SAINTS_PATH
+
+    store = SaintsStore.load(saints_path)
+    glossary = TokenGlossary.from_store(store)
+    report = glossary.report()
+    checks = check_glossary(store)
+
+    print(f"📚 {saints_path}: 성인 {len(store)}명, 토큰 {len(glossary)}개")
+    for lang in TOKEN_PREFIXES:
+        missing = [(saint.get(NAME_FIELDS['ja']), saint.get(NAME_FIELDS['en']))
+                   for saint in store if not saint.get(NAME_FIELDS[lang])]
+        composable = sum(1 for name, name_en in missing if glossary.resolve(name, name_en, lang))
+        check = checks[lang]
+        accuracy = check['matched'] / check['resolved'] if check['resolved'] else 0.0
+        report['languages'][lang].update({'missing': len(missing), 'composable': composable, **check})
+        print(f"  {lang}: 누락 {len(missing)}건 중 조합 가능 {composable}건, "
+              f"신뢰 토큰 {report['languages'][lang]['confident']}/{report['languages'][lang]['tokens']}, "
+              f"기존 번역 재현 {check['matched']}/{check['resolved']} ({accuracy:.1%})")
+    print(f"  {glossary.summary()}")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+성인 필드 업데이트 저널 (write-ahead)
+번역 하나를 얻을 때마다 (id, 필드) 업데이트를 JSONL로 덧붙이고 디스크에 동기화
+다음 실행 시 저장소에 다시 적용하면 이미 채워진 (성인, 필드)는 기존 검사에서 건너뛰게 되고,
+원본 파일은 작업이 끝날 때 한 번만 다시 씀 (compact)
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .store import SAINTS_PATH, SaintsStore
+
+# 저널 파일 위치
+JOURNAL_DIR = Path(__file__).parent / '.cache'
+
+
+class UpdateJournal:
+    """(성인 id, 필드) 업데이트의 추가 전용 로그"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._repaired = False
+
+    @classmethod
+    def for_file(cls, saints_path: Path, name: str = 'updates') -> 'UpdateJournal':
+        """성인 데이터 파일별 저널 (예: .cache/saints_feast_days.updates.jsonl)"""
+        return cls(JOURNAL_DIR / f'{saints_path.stem}.{name}.jsonl')
+
+    @classmethod
+    def resume(
+        cls,
+        store: SaintsStore,
+        name: str = 'updates',
+        backup_suffix: Optional[str] = None,
+    ) -> Tuple['UpdateJournal', int]:
+        """
+        저널을 열고 이전 실행에서 기록된 업데이트를 저장소에 다시 적용
+        id가 없는 성인이 있으면 저널이 가리킬 수 있도록 id를 부여해 파일에 먼저 기록
+        Returns: (저널, 다시 적용된 업데이트 수)
+        """
+        path = store.path or SAINTS_PATH
+        if store.assign_ids():
+            store.save(path, backup_suffix=backup_suffix)
+        journal = cls.for_file(path, name)
+        return journal, journal.replay(store)
+
+    # ----- 기록 -----
+
+    def _repair(self):
+        """쓰다 만 마지막 줄을 잘라 냄 (그 뒤에 덧붙인 줄이 깨지지 않도록)"""
+        self._repaired = True
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+
+    def append(self, updates: List[Tuple[int, Dict[str, Any]]]):
+        """업데이트 묶음을 덧붙이고 디스크에 동기화"""
+        if not updates:
+            return
+        if not self._repaired:
+            self._repair()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for saint_id, fields in updates:
+                f.write(json.dumps({'id': saint_id, 'fields': fields}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record(self, saint_id: int, fields: Dict[str, Any]):
+        """업데이트 하나를 바로 기록"""
+        self.append([(saint_id, fields)])
+
+    # ----- 읽기 -----
+
+    def entries(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """기록된 업데이트 (쓰다 만 마지막 줄은 무시)"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                yield entry['id'], entry['fields']
+
+    def replay(self, store: SaintsStore) -> int:
+        """저널의 업데이트를 저장소에 적용, 적용된 항목 수 반환"""
+        applied = 0
+        for saint_id, fields in self.entries():
+            if store.update(saint_id, fields):
+                applied += 1
+        return applied
+
+    # ----- 반영 -----
+
+    def compact(self, store: SaintsStore, path: Optional[Path] = None,
+                backup_suffix: Optional[str] = None) -> bool:
+        """
+        저장소(저널이 적용된 상태)를 원본 파일에 한 번 저장한 뒤 저널 삭제
+        저장 후 삭제 전에 중단되어도 다음 replay는 같은 값을 다시 적용할 뿐이므로 안전
+        Returns: 파일을 실제로 썼는지 여부
+        """
+        written = store.save(path, backup_suffix=backup_suffix)
+        self.clear()
+        return written
+
+    def clear(self):
+        """원본 파일에 반영한 뒤 저널 삭제"""
+        if self.path.exists():
+            self.path.unlink()
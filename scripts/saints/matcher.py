@@ -0,0 +1,146 @@
+"""
+성인 이름 퍼지 매처
+이름 색인(NameIndex)의 정규화 이름마다 문자 bigram 집합을 미리 계산해 두고,
+질의 이름과 bigram을 하나라도 공유하는 이름만 점수화하여 후보를 점수 순으로 반환
+점수: 정규화 이름 일치 1.0 > 한쪽이 다른 쪽을 포함 0.9 > 앞 3글자 이상 일치 0.8 > bigram Dice 계수
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set
+
+from .names import NameIndex, normalize_for
+
+# 문자 n-gram 길이
+GRAM_SIZE = 2
+
+EXACT_SCORE = 1.0
+CONTAINS_SCORE = 0.9
+PREFIX_SCORE = 0.8
+
+# 기본 임계값 (포함/접두어 규칙 또는 그만큼 비슷한 이름)
+MATCH_THRESHOLD = PREFIX_SCORE
+
+# 포함 관계는 양쪽 모두 이 길이 이상일 때만 인정
+MIN_CONTAINS_LENGTH = 4
+# 공통 접두어 최소 길이
+MIN_PREFIX_LENGTH = 3
+
+# 대상 성인이 이 수 이하면 색인 대신 직접 점수화
+DIRECT_SCORING_LIMIT = 32
+
+
+class Match(NamedTuple):
+    """매칭 후보"""
+    saint_id: int
+    score: float
+    key: str  # 일치한 정규화 이름
+
+
+def name_grams(key: str) -> FrozenSet[str]:
+    """정규화 이름의 문자 bigram 집합"""
+    return frozenset(key[i:i + GRAM_SIZE] for i in range(len(key) - GRAM_SIZE + 1))
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    length = 0
+    for char_a, char_b in zip(a, b):
+        if char_a != char_b:
+            break
+        length += 1
+    return length
+
+
+def name_score(a: str, b: str, grams_a: Optional[FrozenSet[str]] = None,
+               grams_b: Optional[FrozenSet[str]] = None) -> float:
+    """정규화된 두 이름의 유사도 (0~1)"""
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return EXACT_SCORE
+    if len(a) >= MIN_CONTAINS_LENGTH and len(b) >= MIN_CONTAINS_LENGTH and (a in b or b in a):
+        return CONTAINS_SCORE
+    if _common_prefix_length(a, b) >= MIN_PREFIX_LENGTH:
+        return PREFIX_SCORE
+    grams_a = name_grams(a) if grams_a is None else grams_a
+    grams_b = name_grams(b) if grams_b is None else grams_b
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+class NameMatcher:
+    """
+    한 언어의 이름 색인 위에서 동작하는 퍼지 매처
+    후보는 질의와 bigram을 공유하는 이름뿐이므로 (포함/접두어 규칙에 걸리는 이름은 항상 공유)
+    전체 이름을 훑지 않고 같은 결과를 얻음
+    """
+
+    def __init__(self, index: NameIndex, lang: str = 'ja', threshold: float = MATCH_THRESHOLD):
+        self.index = index
+        self.lang = lang
+        self.threshold = threshold
+        self._keys: List[str] = list(index.names[lang])
+        self._key_grams: List[FrozenSet[str]] = [name_grams(key) for key in self._keys]
+        self._handles: Dict[int, int] = {}  # 성인 id → 이름 핸들
+        self._postings: Dict[str, List[int]] = {}
+        for handle, grams in enumerate(self._key_grams):
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(handle)
+            for saint_id in index.names[lang][self._keys[handle]]:
+                self._handles[saint_id] = handle
+
+    def _candidate_keys(self, grams: FrozenSet[str]) -> Set[int]:
+        """grams 중 하나라도 공유하는 이름의 핸들"""
+        handles: Set[int] = set()
+        for gram in grams:
+            handles.update(self._postings.get(gram, ()))
+        return handles
+
+    def candidates(
+        self,
+        name: str,
+        saint_ids: Optional[Iterable[int]] = None,
+        threshold: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Match]:
+        """
+        name과 비슷한 성인 (점수 내림차순, 같은 점수는 id 순)
+        saint_ids가 있으면 그 성인들(예: 같은 날짜) 중에서만 찾음
+        """
+        query = normalize_for(self.lang, name)
+        if not query:
+            return []
+        threshold = self.threshold if threshold is None else threshold
+        allowed = set(saint_ids) if saint_ids is not None else None
+        names = self.index.names[self.lang]
+
+        best: Dict[int, Match] = {}
+
+        def consider(key: str, score: float):
+            if score < threshold:
+                return
+            for saint_id in names.get(key, ()):
+                if allowed is not None and saint_id not in allowed:
+                    continue
+                if saint_id not in best or best[saint_id].score < score:
+                    best[saint_id] = Match(saint_id, score, key)
+
+        grams = name_grams(query)
+        if allowed is not None and len(allowed) <= DIRECT_SCORING_LIMIT:
+            # 대상 성인이 적으면 (예: 하루치) 그 성인들의 이름만 직접 점수화
+            handles = {self._handles[saint_id] for saint_id in allowed if saint_id in self._handles}
+        else:
+            # 정규화 이름이 같은 성인 (bigram이 없는 한 글자 이름 포함) + bigram 공유 이름
+            consider(query, EXACT_SCORE)
+            handles = self._candidate_keys(grams)
+        for handle in handles:
+            key = self._keys[handle]
+            consider(key, name_score(query, key, grams, self._key_grams[handle]))
+
+        ranked = sorted(best.values(), key=lambda match: (-match.score, match.saint_id))
+        return ranked[:limit] if limit is not None else ranked
+
+    def best(self, name: str, saint_ids: Optional[Iterable[int]] = None,
+             threshold: Optional[float] = None) -> Optional[Match]:
+        """가장 비슷한 성인 (임계값 미만이면 None)"""
+        found = self.candidates(name, saint_ids, threshold, limit=1)
+        return found[0] if found else None
@@ -0,0 +1,161 @@
+"""
+번역 메모리 (SQLite)
+(원문 이름, 영어 이름, 대상 언어, 프롬프트 버전) → 번역을 디스크에 저장해 모든 번역 스크립트가 공유
+같은 이름은 날짜·스크립트 실행이 달라도 한 번만 번역하고, 중단 후 다시 실행해도 받은 번역은 다시 요청하지 않음
+프롬프트를 바꾸면 프롬프트 버전을 올려 이전 번역과 섞이지 않게 함
+항목마다 적중 횟수를 기록하여 적중률 보고
+
+python -m saints.memory [메모리 파일 경로] [--report 보고서 경로]
+"""
+
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .journal import JOURNAL_DIR
+
+# 기본 번역 메모리 파일
+MEMORY_PATH = JOURNAL_DIR / 'translation_memory.sqlite3'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS translations (
+    source TEXT NOT NULL,
+    source_en TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    value TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (source, source_en, lang, prompt)
+)
+'''
+
+
+def _key_part(value: Any) -> str:
+    return str(value).strip() if value else ''
+
+
+class TranslationMemory:
+    """
+    번역 메모리 하나 (with 문으로 열고 닫기)
+    put()은 바로 커밋하므로 중간에 중단되어도 그때까지 받은 번역은 남음
+    hits/misses는 이번 실행의 get() 결과
+    """
+
+    def __init__(self, path: Path = MEMORY_PATH):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> 'TranslationMemory':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._db.close()
+
+    def __len__(self) -> int:
+        return self._db.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    # ----- 조회 / 저장 -----
+
+    def get(self, source: Any, source_en: Any, lang: str, prompt: str) -> Optional[str]:
+        """저장된 번역 (없으면 None)"""
+        key = (_key_part(source), _key_part(source_en), lang, prompt)
+        row = self._db.execute(
+            'SELECT value FROM translations WHERE source = ? AND source_en = ? AND lang = ? AND prompt = ?',
+            key,
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._db:
+            self._db.execute(
+                'UPDATE translations SET hits = hits + 1, used = ? '
+                'WHERE source = ? AND source_en = ? AND lang = ? AND prompt = ?',
+                (time.time(), *key),
+            )
+        return row[0]
+
+    def put(self, source: Any, source_en: Any, lang: str, prompt: str, value: str):
+        """번역 저장 (같은 키가 있으면 새 번역으로 교체)"""
+        now = time.time()
+        with self._db:
+            self._db.execute(
+                'INSERT INTO translations (source, source_en, lang, prompt, value, created, used) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (source, source_en, lang, prompt) DO UPDATE SET value = excluded.value, used = excluded.used',
+                (_key_part(source), _key_part(source_en), lang, prompt, value, now, now),
+            )
+
+    # ----- 보고 -----
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """이번 실행 적중률 한 줄 요약"""
+        return (f"번역 메모리 적중 {self.hits}/{self.hits + self.misses} ({self.hit_rate:.1%}), "
+                f"저장된 번역 {len(self)}건")
+
+    def report(self) -> Dict[str, Any]:
+        """이번 실행 적중률 + 프롬프트 버전·언어별 저장 건수와 누적 적중 횟수"""
+        rows = self._db.execute(
+            'SELECT prompt, lang, COUNT(*), SUM(hits), SUM(hits > 0) FROM translations '
+            'GROUP BY prompt, lang ORDER BY prompt, lang'
+        ).fetchall()
+        return {
+            'path': str(self.path),
+            'entries': len(self),
+            'session': {'hits': self.hits, 'misses': self.misses, 'hitRate': round(self.hit_rate, 4)},
+            'prompts': [
+                {'prompt': prompt, 'lang': lang, 'entries': entries, 'hits': hits, 'reused': reused}
+                for prompt, lang, entries, hits, reused in rows
+            ],
+        }
+
+
+def main():
+    """프롬프트 버전·언어별 저장 건수와 누적 적중 횟수 출력 → (선택) 보고서 저장"""
+    args = [arg for i, arg in enumerate(sys.argv[1:], 1)
+            if not arg.startswith('--') and sys.argv[i - 1] != '--report']
+    report_path = None
+    if '--report' in sys.argv:
+        index = sys.argv.index('--report')
+        if index + 1 < len(sys.argv):
+            report_path = Path(sys.argv[index + 1])
+    memory_path = Path(args[0]) if args else MEMORY_PATH
+
+    if not memory_path.exists():
+        print(f"❌ 번역 메모리가 없습니다: {memory_path}")
+        sys.exit(1)
+
+    with TranslationMemory(memory_path) as memory:
+        report = memory.report()
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"🧠 {memory_path}: 번역 {report['entries']}건")
+    for row in report['prompts']:
+        print(f"  {row['prompt']} / {row['lang']}: {row['entries']}건, "
+              f"재사용된 번역 {row['reused']}건 (누적 적중 {row['hits']}회)")
+
+
+if __name__ == '__main__':
+    main()
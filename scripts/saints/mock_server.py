@@ -0,0 +1,226 @@
+"""
+로컬 목 chat completions 서버와 ChatClient 동작 확인
+127.0.0.1의 임의 포트에 OpenAI 호환 엔드포인트를 띄우고, 정해 둔 응답(상태 코드·헤더)을 순서대로 돌려줌
+ChatClient(url=server.url)로 아래 경로를 네트워크 없이 확인
+- 429 + Retry-After: 헤더의 시간만큼 기다린 뒤 재시도
+- x-ratelimit-remaining-requests: 0: x-ratelimit-reset-requests 동안 다음 요청을 멈춤
+- 5xx: 지터를 준 지수 백오프로 재시도, max_retries를 넘으면 ChatError
+- 재시도하지 않는 상태 코드(400 등): 한 번만 요청하고 ChatError
+
+requests가 필요하므로 패키지(__init__)에서 다시 내보내지 않음
+python -m saints.mock_server
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .backends import ChatError
+
+# 확인용 클라이언트 설정 (백오프를 짧게 해서 몇 초 안에 끝나도록)
+CHECK_BACKOFF_BASE = 0.05
+CHECK_RATE = 100.0
+# 대기 시간 비교 여유 (스레드 전환·타이머 오차)
+TIMING_SLACK = 0.05
+# 지터 확인: 몇 번째 재시도의 백오프 시간을 몇 번 뽑을지
+JITTER_ATTEMPT = 2
+JITTER_SAMPLES = 200
+
+
+class MockResponse(NamedTuple):
+    """목 서버가 돌려줄 응답 하나 (content가 None이면 요청 순번으로 만든 번역)"""
+    status: int = 200
+    headers: Dict[str, str] = {}
+    content: Optional[str] = None
+
+
+class MockChatServer:
+    """
+    정해 둔 응답을 순서대로 돌려주는 chat completions 서버 (응답을 다 쓰면 200)
+    with 문으로 쓰면 백그라운드 스레드에서 띄우고 끝나면 종료
+    times에는 요청을 받은 시각(time.monotonic())을 기록
+    """
+
+    def __init__(self):
+        self.responses: List[MockResponse] = []
+        self.times: List[float] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def __enter__(self) -> 'MockChatServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def script(self, *responses: MockResponse):
+        """다음 요청부터 돌려줄 응답 (기록한 요청 시각은 지움)"""
+        with self._lock:
+            self.responses = list(responses)
+            self.times = []
+
+    def _next(self) -> Tuple[int, MockResponse]:
+        with self._lock:
+            self.times.append(time.monotonic())
+            response = self.responses.pop(0) if self.responses else MockResponse()
+            return len(self.times), response
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                number, response = server._next()
+                if response.status == 200:
+                    content = response.content if response.content is not None else f"번역 {number}"
+                    body = {'choices': [{'message': {'role': 'assistant', 'content': content}}]}
+                else:
+                    body = {'error': {'message': f"mock {response.status}"}}
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(response.status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class CheckResult(NamedTuple):
+    name: str
+    ok: bool
+    detail: str
+
+
+def _gaps(times: List[float]) -> List[float]:
+    """요청 사이 간격 (초)"""
+    return [later - earlier for earlier, later in zip(times, times[1:])]
+
+
+async def _complete(client) -> Tuple[Optional[str], Optional[ChatError]]:
+    try:
+        return await client.complete([{'role': 'user', 'content': '聖ヨハネ'}]), None
+    except ChatError as e:
+        return None, e
+
+
+def check_retry_after(server: MockChatServer, client) -> CheckResult:
+    """429 + Retry-After: 0.3 → 0.3초 뒤 재시도해서 성공"""
+    server.script(MockResponse(429, {'Retry-After': '0.3'}))
+    content, error = asyncio.run(_complete(client))
+    gaps = _gaps(server.times)
+    ok = content is not None and len(server.times) == 2 and gaps[0] >= 0.3 - TIMING_SLACK
+    return CheckResult('429 Retry-After', ok, f"요청 {len(server.times)}회, 간격 {gaps[0] if gaps else 0:.2f}초, 오류 {error}")
+
+
+def check_ratelimit_headers(server: MockChatServer, client) -> CheckResult:
+    """남은 요청 수 0 + reset 300ms → 다음 요청이 0.3초 뒤에 나감"""
+    server.script(MockResponse(200, {
+        'x-ratelimit-remaining-requests': '0',
+        'x-ratelimit-reset-requests': '300ms',
+    }))
+
+    async def run_two():
+        return [await _complete(client), await _complete(client)]
+
+    results = asyncio.run(run_two())
+    gaps = _gaps(server.times)
+    ok = all(content for content, _ in results) and len(gaps) == 1 and gaps[0] >= 0.3 - TIMING_SLACK
+    return CheckResult('x-ratelimit 버킷 멈춤', ok, f"요청 {len(server.times)}회, 간격 {gaps[0] if gaps else 0:.2f}초")
+
+
+def check_jittered_retries(server: MockChatServer, client) -> CheckResult:
+    """
+    500, 503 → 백오프 상한(backoff_base * 2^시도) 안에서 재시도해서 성공
+    지터는 백오프 시간을 여러 번 뽑아 [0, 상한] 안에 고르게 퍼지는지 확인
+    """
+    server.script(MockResponse(500), MockResponse(503))
+    retries = client.stats['retries']
+    content, error = asyncio.run(_complete(client))
+    gaps = _gaps(server.times)
+    limits = [client.backoff_base * 2 ** attempt for attempt in range(len(gaps))]
+    samples = [client._backoff(JITTER_ATTEMPT, None) for _ in range(JITTER_SAMPLES)]
+    jitter_limit = client.backoff_base * 2 ** JITTER_ATTEMPT
+    jittered = min(samples) >= 0 and max(samples) <= jitter_limit and max(samples) - min(samples) > jitter_limit / 2
+    ok = (content is not None and len(server.times) == 3 and client.stats['retries'] - retries == 2
+          and all(gap <= limit + TIMING_SLACK for gap, limit in zip(gaps, limits)) and jittered)
+    spans = ', '.join(f"{gap:.3f}/{limit:.2f}" for gap, limit in zip(gaps, limits))
+    return CheckResult('5xx 지터 백오프', ok,
+                       f"요청 {len(server.times)}회, 간격/상한 {spans}, "
+                       f"지터 {min(samples):.3f}~{max(samples):.3f}/{jitter_limit:.2f}, 오류 {error}")
+
+
+def check_retries_exhausted(server: MockChatServer, client) -> CheckResult:
+    """계속 503 → max_retries + 1회 요청 후 ChatError"""
+    server.script(*[MockResponse(503)] * (client.max_retries + 1))
+    content, error = asyncio.run(_complete(client))
+    ok = content is None and error is not None and len(server.times) == client.max_retries + 1
+    return CheckResult('재시도 한도 초과', ok, f"요청 {len(server.times)}회, 오류 {error}")
+
+
+def check_no_retry(server: MockChatServer, client) -> CheckResult:
+    """400 → 재시도 없이 ChatError"""
+    server.script(MockResponse(400))
+    content, error = asyncio.run(_complete(client))
+    ok = content is None and error is not None and len(server.times) == 1
+    return CheckResult('400 재시도 안 함', ok, f"요청 {len(server.times)}회, 오류 {error}")
+
+
+CHECKS: List[Callable[[MockChatServer, Any], CheckResult]] = [
+    check_retry_after,
+    check_ratelimit_headers,
+    check_jittered_retries,
+    check_retries_exhausted,
+    check_no_retry,
+]
+
+
+def run_checks() -> List[CheckResult]:
+    """목 서버 하나에 확인마다 새 ChatClient로 요청"""
+    from .client import ChatClient  # requests는 이 확인을 실행할 때만 필요
+
+    results = []
+    with MockChatServer() as server:
+        for check in CHECKS:
+            client = ChatClient('mock-key', url=server.url, rate=CHECK_RATE,
+                                max_retries=3, backoff_base=CHECK_BACKOFF_BASE)
+            try:
+                results.append(check(server, client))
+            finally:
+                client.close()
+    return results
+
+
+def main():
+    """모든 확인 실행 → 결과 출력 (하나라도 실패하면 종료 코드 1)"""
+    results = run_checks()
+    print("🧪 ChatClient 목 서버 확인")
+    for result in results:
+        print(f"  {'✅' if result.ok else '❌'} {result.name}: {result.detail}")
+    failed = sum(1 for result in results if not result.ok)
+    if failed:
+        print(f"❌ 실패 {failed}/{len(results)}")
+        sys.exit(1)
+    print(f"✅ 모두 통과 ({len(results)}개)")
+
+
+if __name__ == '__main__':
+    main()
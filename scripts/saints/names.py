@@ -0,0 +1,176 @@
+"""
+언어별 정규화 이름 → 성인 id 색인
+ja/en/ko/zh/vi/es/pt 이름 필드를 각 언어의 정규화 함수로 키로 만들어 두고
+같은 성인 찾기, 누락 성인 확인, 같은 성인의 다른 항목에서 번역 가져오기를 해시 조회로 처리
+색인은 데이터 파일 옆(saints_name_index.json)에 저장하고, 데이터 파일 해시가 바뀌면 다시 생성
+(색인 다시 생성: python -m saints)
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .normalize import extract_core_name, normalize_korean_name, normalize_name, normalize_plain_name
+from .store import ID_KEY, SAINTS_PATH, SaintsStore
+
+# 언어 코드 → 이름 필드
+NAME_FIELDS = {
+    'ja': 'name',
+    'en': 'nameEn',
+    'ko': 'nameKo',
+    'zh': 'nameZh',
+    'vi': 'nameVi',
+    'es': 'nameEs',
+    'pt': 'namePt',
+}
+
+# 언어 코드 → 정규화 함수
+NAME_NORMALIZERS: Dict[str, Callable[[Any], str]] = {
+    'ja': extract_core_name,
+    'en': normalize_name,
+    'ko': normalize_korean_name,
+    'zh': normalize_plain_name,
+    'vi': normalize_plain_name,
+    'es': normalize_plain_name,
+    'pt': normalize_plain_name,
+}
+
+NAME_INDEX_VERSION = 1
+
+Saint = Dict[str, Any]
+
+
+def name_index_path(saints_path: Path = SAINTS_PATH) -> Path:
+    """데이터 파일 옆의 색인 파일 (saints_feast_days.json → saints_name_index.json)"""
+    return saints_path.with_name('saints_name_index.json')
+
+
+def normalize_for(lang: str, name: Any) -> str:
+    """언어에 맞는 정규화 키"""
+    return NAME_NORMALIZERS[lang](name)
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+class NameIndex:
+    """
+    언어 → 정규화 이름 → id 목록 (id 오름차순)
+    id가 없는 성인은 색인하지 않으므로 SaintsStore.assign_ids() 뒤에 생성
+    """
+
+    def __init__(self, source: str = ''):
+        self.source = source  # 색인을 만든 데이터 파일의 해시
+        self.names: Dict[str, Dict[str, List[int]]] = {lang: {} for lang in NAME_FIELDS}
+
+    @classmethod
+    def build(cls, saints: Iterable[Saint], source: str = '') -> 'NameIndex':
+        """성인 목록에서 생성"""
+        index = cls(source)
+        for saint in saints:
+            index.add(saint)
+        for names in index.names.values():
+            for ids in names.values():
+                ids.sort()
+        return index
+
+    def __eq__(self, other):
+        return isinstance(other, NameIndex) and self.names == other.names
+
+    # ----- 조회 -----
+
+    def lookup(self, lang: str, name: Any) -> List[int]:
+        """해당 언어 이름이 같은 성인 id"""
+        key = normalize_for(lang, name)
+        if not key:
+            return []
+        return list(self.names[lang].get(key, ()))
+
+    def lookup_any(self, name: Any, languages: Iterable[str] = tuple(NAME_FIELDS)) -> List[int]:
+        """어느 언어로든 이름이 같은 성인 id (처음 찾은 순서)"""
+        found: Dict[int, None] = {}
+        for lang in languages:
+            for saint_id in self.lookup(lang, name):
+                found[saint_id] = None
+        return list(found)
+
+    def aliases(self, saint: Saint) -> List[int]:
+        """
+        일본어 이름과 영어 이름이 모두 같은 다른 성인 id (같은 성인의 다른 날짜 항목 등)
+        두 이름 중 하나라도 없으면 빈 목록
+        """
+        by_ja = self.lookup('ja', saint.get(NAME_FIELDS['ja']))
+        if not by_ja:
+            return []
+        by_en = set(self.lookup('en', saint.get(NAME_FIELDS['en'])))
+        return [saint_id for saint_id in by_ja if saint_id in by_en and saint_id != saint.get(ID_KEY)]
+
+    # ----- 변경 -----
+
+    def add(self, saint: Saint):
+        """성인의 각 언어 이름을 색인 (id가 없으면 무시)"""
+        saint_id = saint.get(ID_KEY)
+        if saint_id is None:
+            return
+        for lang, field in NAME_FIELDS.items():
+            key = normalize_for(lang, saint.get(field))
+            if key:
+                ids = self.names[lang].setdefault(key, [])
+                if saint_id not in ids:
+                    ids.append(saint_id)
+
+    def discard(self, saint: Saint):
+        """성인의 색인 항목 제거"""
+        saint_id = saint.get(ID_KEY)
+        for lang, field in NAME_FIELDS.items():
+            ids = self.names[lang].get(normalize_for(lang, saint.get(field)))
+            if ids and saint_id in ids:
+                ids.remove(saint_id)
+
+    # ----- 저장 -----
+
+    def to_json(self) -> Dict[str, Any]:
+        return {'version': NAME_INDEX_VERSION, 'source': self.source, 'names': self.names}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'NameIndex':
+        if data.get('version') != NAME_INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 이름 색인 버전: {data.get('version')}")
+        index = cls(data.get('source', ''))
+        for lang in NAME_FIELDS:
+            index.names[lang] = data['names'].get(lang, {})
+        return index
+
+    def save(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: Path) -> 'NameIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_json(json.load(f))
+
+    @classmethod
+    def for_store(cls, store: SaintsStore, path: Optional[Path] = None) -> 'NameIndex':
+        """
+        저장된 색인이 현재 데이터 파일로 만든 것이면 그대로 로드, 아니면 다시 생성해 저장
+        저장소에 id 없는 성인이 있으면 id를 부여해 데이터 파일부터 저장
+        """
+        saints_path = store.path or SAINTS_PATH
+        if store.assign_ids():
+            store.save(saints_path)
+        path = path or name_index_path(saints_path)
+        source = file_digest(saints_path)
+        if path.exists():
+            try:
+                index = cls.load(path)
+                if index.source == source:
+                    return index
+            except (ValueError, KeyError, json.JSONDecodeError):
+                pass
+        index = cls.build(store, source)
+        index.save(path)
+        return index
+
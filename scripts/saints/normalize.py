@@ -0,0 +1,70 @@
+"""
+성인 이름 정규화
+중복 판정과 이름 색인이 같은 키를 쓰도록 정규화 함수를 한 곳에 모음
+"""
+
+import re
+from typing import Any, Dict, Iterable
+
+# "Saint", "St.", "St" 접두어
+_SAINT_PREFIX_PATTERN = re.compile(r'\b(saint|st\.?)\s+', flags=re.IGNORECASE)
+# 한국어 이름 앞의 "성", "聖"
+_KOREAN_SAINT_PREFIX_PATTERN = re.compile(r'^[성聖]\s*')
+# 일본어 이름의 괄호 내용과 구분 기호
+_PARENTHESES_PATTERN = re.compile(r'[（(].*?[）)]')
+_SEPARATOR_PATTERN = re.compile(r'[／/・]')
+# 일본어 이름의 호칭 접미사 (비교 시 제거)
+JAPANESE_TITLE_SUFFIXES = ("司教", "司祭", "修道女", "修道者", "おとめ", "殉教者", "教皇", "大司教",
+                           "教会博士", "使徒", "福音記者")
+
+
+def normalize_name(name: Any) -> str:
+    """영어 이름 정규화 ("Saint Monica" → "monica", 공백 제거)"""
+    if not name:
+        return ""
+    name = str(name).strip().lower()
+    name = _SAINT_PREFIX_PATTERN.sub('', name)
+    return name.replace(" ", "").replace("　", "")
+
+
+def normalize_korean_name(name: Any) -> str:
+    """한국어 이름 정규화 ("성 모니카" → "모니카", 공백 제거)"""
+    if not name:
+        return ""
+    name = str(name).strip()
+    name = _KOREAN_SAINT_PREFIX_PATTERN.sub('', name)
+    return name.replace(" ", "").replace("　", "").lower()
+
+
+def extract_core_name(name: Any) -> str:
+    """일본어 이름에서 핵심 부분만 추출 ("聖アグネスおとめ殉教者" → "アグネス")"""
+    if not name:
+        return ""
+    core = _PARENTHESES_PATTERN.sub('', str(name))
+    core = _SEPARATOR_PATTERN.sub('', core)
+    core = core.replace(" ", "").replace("　", "")
+    core = core.replace("聖", "")
+    for suffix in JAPANESE_TITLE_SUFFIXES:
+        core = core.replace(suffix, "")
+    return core.strip()
+
+
+def normalize_plain_name(name: Any) -> str:
+    """그 밖의 언어 이름 정규화 (소문자, 공백 제거)"""
+    if not name:
+        return ""
+    return str(name).strip().lower().replace(" ", "").replace("　", "")
+
+
+def get_saint_key(saint: Dict[str, Any]) -> str:
+    """성인의 고유 키 (정규화된 nameEn 우선, 없으면 nameKo)"""
+    name_en = normalize_name(saint.get('nameEn', ''))
+    if name_en:
+        return name_en
+    return normalize_korean_name(saint.get('nameKo', ''))
+
+
+def count_filled_fields(saint: Dict[str, Any], exclude: Iterable[str] = ('month', 'day')) -> int:
+    """값이 있는 필드 수 (더 완전한 데이터를 고를 때 사용)"""
+    excluded = set(exclude)
+    return sum(1 for key, value in saint.items() if value and key not in excluded)
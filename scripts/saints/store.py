@@ -0,0 +1,312 @@
+"""
+성인 축일 데이터 저장소
+saints_feast_days.json을 한 번만 로드하여 (월, 일) → 날짜 항목으로 색인
+두 가지 형식을 모두 읽음
+- 날짜별 형식: {"days": [{"month", "day", "saints", "japaneseSaints", ...}], "stats": {...}}
+- 평면 형식: {"saints": [...], "japaneseSaints": [...]}
+저장은 항상 날짜별 형식이며, stats는 추가/삭제 때 갱신한 집계로 만들고 저장 전에 목록 길이로 확인
+성인의 id 필드(정수)는 한 번 부여되면 바뀌지 않으며 id → 성인 색인으로 바로 갱신
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# 기본 성인 데이터 파일
+SAINTS_PATH = Path(__file__).parent.parent.parent / 'assets' / 'data' / 'saints' / 'saints_feast_days.json'
+
+# 성인 목록 키 (on()은 이 순서로 합쳐서 반환)
+SAINT_LISTS = ('saints', 'japaneseSaints')
+
+# 날짜별 형식의 날짜 목록 키
+DAYS_KEY = 'days'
+
+# 성인의 고유 ID 필드
+ID_KEY = 'id'
+
+Saint = Dict[str, Any]
+DateKey = Tuple[int, int]
+
+
+def date_key(saint: Saint) -> DateKey:
+    """성인의 (월, 일)"""
+    return (saint.get('month', 0), saint.get('day', 0))
+
+
+def new_day_entry(month: int, day: int) -> Dict[str, Any]:
+    """빈 날짜 항목"""
+    return {
+        'month': month,
+        'day': day,
+        'date': f"{month:02d}-{day:02d}",
+        'feastDayKo': f"{month}월 {day}일",
+        'saints': [],
+        'japaneseSaints': [],
+    }
+
+
+def list_name_for(saint: Saint) -> str:
+    """isJapanese에 따라 들어갈 목록"""
+    return 'japaneseSaints' if saint.get('isJapanese', False) else 'saints'
+
+
+class SaintsStore:
+    """
+    (월, 일)로 색인된 날짜 항목과 id로 색인된 성인
+    날짜 항목의 saints/japaneseSaints 리스트를 직접 보관하므로
+    같은 날짜 안에서는 파일에 있던 순서(추가한 성인은 뒤)를 유지
+    """
+
+    def __init__(self, data: Dict[str, Any], path: Optional[Path] = None):
+        self.data = data
+        self.path = path
+        self._days: Dict[DateKey, Dict[str, Any]] = {}
+        self._by_id: Dict[int, Saint] = {}
+        # stats 집계: saints 목록의 성인 수, saints 목록이 빈 날짜
+        self._saint_count = 0
+        self._empty_days: Set[DateKey] = set()
+        if DAYS_KEY in data:
+            for day_entry in data[DAYS_KEY]:
+                key = (day_entry.get('month', 0), day_entry.get('day', 0))
+                if key in self._days:
+                    # 같은 날짜 항목이 여러 개면 하나로 합침
+                    for list_name in SAINT_LISTS:
+                        self._days[key][list_name].extend(day_entry.get(list_name, []))
+                    continue
+                for list_name in SAINT_LISTS:
+                    day_entry.setdefault(list_name, [])
+                self._days[key] = day_entry
+        else:
+            for list_name in SAINT_LISTS:
+                for saint in data.get(list_name, []):
+                    self._day(date_key(saint))[list_name].append(saint)
+        for saint in self:
+            if saint.get(ID_KEY) is not None:
+                self._by_id[saint[ID_KEY]] = saint
+        self._next_id = max(self._by_id, default=0) + 1
+        self._recount()
+
+    @classmethod
+    def load(cls, path: Path = SAINTS_PATH) -> 'SaintsStore':
+        """파일에서 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), path)
+
+    def _day(self, key: DateKey) -> Dict[str, Any]:
+        day_entry = self._days.get(key)
+        if day_entry is None:
+            day_entry = self._days[key] = new_day_entry(*key)
+            self._empty_days.add(key)
+        return day_entry
+
+    def _recount(self):
+        """stats 집계를 날짜 항목에서 다시 계산"""
+        self._saint_count = sum(len(day_entry['saints']) for day_entry in self._days.values())
+        self._empty_days = {key for key, day_entry in self._days.items() if not day_entry['saints']}
+
+    def _counted(self, key: DateKey, list_name: str, delta: int):
+        """날짜 key의 list_name 목록 길이가 delta만큼 바뀐 뒤 집계 갱신"""
+        if list_name != 'saints':
+            return
+        self._saint_count += delta
+        if self._days[key]['saints']:
+            self._empty_days.discard(key)
+        else:
+            self._empty_days.add(key)
+
+    # ----- 조회 -----
+
+    def on(self, month: int, day: int) -> List[Saint]:
+        """날짜의 성인 (saints 다음 japaneseSaints)"""
+        day_entry = self._days.get((month, day))
+        if day_entry is None:
+            return []
+        return [saint for list_name in SAINT_LISTS for saint in day_entry[list_name]]
+
+    def saints_on(self, month: int, day: int, list_name: str = 'saints') -> List[Saint]:
+        """날짜의 성인 (목록 하나)"""
+        day_entry = self._days.get((month, day))
+        return list(day_entry[list_name]) if day_entry is not None else []
+
+    def day_entry(self, month: int, day: int) -> Optional[Dict[str, Any]]:
+        """날짜 항목 (없으면 None)"""
+        return self._days.get((month, day))
+
+    def get(self, saint_id: int) -> Optional[Saint]:
+        """id로 성인 조회"""
+        return self._by_id.get(saint_id)
+
+    def dates(self) -> List[DateKey]:
+        """성인이 있는 날짜 (정렬)"""
+        return sorted(key for key, day_entry in self._days.items()
+                      if any(day_entry[list_name] for list_name in SAINT_LISTS))
+
+    def iter_list(self, list_name: str = 'saints') -> Iterator[Saint]:
+        """목록 하나의 성인 (날짜순)"""
+        for key in sorted(self._days):
+            yield from self._days[key][list_name]
+
+    def __iter__(self) -> Iterator[Saint]:
+        """전체 성인 (목록별 날짜순)"""
+        for list_name in SAINT_LISTS:
+            yield from self.iter_list(list_name)
+
+    def __len__(self):
+        return sum(len(day_entry[list_name]) for day_entry in self._days.values() for list_name in SAINT_LISTS)
+
+    # ----- 변경 -----
+
+    def assign_ids(self) -> int:
+        """id가 없는 성인에게 새 id 부여 (날짜순), 부여한 개수 반환"""
+        assigned = 0
+        for saint in self:
+            if saint.get(ID_KEY) is None:
+                self._assign_id(saint)
+                assigned += 1
+        return assigned
+
+    def _assign_id(self, saint: Saint):
+        saint[ID_KEY] = self._next_id
+        self._by_id[self._next_id] = saint
+        self._next_id += 1
+
+    def add(self, saint: Saint, list_name: Optional[str] = None):
+        """
+        성인 추가 (같은 날짜의 맨 뒤, list_name이 없으면 isJapanese로 결정)
+        이미 id를 쓰는 저장소면 id가 없는 성인에게 새 id 부여
+        """
+        key = date_key(saint)
+        list_name = list_name or list_name_for(saint)
+        self._day(key)[list_name].append(saint)
+        self._counted(key, list_name, 1)
+        if saint.get(ID_KEY) is not None:
+            self._by_id[saint[ID_KEY]] = saint
+            self._next_id = max(self._next_id, saint[ID_KEY] + 1)
+        elif self._by_id:
+            self._assign_id(saint)
+
+    def update(self, saint_id: int, fields: Dict[str, Any]) -> bool:
+        """id의 성인에 필드 병합, 값이 바뀌었으면 True"""
+        saint = self._by_id.get(saint_id)
+        if saint is None:
+            return False
+        changed = False
+        for key, value in fields.items():
+            if saint.get(key) != value:
+                saint[key] = value
+                changed = True
+        return changed
+
+    def _locate(self, saint: Saint) -> Optional[Tuple[str, List[Saint], int]]:
+        """saint(동일 객체)가 들어 있는 목록 이름, 리스트, 위치"""
+        day_entry = self._days.get(date_key(saint))
+        if day_entry is None:
+            return None
+        for list_name in SAINT_LISTS:
+            saints = day_entry[list_name]
+            for i, existing in enumerate(saints):
+                if existing is saint:
+                    return list_name, saints, i
+        return None
+
+    def remove(self, saint: Saint) -> bool:
+        """성인 제거 (동일 객체 기준), 제거했으면 True"""
+        found = self._locate(saint)
+        if found is None:
+            return False
+        list_name, saints, i = found
+        del saints[i]
+        self._counted(date_key(saint), list_name, -1)
+        if self._by_id.get(saint.get(ID_KEY)) is saint:
+            del self._by_id[saint[ID_KEY]]
+        return True
+
+    def replace(self, saint: Saint, updated: Saint) -> bool:
+        """성인을 같은 자리에서 updated로 교체 (동일 객체 기준, 날짜가 같아야 함, id는 유지)"""
+        found = self._locate(saint)
+        if found is None:
+            return False
+        _, saints, i = found
+        saints[i] = updated
+        saint_id = saint.get(ID_KEY)
+        if saint_id is not None:
+            updated[ID_KEY] = saint_id
+            self._by_id[saint_id] = updated
+        return True
+
+    def set_saints(self, month: int, day: int, saints: List[Saint], list_name: str = 'saints'):
+        """날짜의 목록 하나를 saints로 교체 (중복 제거 결과 반영 등, 빠진 성인은 id 색인에서도 제거)"""
+        key = (month, day)
+        day_entry = self._day(key)
+        kept = {id(saint) for saint in saints}
+        for saint in day_entry[list_name]:
+            if id(saint) not in kept and self._by_id.get(saint.get(ID_KEY)) is saint:
+                del self._by_id[saint[ID_KEY]]
+        delta = len(saints) - len(day_entry[list_name])
+        day_entry[list_name] = list(saints)
+        for saint in saints:
+            if saint.get(ID_KEY) is not None:
+                self._by_id[saint[ID_KEY]] = saint
+        self._counted(key, list_name, delta)
+
+    # ----- 저장 -----
+
+    def stats(self) -> Dict[str, Any]:
+        """stats 블록 (추가/삭제 때 갱신한 집계로 계산)"""
+        stats = dict(self.data.get('stats') or {})
+        stats['totalDays'] = len(self._days)
+        stats['totalSaintEntries'] = self._saint_count
+        stats['missingDaysInOriginalSaints'] = [
+            self._days[key].get('date') or f"{key[0]:02d}-{key[1]:02d}"
+            for key in sorted(self._empty_days)
+        ]
+        return stats
+
+    def verify_stats(self) -> bool:
+        """
+        집계가 날짜 항목의 목록 길이와 맞는지 확인 (날짜 수에 비례, 성인은 훑지 않음)
+        목록을 저장소 밖에서 직접 바꿔 어긋났으면 다시 계산하고 False
+        """
+        count = 0
+        for key, day_entry in self._days.items():
+            saints = day_entry['saints']
+            count += len(saints)
+            if (not saints) != (key in self._empty_days):
+                break
+        else:
+            if count == self._saint_count:
+                return True
+        self._recount()
+        return False
+
+    def to_json(self) -> Dict[str, Any]:
+        """날짜별 형식 문서 (평면 형식의 saints/japaneseSaints 키는 days로 대체)"""
+        document: Dict[str, Any] = {}
+        for key, value in self.data.items():
+            if key not in SAINT_LISTS:
+                document[key] = value
+        document[DAYS_KEY] = [self._days[key] for key in sorted(self._days)]
+        self.verify_stats()
+        document['stats'] = self.stats()
+        self.data = document
+        return document
+
+    def save(self, path: Optional[Path] = None, backup_suffix: Optional[str] = None) -> bool:
+        """
+        직렬화 결과가 파일 내용과 다를 때만 저장
+        backup_suffix가 있으면 백업이 없을 때 한 번만 원본을 백업
+        Returns: 실제로 썼는지 여부
+        """
+        path = path or self.path or SAINTS_PATH
+        serialized = json.dumps(self.to_json(), ensure_ascii=False, indent=2).encode('utf-8')
+        raw = path.read_bytes() if path.exists() else None
+        if serialized == raw:
+            return False
+
+        if backup_suffix and raw is not None:
+            backup_path = path.with_suffix(backup_suffix)
+            if not backup_path.exists():
+                backup_path.write_bytes(raw)
+
+        path.write_bytes(serialized)
+        return True
@@ -0,0 +1,294 @@
+"""
+성인 축일 데이터 일괄 검증
+파일을 한 번 읽고 날짜 항목을 한 번 순회하면서 모든 규칙을 함께 검사하여
+기계가 읽을 수 있는 JSON 보고서를 만듦
+- invalid-date: 달력에 없는 날짜, 날짜 항목과 다른 성인 날짜, date/feastDayKo 형식
+- duplicate-date: 같은 날짜 항목이 여러 개
+- missing-date: 성인이 한 명도 없거나 항목이 없는 날짜 (2월 29일 포함 366일 기준)
+- missing-name / missing-translation: 일본어 이름 없음 / 번역 필드 누락
+- invalid-type: type 값, isJapanese와 목록(saints/japaneseSaints) 불일치
+- missing-id / duplicate-id: id 없음 / 여러 성인이 같은 id
+- exact-duplicate / fuzzy-duplicate: 같은 날짜의 같은 성인 / 비슷한 이름
+- stale-stats: 저장된 stats가 실제 집계와 다름
+
+python -m saints.validate [데이터 파일 경로] [--report 보고서 경로] [--strict]
+종료 코드: 오류가 있으면 1 (--strict이면 경고도 1)
+"""
+
+import json
+import sys
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .matcher import MATCH_THRESHOLD, name_score
+from .names import NAME_FIELDS, normalize_for
+from .store import DAYS_KEY, ID_KEY, SAINT_LISTS, SAINTS_PATH, date_key, new_day_entry
+
+# 허용되는 type 값
+VALID_TYPES = ('solemnity', 'feast', 'memorial')
+
+# 번역 필드 (일본어 name 제외)
+TRANSLATION_FIELDS = tuple(field for lang, field in NAME_FIELDS.items() if lang != 'ja')
+
+ERROR = 'error'
+WARNING = 'warning'
+
+REPORT_VERSION = 1
+
+# 날짜 검사용 윤년
+_LEAP_YEAR = 2000
+
+
+class Issue(NamedTuple):
+    """검증 결과 하나"""
+    rule: str
+    severity: str
+    date: str                  # MM-DD (날짜를 알 수 없으면 '')
+    saint_id: Optional[int]
+    name: str
+    message: str
+
+    def to_json(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def _is_valid_date(month: Any, day: Any) -> bool:
+    try:
+        date(_LEAP_YEAR, month, day)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _date_text(month: Any, day: Any) -> str:
+    if isinstance(month, int) and isinstance(day, int):
+        return f"{month:02d}-{day:02d}"
+    return f"{month}-{day}"
+
+
+def _exact_key(saint: Dict[str, Any]) -> str:
+    """remove_exact_duplicates와 같은 "nameEn|||nameKo" 키 (둘 다 있을 때만)"""
+    name_en = str(saint.get('nameEn') or '').strip()
+    name_ko = str(saint.get('nameKo') or '').strip()
+    return f"{name_en}|||{name_ko}" if name_en and name_ko else ''
+
+
+def _iter_day_entries(document: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """날짜 항목 (평면 형식이면 날짜별로 묶어서)"""
+    if DAYS_KEY in document:
+        yield from document[DAYS_KEY]
+        return
+    grouped: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    for list_name in SAINT_LISTS:
+        for saint in document.get(list_name, []):
+            key = date_key(saint)
+            if key not in grouped:
+                grouped[key] = new_day_entry(*key) if _is_valid_date(*key) else \
+                    {'month': key[0], 'day': key[1], 'saints': [], 'japaneseSaints': []}
+            grouped[key][list_name].append(saint)
+    for key in sorted(grouped, key=lambda k: tuple(v if isinstance(v, int) else -1 for v in k)):
+        yield grouped[key]
+
+
+class SaintsValidator:
+    """규칙 전체를 한 번의 순회로 검사"""
+
+    def __init__(self, fuzzy_threshold: float = MATCH_THRESHOLD):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.issues: List[Issue] = []
+        self.coverage: Counter = Counter()  # 필드 → 값이 있는 성인 수
+        self.saint_count = 0
+        self.day_count = 0
+
+    def _report(self, rule: str, severity: str, day: str, message: str,
+                saint: Optional[Dict[str, Any]] = None):
+        saint = saint or {}
+        self.issues.append(Issue(rule, severity, day, saint.get(ID_KEY), str(saint.get('name') or ''), message))
+
+    def validate(self, document: Dict[str, Any]) -> List[Issue]:
+        """문서 전체 검사"""
+        seen_days: Dict[Tuple[Any, Any], int] = {}
+        ids: Dict[int, Dict[str, Any]] = {}
+        saints_per_day = 0
+        empty_days: List[str] = []
+
+        for day_entry in _iter_day_entries(document):
+            self.day_count += 1
+            month, day = day_entry.get('month'), day_entry.get('day')
+            day_text = _date_text(month, day)
+            key = (month, day)
+            seen_days[key] = seen_days.get(key, 0) + 1
+
+            if not _is_valid_date(month, day):
+                self._report('invalid-date', ERROR, day_text, "달력에 없는 날짜 항목")
+            elif DAYS_KEY in document:
+                expected = new_day_entry(month, day)
+                for field in ('date', 'feastDayKo'):
+                    if day_entry.get(field) != expected[field]:
+                        self._report('invalid-date', WARNING, day_text,
+                                     f"{field}가 '{expected[field]}'가 아님: {day_entry.get(field)!r}")
+            if seen_days[key] == 2:
+                self._report('duplicate-date', ERROR, day_text, "같은 날짜 항목이 여러 개")
+
+            saints_per_day += len(day_entry.get('saints', []))
+            if not day_entry.get('saints'):
+                empty_days.append(day_text)
+            if not any(day_entry.get(list_name) for list_name in SAINT_LISTS):
+                self._report('missing-date', WARNING, day_text, "성인이 없는 날짜 항목")
+
+            day_saints = []
+            for list_name in SAINT_LISTS:
+                for saint in day_entry.get(list_name, []):
+                    self._check_saint(saint, list_name, month, day, day_text, ids)
+                    day_saints.append(saint)
+            self._check_duplicates(day_saints, day_text)
+
+        self._check_missing_dates(seen_days)
+        self._check_stats(document, saints_per_day, empty_days)
+        return self.issues
+
+    # ----- 성인 단위 규칙 -----
+
+    def _check_saint(self, saint: Dict[str, Any], list_name: str, month: Any, day: Any,
+                     day_text: str, ids: Dict[int, Dict[str, Any]]):
+        self.saint_count += 1
+
+        if (saint.get('month'), saint.get('day')) != (month, day):
+            self._report('invalid-date', ERROR, day_text,
+                         f"성인 날짜 {_date_text(saint.get('month'), saint.get('day'))}가 날짜 항목과 다름", saint)
+
+        for field in NAME_FIELDS.values():
+            if str(saint.get(field) or '').strip():
+                self.coverage[field] += 1
+        if not str(saint.get('name') or '').strip():
+            self._report('missing-name', ERROR, day_text, "일본어 이름(name) 없음", saint)
+        missing = [field for field in TRANSLATION_FIELDS if not str(saint.get(field) or '').strip()]
+        if missing:
+            self._report('missing-translation', WARNING, day_text, f"번역 누락: {', '.join(missing)}", saint)
+
+        if saint.get('type') not in VALID_TYPES:
+            self._report('invalid-type', ERROR, day_text, f"type 값이 올바르지 않음: {saint.get('type')!r}", saint)
+        if 'isJapanese' not in saint:
+            self._report('invalid-type', WARNING, day_text, "isJapanese 없음", saint)
+        elif bool(saint['isJapanese']) != (list_name == 'japaneseSaints'):
+            self._report('invalid-type', ERROR, day_text,
+                         f"isJapanese={saint['isJapanese']}인데 {list_name} 목록에 있음", saint)
+
+        saint_id = saint.get(ID_KEY)
+        if saint_id is None:
+            self._report('missing-id', WARNING, day_text, "id 없음", saint)
+        elif saint_id in ids:
+            other = ids[saint_id]
+            self._report('duplicate-id', ERROR, day_text,
+                         f"id {saint_id}가 {_date_text(other.get('month'), other.get('day'))} "
+                         f"{other.get('name', '')}와 같음", saint)
+        else:
+            ids[saint_id] = saint
+
+    # ----- 날짜 단위 규칙 -----
+
+    def _check_duplicates(self, saints: List[Dict[str, Any]], day_text: str):
+        """같은 날짜 안의 중복 (하루 성인 수는 적으므로 쌍별 비교)"""
+        cores = [normalize_for('ja', saint.get('name')) for saint in saints]
+        exact: Dict[str, Dict[str, Any]] = {}
+        for i, saint in enumerate(saints):
+            key = _exact_key(saint)
+            if key and key in exact:
+                self._report('exact-duplicate', ERROR, day_text,
+                             f"nameEn/nameKo가 같은 성인이 있음: {exact[key].get('name', '')}", saint)
+                continue
+            if key:
+                exact[key] = saint
+            for j in range(i):
+                other = saints[j]
+                if saint.get('name') and saint.get('name') == other.get('name'):
+                    self._report('exact-duplicate', ERROR, day_text, "같은 이름(name)의 성인이 있음", saint)
+                    break
+                score = name_score(cores[i], cores[j])
+                if score >= self.fuzzy_threshold:
+                    self._report('fuzzy-duplicate', WARNING, day_text,
+                                 f"이름이 비슷한 성인이 있음: {other.get('name', '')} (점수 {score:.2f})", saint)
+                    break
+
+    def _check_missing_dates(self, seen_days: Dict[Tuple[Any, Any], int]):
+        """성인이 없는 날짜 (366일 기준)"""
+        ordinal = date(_LEAP_YEAR, 1, 1).toordinal()
+        while True:
+            day = date.fromordinal(ordinal)
+            if day.year != _LEAP_YEAR:
+                break
+            if (day.month, day.day) not in seen_days:
+                self._report('missing-date', WARNING, _date_text(day.month, day.day), "날짜 항목 없음")
+            ordinal += 1
+
+    def _check_stats(self, document: Dict[str, Any], saints_per_day: int, empty_days: List[str]):
+        stats = document.get('stats')
+        if stats is None:
+            return
+        expected = {
+            'totalDays': self.day_count,
+            'totalSaintEntries': saints_per_day,
+            'missingDaysInOriginalSaints': empty_days,
+        }
+        for key, value in expected.items():
+            if key in stats and stats[key] != value:
+                self._report('stale-stats', WARNING, '', f"stats.{key}가 {value!r}가 아님: {stats[key]!r}")
+
+    # ----- 보고서 -----
+
+    def report(self, source: str = '') -> Dict[str, Any]:
+        """JSON 보고서"""
+        by_rule = Counter(issue.rule for issue in self.issues)
+        by_severity = Counter(issue.severity for issue in self.issues)
+        return {
+            'version': REPORT_VERSION,
+            'source': source,
+            'saints': self.saint_count,
+            'days': self.day_count,
+            'errors': by_severity.get(ERROR, 0),
+            'warnings': by_severity.get(WARNING, 0),
+            'rules': dict(sorted(by_rule.items())),
+            'coverage': {field: self.coverage.get(field, 0) for field in NAME_FIELDS.values()},
+            'issues': [issue.to_json() for issue in self.issues],
+        }
+
+
+def validate_file(path: Path = SAINTS_PATH) -> Dict[str, Any]:
+    """파일을 검증하고 보고서 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    validator = SaintsValidator()
+    validator.validate(document)
+    return validator.report(str(path))
+
+
+def main():
+    """검증 → 요약 출력 → (선택) 보고서 저장"""
+    args = [arg for i, arg in enumerate(sys.argv[1:], 1)
+            if not arg.startswith('--') and sys.argv[i - 1] != '--report']
+    report_path = None
+    if '--report' in sys.argv:
+        index = sys.argv.index('--report')
+        if index + 1 < len(sys.argv):
+            report_path = Path(sys.argv[index + 1])
+    strict = '--strict' in sys.argv
+    saints_path = Path(args[0]) if args else SAINTS_PATH
+
+    report = validate_file(saints_path)
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"📋 {saints_path}: 성인 {report['saints']}명, 날짜 {report['days']}개")
+    for rule, count in report['rules'].items():
+        print(f"  {rule}: {count}")
+    print(f"{'❌' if report['errors'] else '✅'} 오류 {report['errors']}개, 경고 {report['warnings']}개")
+
+    if report['errors'] or (strict and report['warnings']):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,96 +6,15 @@ https://ostk.catholic.jp/parish_mass/
 """
 
 import json
-import re
 import os
 
+from massparse import parse
+
+
 def parse_mass_time(mass_time_str):
     """massTime 문자열을 파싱하여 massTimes와 foreignMassTimes 생성"""
-    mass_times = {}
-    foreign_mass_times = {}
-    
-    # 토요일 미사
-    sat_match = re.search(r'土曜日?\s*(\d{1,2}):(\d{2})', mass_time_str)
-    if sat_match:
-        time_str = f"{sat_match.group(1)}:{sat_match.group(2)}"
-        mass_times.setdefault("saturday", []).append(time_str)
-    
-    # 일요일 미사
-    sun_matches = re.findall(r'日曜日?\s*(\d{1,2}):(\d{2})', mass_time_str)
-    for match in sun_matches:
-        time_str = f"{match[0]}:{match[1]}"
-        # 외국어 미사인지 확인
-        if not re.search(rf'{time_str}\s*\([^)]+\)', mass_time_str):
-            mass_times.setdefault("sunday", []).append(time_str)
-    
-    # 외국어 미사 파싱
-    foreign_patterns = [
-        (r'(\d{1,2}):(\d{2})\s*\(([^)]+)\)', 'sunday'),
-        (r'第(\d+)[,・]?第?(\d*)[日主]曜日?\s*(\d{1,2}):(\d{2})\s*\(([^)]+)\)', 'sunday'),
-        (r'第(\d+)[,・]?第?(\d*)[土曜]\s*(\d{1,2}):(\d{2})\s*\(([^)]+)\)', 'saturday'),
-    ]
-    
-    lang_map = {
-        '英語': 'EN', '英語ミサ': 'EN', 'E': 'EN',
-        'タガログ語': 'PH', 'T': 'PH',
-        'ポルトガル語': 'PT', 'P': 'PT',
-        'ベトナム語': 'VI', 'V': 'VI',
-        'スペイン語': 'ES', 'S': 'ES',
-        '中国語': 'CN',
-        '韓国語': 'KR',
-        'インドネシア語': 'ID',
-        'ポーランド語': 'PL',
-    }
-    
-    # 외국어 미사 시간 추출
-    for pattern, day in foreign_patterns:
-        matches = re.finditer(pattern, mass_time_str)
-        for match in matches:
-            if len(match.groups()) == 3:  # 단순 패턴
-                hour, minute, lang_desc = match.groups()
-                time_str = f"{hour}:{minute}"
-                lang_code = None
-                for key, code in lang_map.items():
-                    if key in lang_desc:
-                        lang_code = code
-                        break
-                if lang_code:
-                    foreign_mass_times.setdefault(day, []).append({
-                        "time": time_str,
-                        "language": lang_code,
-                        "note": ""
-                    })
-            elif len(match.groups()) >= 5:  # 第X日曜 패턴
-                week_num = match.group(1)
-                week_num2 = match.group(2) if match.group(2) else None
-                hour = match.group(3) if len(match.groups()) >= 4 else match.group(2)
-                minute = match.group(4) if len(match.groups()) >= 4 else match.group(3)
-                lang_desc = match.group(5) if len(match.groups()) >= 5 else match.group(4)
-                time_str = f"{hour}:{minute}"
-                lang_code = None
-                for key, code in lang_map.items():
-                    if key in lang_desc:
-                        lang_code = code
-                        break
-                if lang_code:
-                    note = f"第{week_num}日曜"
-                    if week_num2:
-                        note = f"第{week_num}・第{week_num2}日曜"
-                    foreign_mass_times.setdefault(day, []).append({
-                        "time": time_str,
-                        "language": lang_code,
-                        "note": note
-                    })
-    
-    # 평일 미사
-    weekday_map = {'月': 'monday', '火': 'tuesday', '水': 'wednesday', '木': 'thursday', '金': 'friday'}
-    for day_jp, day_en in weekday_map.items():
-        matches = re.findall(rf'{day_jp}曜日?\s*(\d{{1,2}}):(\d{{2}})', mass_time_str)
-        for match in matches:
-            time_str = f"{match[0]}:{match[1]}"
-            mass_times.setdefault(day_en, []).append(time_str)
-    
-    return mass_times, foreign_mass_times
+    parsed = parse(mass_time_str)
+    return parsed['massTimes'], parsed['foreignMassTimes']
 
 # 웹사이트 데이터를 기반으로 교회 정보 생성
 # 실제로는 웹 스크래핑을 하거나 수동으로 입력해야 하지만,
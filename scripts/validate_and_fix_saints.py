@@ -7,32 +7,14 @@
 """
 
 import json
-import os
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Set, Optional
 import requests
 import time
-from collections import defaultdict
 
-# .env 파일에서 API 키 읽기
-def load_env_file():
-    """.env 파일에서 OPENAI_API_KEY를 읽습니다."""
-    env_path = Path(__file__).parent.parent / '.env'
-    if not env_path.exists():
-        print(f".env 파일을 찾을 수 없습니다: {env_path}")
-        return None
-    
-    api_key = None
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip().strip('"').strip("'")
-                break
-    
-    return api_key
+from saints import SaintsStore, load_env_file
 
 def normalize_name(name: str) -> str:
     """성인 이름을 정규화합니다 (비교용)."""
@@ -105,15 +87,9 @@ def ask_chatgpt_for_saints(api_key: str, month: int, day: int) -> List[Dict[str,
         return []
 
 def get_saints_by_date(data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
-    """날짜별로 성인을 그룹화합니다."""
-    all_saints = data.get('saints', []) + data.get('japaneseSaints', [])
-    saints_by_date = defaultdict(list)
-    
-    for saint in all_saints:
-        key = f"{saint.get('month')}-{saint.get('day')}"
-        saints_by_date[key].append(saint)
-    
-    return saints_by_date
+    """날짜별로 성인을 그룹화합니다 ("월-일" → 성인 목록, 두 파일 형식 모두 지원)."""
+    store = SaintsStore(data)
+    return {f"{month}-{day}": store.on(month, day) for month, day in store.dates()}
 
 def compare_saints(existing: List[Dict[str, Any]], chatgpt: List[Dict[str, Any]]) -> Dict[str, Any]:
     """기존 성인과 ChatGPT 결과를 비교합니다."""
@@ -185,19 +161,16 @@ def main():
         print("   .env 파일에 OPENAI_API_KEY=your_key 형식으로 설정해주세요.")
         sys.exit(1)
     
-    # JSON 파일 읽기
+    # JSON 파일 읽기 (날짜별 색인)
     print(f"📖 JSON 파일 읽기: {json_path}")
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = SaintsStore.load(json_path)
     
     # 백업 생성
     print(f"💾 백업 생성: {backup_path}")
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    backup_path.write_bytes(json_path.read_bytes())
     
-    # 날짜별로 그룹화
-    saints_by_date = get_saints_by_date(data)
-    total_dates = len(saints_by_date)
+    dates = store.dates()
+    total_dates = len(dates)
     
     print(f"\n📅 총 {total_dates}개의 날짜를 검증합니다...")
     print("   (각 날짜마다 ChatGPT API를 호출하므로 시간이 걸릴 수 있습니다)\n")
@@ -211,9 +184,8 @@ def main():
     }
     
     # 각 날짜별로 검증
-    for date_key in sorted(saints_by_date.keys()):
-        month, day = map(int, date_key.split('-'))
-        existing_saints = saints_by_date[date_key]
+    for month, day in dates:
+        existing_saints = store.on(month, day)
         
         print(f"🔍 {month}월 {day}일 검증 중... (기존: {len(existing_saints)}명)", end=' ', flush=True)
         
@@ -238,6 +210,7 @@ def main():
             for saint in comparison['to_add']:
                 if saint not in existing_saints:
                     existing_saints.append(saint)
+                    store.add(saint)
         
         if comparison['to_update']:
             changes.append(f"~{len(comparison['to_update'])}명 수정")
@@ -247,6 +220,7 @@ def main():
                 for i, existing in enumerate(existing_saints):
                     if normalize_name(existing.get('name', '')) == normalize_name(updated_saint.get('name', '')):
                         existing_saints[i] = updated_saint
+                        store.replace(existing, updated_saint)
                         break
         
         if changes:
@@ -265,28 +239,8 @@ def main():
     # 업데이트된 데이터 저장
     print(f"\n💾 업데이트된 데이터 저장 중...")
     
-    # saints와 japaneseSaints 분리
-    all_saints = []
-    japanese_saints = []
-    
-    for date_key, saints in saints_by_date.items():
-        for saint in saints:
-            if saint.get('isJapanese', False):
-                japanese_saints.append(saint)
-            else:
-                all_saints.append(saint)
-    
-    # 정렬 (월, 일 순)
-    all_saints.sort(key=lambda x: (x.get('month', 0), x.get('day', 0)))
-    japanese_saints.sort(key=lambda x: (x.get('month', 0), x.get('day', 0)))
-    
-    output_data = {
-        'saints': all_saints,
-        'japaneseSaints': japanese_saints
-    }
-    
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    # 날짜별 형식으로 저장 (stats 갱신)
+    store.save(json_path)
     
     print(f"\n✅ 완료!")
     print(f"   검증된 날짜: {stats['checked']}/{total_dates}")